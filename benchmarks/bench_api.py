@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Load test for the students API.
+
+Fires a fixed number of authenticated GET requests at a running app at
+increasing concurrency levels and reports throughput and latency
+percentiles per level. A single worker serving the API from blocking
+database calls stays flat as concurrency grows; with async sessions
+throughput should keep rising until the database or pool saturates. Run it
+against both builds and pass the earlier results file with --compare to
+see the gain. Responses outside 2xx are counted per level and fail the
+run, since timing rejected requests says nothing about the API.
+
+Usage:
+    uvicorn api.main:app --app-dir src/bossnet --workers 1 &
+    python benchmarks/bench_api.py --token "$TOKEN" --output bench-api.json
+    python benchmarks/bench_api.py --token "$TOKEN" --compare bench-api-sync.json
+    python benchmarks/bench_api.py --path "/api/v1/api/students/search?q=rah" --concurrency 1,16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# api.main mounts the students router (prefix /api/students) under settings.API_V1_STR
+DEFAULT_PATHS = ["/api/v1/api/students/?limit=50", "/api/v1/api/students/?pagination=cursor&limit=50"]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=os.path.dirname(__file__)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+async def run_level(client: httpx.AsyncClient, path: str, concurrency: int, requests: int) -> Dict[str, Any]:
+    """Issue ``requests`` GETs of ``path`` from ``concurrency`` workers
+
+    ``errors`` counts requests that got no response; ``non_2xx`` counts
+    responses by status code.
+    """
+    latencies: List[float] = []
+    errors = 0
+    non_2xx: Dict[str, int] = {}
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+            except httpx.HTTPError:
+                errors += 1
+            else:
+                if not response.is_success:
+                    non_2xx[str(response.status_code)] = non_2xx.get(str(response.status_code), 0) + 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+
+    return {
+        "path": path,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "non_2xx": non_2xx,
+        "seconds": seconds,
+        "requests_per_second": requests / seconds if seconds > 0 else 0.0,
+        "latency_ms": {
+            "mean": statistics.mean(latencies) * 1000 if latencies else 0.0,
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p95": percentile(latencies, 0.95) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+        },
+    }
+
+
+async def run_benchmarks(args) -> Dict[str, Any]:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    levels = [int(level) for level in args.concurrency.split(",")]
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    results = {}
+
+    async with httpx.AsyncClient(base_url=args.url, headers=headers, limits=limits, timeout=args.timeout) as client:
+        for path in args.path or DEFAULT_PATHS:
+            # Warm up connections, caches and the name index before timing
+            await run_level(client, path, min(levels), args.warmup)
+            for concurrency in levels:
+                result = await run_level(client, path, concurrency, args.requests)
+                results[f"{path} @ {concurrency}"] = result
+                print(
+                    f"{path:>50} c={concurrency:<4} {result['requests_per_second']:>10,.1f} req/s  "
+                    f"p50 {result['latency_ms']['p50']:>8.1f} ms  p95 {result['latency_ms']['p95']:>8.1f} ms  "
+                    f"errors {result['errors']}  non-2xx {sum(result['non_2xx'].values())}"
+                )
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "url": args.url,
+        "levels": results,
+    }
+
+
+def failed_levels(results: Dict[str, Any]) -> List[str]:
+    """Levels with transport errors or non-2xx responses"""
+    return [level for level, result in results["levels"].items() if result["errors"] or result["non_2xx"]]
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print throughput changes against ``baseline``; returns the number of regressions"""
+    regressions = 0
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} (regression threshold {threshold:.0%})")
+    print(f"{'level':>58} {'baseline req/s':>15} {'current req/s':>15} {'change':>8}")
+
+    for level, result in current["levels"].items():
+        previous = baseline.get("levels", {}).get(level)
+        if not previous or not previous.get("requests_per_second"):
+            continue
+
+        change = result["requests_per_second"] / previous["requests_per_second"] - 1
+        regressed = change < -threshold
+        regressions += regressed
+        print(
+            f"{level:>58} {previous['requests_per_second']:>15,.1f} {result['requests_per_second']:>15,.1f} "
+            f"{change:>+7.1%}{'  REGRESSION' if regressed else ''}"
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Students API load test")
+    parser.add_argument("--url", default="http://localhost:8000", help="Base URL of the running app")
+    parser.add_argument("--token", default=os.getenv("BENCH_API_TOKEN"), help="Bearer token (default: $BENCH_API_TOKEN)")
+    parser.add_argument("--path", action="append", help="Path to request; repeatable (default: offset and cursor listing)")
+    parser.add_argument("--concurrency", default="1,8,32,64", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per path and concurrency level")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per path before measuring")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--output", default="bench_api_results.json", help="Where to write the JSON results")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Throughput drop that counts as a regression")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmarks(args))
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    failed = failed_levels(results)
+    for level in failed:
+        result = results["levels"][level]
+        print(f"FAILED {level}: {result['errors']} errors, non-2xx by status {result['non_2xx']}")
+    if failed:
+        sys.exit(1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel multi-file CSV ingestion in DataProcessor.load_student_data.
+
+Writes a directory of per-upazila CSV files and reports files/second for an
+increasing number of worker processes, up to the machine's core count.
+
+Usage:
+    python benchmarks/bench_csv_ingest.py --files 200 --rows 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.data_processing.data_processor import CSV_ENGINE, DataProcessor  # noqa: E402
+
+
+def write_source_files(source_dir: Path, num_files: int, rows_per_file: int) -> None:
+    """Write ``num_files`` CSV files of synthetic student rows."""
+    rng = np.random.default_rng(42)
+    divisions = np.array(["Dhaka", "Chittagong", "Rajshahi", "Khulna", "Barisal", "Sylhet", "Rangpur", "Mymensingh"])
+
+    for i in range(num_files):
+        ids = np.arange(i * rows_per_file, (i + 1) * rows_per_file)
+        df = pd.DataFrame(
+            {
+                "student_id": [f"STU{n:09d}" for n in ids],
+                "division": divisions[rng.integers(0, len(divisions), rows_per_file)],
+                "gpa": rng.uniform(1.0, 5.0, rows_per_file).round(2),
+                "days_present": rng.integers(100, 220, rows_per_file),
+                "total_school_days": 220,
+            }
+        )
+        df.to_csv(source_dir / f"upazila_{i:04d}.csv", index=False)
+
+
+def worker_counts(max_workers: int):
+    """1, 2, 4, ... up to and including ``max_workers``."""
+    count = 1
+    while count < max_workers:
+        yield count
+        count *= 2
+    yield max_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel CSV ingestion benchmark")
+    parser.add_argument("--files", type=int, default=100, help="Number of CSV files")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows per CSV file")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="Largest worker count to try")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per worker count (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_data_path = Path(tmp)
+        (raw_data_path / "bench").mkdir()
+        write_source_files(raw_data_path / "bench", args.files, args.rows)
+
+        processor = DataProcessor()
+        processor.raw_data_path = raw_data_path
+
+        print(f"CSV engine: {CSV_ENGINE}, files: {args.files}, rows/file: {args.rows}")
+        print(f"{'workers':>8} {'seconds':>10} {'files/s':>10} {'speedup':>8}")
+
+        baseline = None
+        for workers in worker_counts(args.max_workers):
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                df = processor.load_student_data("bench", max_workers=workers)
+                best = min(best, time.perf_counter() - start)
+
+            assert len(df) == args.files * args.rows
+            baseline = baseline or best
+            print(f"{workers:>8} {best:>10.3f} {args.files / best:>10.1f} {baseline / best:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Reproducible end-to-end ETL benchmark suite.
+
+Generates a seeded synthetic dataset (schools, students, enrollments and
+assessment results skewed across the eight divisions) at the requested scale
+and times each ETL component on it: CSV extraction, every transformer,
+DataQualityValidator and loader throughput against SQLite or PostgreSQL.
+Results are written as JSON; pass an earlier results file with --compare to
+flag scenarios whose throughput regressed between commits.
+
+Usage:
+    python benchmarks/bench_etl.py --scale 1m --output bench-1m.json
+    python benchmarks/bench_etl.py --scale 1m --compare bench-1m-main.json
+    python benchmarks/bench_etl.py --scale 10k --scenarios load_students \\
+        --database-url postgresql+asyncpg://localhost/bench
+
+The loader scenario needs an async driver: aiosqlite for the default SQLite
+database, asyncpg for PostgreSQL. Scenarios whose dependencies are missing
+are reported as skipped.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Float, MetaData, Table, Text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.data_processing.extractors import CSVExtractor  # noqa: E402
+from src.data_processing.instrumentation import peak_rss_bytes  # noqa: E402
+from src.data_processing.loaders import DatabaseLoader  # noqa: E402
+from src.data_processing.schemas import SCHEMA_REGISTRY  # noqa: E402
+from src.data_processing.transformers import (  # noqa: E402
+    EnrollmentDataTransformer,
+    SchoolDataTransformer,
+    StudentDataTransformer,
+)
+from src.data_processing.validators import DataQualityValidator, get_student_validation_rules  # noqa: E402
+
+from utils.data_generators.synthetic_students import generate_dataset  # noqa: E402
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+
+SCENARIOS = [
+    "csv_extract",
+    "csv_extract_typed",
+    "transform_students",
+    "transform_students_typed",
+    "transform_schools",
+    "transform_enrollments",
+    "validate_students",
+    "validate_students_approximate",
+    "load_students",
+]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=os.path.dirname(__file__)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_scenario(func: Callable[[], Any], rows: int, repeat: int) -> Dict[str, Any]:
+    """Run ``func`` ``repeat`` times; the best run is reported"""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+
+    best = min(runs)
+    return {
+        "rows": rows,
+        "seconds": best,
+        "rows_per_second": rows / best if best > 0 else 0.0,
+        "runs": runs,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def run_async(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def build_validator(approximate: bool = False) -> DataQualityValidator:
+    """Student validator with the standard rules; Great Expectations is left out of the timing"""
+    validator = DataQualityValidator({"approximate": approximate})
+    validator.ge_context = None
+    for rule in get_student_validation_rules():
+        validator.add_validation_rule(rule)
+    return validator
+
+
+def load_table(frame: pd.DataFrame, key: str) -> Table:
+    """Benchmark target table mirroring the transformed frame's columns"""
+    columns = []
+    for name, dtype in frame.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            column_type = Boolean
+        elif pd.api.types.is_integer_dtype(dtype):
+            column_type = BigInteger
+        elif pd.api.types.is_float_dtype(dtype):
+            column_type = Float
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            column_type = DateTime
+        else:
+            column_type = Text
+        columns.append(Column(name, column_type, primary_key=name == key))
+    return Table("bench_students", MetaData(), *columns)
+
+
+def bench_load(frame: pd.DataFrame, database_url: str, batch_size: int, repeat: int) -> Dict[str, Any]:
+    """Time DatabaseLoader batch writes into a scratch table, recreated before every run"""
+    is_postgres = database_url.startswith("postgresql")
+    # Upserts use PostgreSQL's ON CONFLICT ... RETURNING; other databases get plain inserts
+    loader = DatabaseLoader(
+        "bench_students",
+        batch_size=batch_size,
+        on_conflict="update" if is_postgres else "error",
+        upsert_columns=["student_id"],
+    )
+    table = load_table(frame, "student_id")
+    # Missing values as None so every driver accepts them
+    frame = frame.astype(object).where(frame.notna(), None)
+    model = type("BenchStudent", (), {"__table__": table})
+
+    async def load_once():
+        engine = create_async_engine(database_url)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(table.drop, checkfirst=True)
+                await conn.run_sync(table.create)
+
+            start = time.perf_counter()
+            async with AsyncSession(engine) as session:
+                for i in range(0, len(frame), batch_size):
+                    batch_result = await loader._load_batch(session, frame.iloc[i : i + batch_size], model)
+                    if batch_result["errors"]:
+                        raise RuntimeError(batch_result["errors"][0])
+                await session.commit()
+            return time.perf_counter() - start
+        finally:
+            await engine.dispose()
+
+    runs = [run_async(load_once()) for _ in range(repeat)]
+    best = min(runs)
+    return {
+        "rows": len(frame),
+        "seconds": best,
+        "rows_per_second": len(frame) / best if best > 0 else 0.0,
+        "runs": runs,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "database": database_url.split(":", 1)[0],
+    }
+
+
+def typed_student_transformer() -> StudentDataTransformer:
+    transformer = StudentDataTransformer()
+    transformer.schema = SCHEMA_REGISTRY["students"]
+    return transformer
+
+
+def run_benchmarks(args) -> Dict[str, Any]:
+    rows = SCALES[args.scale] if args.rows is None else args.rows
+    scenarios = args.scenarios.split(",") if args.scenarios else SCENARIOS
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {sorted(unknown)}")
+
+    start = time.perf_counter()
+    dataset = generate_dataset(rows, seed=args.seed)
+    generate_seconds = time.perf_counter() - start
+    print(f"Generated {rows:,} students, {len(dataset['schools']):,} schools in {generate_seconds:.2f}s")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    transformed: Dict[str, pd.DataFrame] = {}
+
+    def transformed_students() -> pd.DataFrame:
+        if "students" not in transformed:
+            transformed["students"] = run_async(StudentDataTransformer().transform(dataset["students"]))
+        return transformed["students"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "students.csv"
+
+        def extract_csv(typed: bool) -> pd.DataFrame:
+            if not csv_path.exists():
+                dataset["students"].to_csv(csv_path, index=False)
+            schema = SCHEMA_REGISTRY["students"] if typed else None
+            return run_async(CSVExtractor(str(csv_path), schema=schema).extract())
+
+        for scenario in scenarios:
+            try:
+                if scenario in ("csv_extract", "csv_extract_typed"):
+                    typed = scenario.endswith("typed")
+                    result = time_scenario(lambda: extract_csv(typed), rows, args.repeat)
+                    result["bytes"] = csv_path.stat().st_size
+                    # Deep in-memory size of the extracted frame, to compare object and typed dtypes
+                    result["frame_memory_bytes"] = int(extract_csv(typed).memory_usage(deep=True).sum())
+                elif scenario == "transform_students":
+                    result = time_scenario(
+                        lambda: run_async(StudentDataTransformer().transform(dataset["students"])), rows, args.repeat
+                    )
+                elif scenario == "transform_students_typed":
+                    typed_students = SCHEMA_REGISTRY["students"].apply_read_dtypes(dataset["students"])
+                    result = time_scenario(
+                        lambda: run_async(typed_student_transformer().transform(typed_students)), rows, args.repeat
+                    )
+                elif scenario == "transform_schools":
+                    result = time_scenario(
+                        lambda: run_async(SchoolDataTransformer().transform(dataset["schools"])),
+                        len(dataset["schools"]),
+                        args.repeat,
+                    )
+                elif scenario == "transform_enrollments":
+                    result = time_scenario(
+                        lambda: run_async(EnrollmentDataTransformer().transform(dataset["enrollments"])),
+                        len(dataset["enrollments"]),
+                        args.repeat,
+                    )
+                elif scenario in ("validate_students", "validate_students_approximate"):
+                    data = transformed_students()
+                    approximate = scenario.endswith("approximate")
+                    result = time_scenario(
+                        lambda: run_async(build_validator(approximate).validate(data, "students")), len(data), args.repeat
+                    )
+                else:
+                    data = transformed_students().head(args.load_rows)
+                    database_url = args.database_url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+                    result = bench_load(data, database_url, args.batch_size, args.repeat)
+            except ImportError as e:
+                result = {"skipped": f"missing dependency: {e}"}
+            except Exception as e:
+                result = {"failed": f"{type(e).__name__}: {e}"}
+
+            results[scenario] = result
+            if "skipped" in result or "failed" in result:
+                print(f"{scenario:>30} {next(iter(result))} ({next(iter(result.values()))})")
+            else:
+                print(f"{scenario:>30} {result['seconds']:>10.3f}s {result['rows_per_second']:>14,.0f} rows/s")
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scale": args.scale if args.rows is None else None,
+        "rows": rows,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "generate_seconds": generate_seconds,
+        "scenarios": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """Print throughput changes against ``baseline``; returns the number of regressions"""
+    regressions = 0
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} (regression threshold {threshold:.0%})")
+    print(f"{'scenario':>30} {'baseline rows/s':>16} {'current rows/s':>16} {'change':>8}")
+
+    for scenario, result in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(scenario)
+        if "seconds" not in result or not previous or not previous.get("rows_per_second"):
+            continue
+
+        change = result["rows_per_second"] / previous["rows_per_second"] - 1
+        regressed = change < -threshold
+        regressions += regressed
+        print(
+            f"{scenario:>30} {previous['rows_per_second']:>16,.0f} {result['rows_per_second']:>16,.0f} "
+            f"{change:>+7.1%}{'  REGRESSION' if regressed else ''}"
+        )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end ETL benchmark suite")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="10k", help="Dataset size (number of students)")
+    parser.add_argument("--rows", type=int, default=None, help="Exact number of students (overrides --scale)")
+    parser.add_argument("--scenarios", default=None, help=f"Comma-separated subset of: {','.join(SCENARIOS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (best is reported)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic dataset")
+    parser.add_argument("--database-url", default=None, help="Async SQLAlchemy URL for the loader (default: temp SQLite)")
+    parser.add_argument("--load-rows", type=int, default=100_000, help="Rows written by the loader scenario")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Loader batch size")
+    parser.add_argument("--output", default="bench_etl_results.json", help="Where to write the JSON results")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Throughput drop that counts as a regression")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
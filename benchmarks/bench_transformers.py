@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark the BaseTransformer cleaning helpers.
+
+Builds a synthetic frame with realistic duplication (names, phone formats and
+emails drawn from small pools) and reports rows/second for text, phone and
+email cleaning, and for the same cleaning run as declarative rules with the
+columns inline or in ``--rule-workers`` processes.
+
+Usage:
+    python benchmarks/bench_transformers.py --rows 1000000
+    python benchmarks/bench_transformers.py --rows 1000000 --rule-workers 3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.data_processing.transformers import StudentDataTransformer  # noqa: E402
+
+
+def build_frame(num_rows: int) -> pd.DataFrame:
+    """Synthetic contact columns with nulls and mixed formats."""
+    rng = np.random.default_rng(42)
+    names = np.array(["  ahmed   rahman ", "FATIMA KHAN", "nusrat\tjahan", "rahim uddin!", "karim hossain"], dtype=object)
+    prefixes = np.array(["0", "+880 ", "880", ""], dtype=object)
+    domains = np.array(["example.com", "mail.example.org", "invalid", "school.edu.bd"], dtype=object)
+
+    subscribers = rng.integers(0, 100_000, num_rows).astype(str)
+    phones = prefixes[rng.integers(0, len(prefixes), num_rows)] + "17" + np.char.zfill(subscribers, 8).astype(object)
+    emails = "student" + subscribers.astype(object) + "@" + domains[rng.integers(0, len(domains), num_rows)]
+
+    df = pd.DataFrame(
+        {
+            "name": names[rng.integers(0, len(names), num_rows)],
+            "phone": phones,
+            "email": emails,
+        }
+    )
+    nulls = rng.random(num_rows) < 0.05
+    df.loc[nulls, ["phone", "email"]] = None
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transformer cleaning microbenchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per transformation (best is reported)")
+    parser.add_argument("--rule-workers", type=int, default=0, help="Worker processes for the rule columns (0 = inline)")
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+    transformer = StudentDataTransformer()
+    cases = {
+        "clean_text": lambda: transformer._clean_text_column(df["name"], case="title", remove_special_chars=True),
+        "normalize_phone": lambda: transformer._normalize_phone_number(df["phone"]),
+        "validate_email": lambda: transformer._validate_email(df["email"]),
+    }
+
+    rule_transformer = StudentDataTransformer()
+    rule_transformer.add_transformation_rules(
+        [
+            {"column": "name", "operation": "clean", "parameters": {"case": "title", "remove_special_chars": True}},
+            {"column": "phone", "operation": "normalize_phone"},
+            {"column": "email", "operation": "validate_email"},
+        ]
+    )
+    rule_transformer.rule_workers = args.rule_workers
+    cases["apply_rules"] = lambda: asyncio.run(rule_transformer.apply_transformation_rules(df.copy()))
+
+    print(f"rows: {args.rows}, rule workers: {args.rule_workers}")
+    print(f"{'transformation':>16} {'seconds':>10} {'rows/s':>14}")
+    for name, func in cases.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:>16} {best:>10.3f} {args.rows / best:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Priority P0: Implement Apache Airflow DAGs for ETL workflows
 """
 
 import logging
+import os
 from datetime import datetime, timedelta
 
 from airflow import DAG
@@ -39,11 +40,84 @@ dag = DAG(
     tags=["education", "etl", "student-performance"],
 )
 
+# Stage outputs are handed between tasks as Parquet; XCom only carries the artifact path and row count
+STAGING_DIR = os.getenv("ETL_STAGING_DIR", "/tmp/etl_staging")
+
+# Partition directory for rows with no value in a partition column; read_staged turns it back into null
+NULL_PARTITION = "__null__"
+
+STUDENT_COLUMNS = [
+    "student_id",
+    "full_name",
+    "gender",
+    "date_of_birth",
+    "division",
+    "district",
+    "upazila",
+    "school_id",
+    "enrollment_date",
+    "academic_year",
+]
+
+ASSESSMENT_COLUMNS = [
+    "student_id",
+    "subject_name",
+    "marks_obtained",
+    "max_marks",
+    "assessment_date",
+    "academic_year",
+    "term",
+    "assessment_type",
+]
+
+
+def stage_dataframe(df, name, context, partition_cols=None):
+    """Write a DataFrame as a (partitioned) Parquet dataset for this DAG run.
+
+    Null or blank partition values are written to the NULL_PARTITION directory,
+    since pyarrow cannot read null hive partitions back; read_staged restores them.
+    """
+    import shutil
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = os.path.join(STAGING_DIR, context["dag"].dag_id, context["run_id"], name)
+    shutil.rmtree(path, ignore_errors=True)
+
+    partition_cols = partition_cols or []
+    if partition_cols:
+        df = df.copy()
+        for column in partition_cols:
+            values = df[column].astype("string")
+            missing = values.isna() | (values.str.strip() == "")
+            if missing.any():
+                logger.info(f"Staging {int(missing.sum())} rows without a {column} under {NULL_PARTITION}")
+            df[column] = values.mask(missing, NULL_PARTITION).astype(object)
+
+    pq.write_to_dataset(pa.Table.from_pandas(df, preserve_index=False), root_path=path, partition_cols=partition_cols or None)
+    logger.info(f"Staged {len(df)} rows to {path}")
+
+    return {"path": path, "row_count": len(df), "partition_cols": partition_cols}
+
+
+def read_staged(artifact, columns=None):
+    """Read a staged Parquet dataset, projecting only the requested columns.
+
+    Partition columns come back as plain values, with NULL_PARTITION rows as null.
+    """
+    import pandas as pd
+
+    df = pd.read_parquet(artifact["path"], columns=columns)
+    for column in artifact.get("partition_cols", []):
+        if column in df.columns:
+            values = df[column].astype(object)
+            df[column] = values.mask(values == NULL_PARTITION, None)
+    return df
+
 
 def extract_student_data(**context):
     """Extract student data from various sources."""
-    import os
-
     import pandas as pd
     from sqlalchemy import create_engine
 
@@ -55,18 +129,8 @@ def extract_student_data(**context):
         education_board_engine = create_engine(os.getenv("EDUCATION_BOARD_DATABASE_URL"))
 
         # Extract from BANBEIS
-        banbeis_query = """
-        SELECT
-            student_id,
-            full_name,
-            gender,
-            date_of_birth,
-            division,
-            district,
-            upazila,
-            school_id,
-            enrollment_date,
-            academic_year
+        banbeis_query = f"""
+        SELECT {", ".join(STUDENT_COLUMNS)}
         FROM students
         WHERE updated_at >= CURRENT_DATE - INTERVAL '1 day'
         """
@@ -75,16 +139,8 @@ def extract_student_data(**context):
         logger.info(f"Extracted {len(banbeis_df)} records from BANBEIS")
 
         # Extract from Education Board
-        board_query = """
-        SELECT
-            student_id,
-            subject_name,
-            marks_obtained,
-            max_marks,
-            assessment_date,
-            academic_year,
-            term,
-            assessment_type
+        board_query = f"""
+        SELECT {", ".join(ASSESSMENT_COLUMNS)}
         FROM assessment_results
         WHERE assessment_date >= CURRENT_DATE - INTERVAL '7 days'
         """
@@ -92,9 +148,11 @@ def extract_student_data(**context):
         board_df = pd.read_sql(board_query, education_board_engine)
         logger.info(f"Extracted {len(board_df)} assessment records from Education Board")
 
-        # Store extracted data for next step
-        context["task_instance"].xcom_push(key="banbeis_data", value=banbeis_df.to_json())
-        context["task_instance"].xcom_push(key="board_data", value=board_df.to_json())
+        # Stage extracted data for next step
+        context["task_instance"].xcom_push(
+            key="banbeis_data", value=stage_dataframe(banbeis_df, "banbeis", context, partition_cols=["division"])
+        )
+        context["task_instance"].xcom_push(key="board_data", value=stage_dataframe(board_df, "board", context))
 
         return "Extraction completed successfully"
 
@@ -105,8 +163,6 @@ def extract_student_data(**context):
 
 def transform_student_data(**context):
     """Transform and clean student data."""
-    from datetime import datetime
-
     import numpy as np
     import pandas as pd
 
@@ -114,11 +170,8 @@ def transform_student_data(**context):
 
     try:
         # Get extracted data
-        banbeis_json = context["task_instance"].xcom_pull(key="banbeis_data")
-        board_json = context["task_instance"].xcom_pull(key="board_data")
-
-        banbeis_df = pd.read_json(banbeis_json)
-        board_df = pd.read_json(board_json)
+        banbeis_df = read_staged(context["task_instance"].xcom_pull(key="banbeis_data"), columns=STUDENT_COLUMNS)
+        board_df = read_staged(context["task_instance"].xcom_pull(key="board_data"), columns=ASSESSMENT_COLUMNS)
 
         # Clean student data
         banbeis_df["date_of_birth"] = pd.to_datetime(banbeis_df["date_of_birth"], errors="coerce")
@@ -157,9 +210,13 @@ def transform_student_data(**context):
 
         board_df["grade_letter"] = board_df["percentage"].apply(get_grade_letter)
 
-        # Store transformed data
-        context["task_instance"].xcom_push(key="transformed_students", value=banbeis_df.to_json())
-        context["task_instance"].xcom_push(key="transformed_assessments", value=board_df.to_json())
+        # Stage transformed data
+        context["task_instance"].xcom_push(
+            key="transformed_students", value=stage_dataframe(banbeis_df, "transformed_students", context)
+        )
+        context["task_instance"].xcom_push(
+            key="transformed_assessments", value=stage_dataframe(board_df, "transformed_assessments", context)
+        )
 
         logger.info("Data transformation completed successfully")
         return "Transformation completed successfully"
@@ -171,20 +228,14 @@ def transform_student_data(**context):
 
 def load_student_data(**context):
     """Load transformed data into the data warehouse."""
-    import os
-
-    import pandas as pd
     from sqlalchemy import create_engine
 
     logger.info("Starting data loading...")
 
     try:
         # Get transformed data
-        students_json = context["task_instance"].xcom_pull(key="transformed_students")
-        assessments_json = context["task_instance"].xcom_pull(key="transformed_assessments")
-
-        students_df = pd.read_json(students_json)
-        assessments_df = pd.read_json(assessments_json)
+        students_df = read_staged(context["task_instance"].xcom_pull(key="transformed_students"))
+        assessments_df = read_staged(context["task_instance"].xcom_pull(key="transformed_assessments"))
 
         # Connect to data warehouse
         dw_engine = create_engine(os.getenv("DATA_WAREHOUSE_URL"))
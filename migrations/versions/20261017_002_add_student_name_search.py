@@ -0,0 +1,34 @@
+"""Add trigram indexes for student name search
+
+Revision ID: 20261017_002
+Revises: 20250105_001
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_002"
+down_revision = "20250105_001"
+branch_labels = None
+depends_on = None
+
+# Index expressions must match the ones the student search query filters on
+NAME_EXPRESSION = "lower(first_name || ' ' || last_name)"
+NAME_BN_EXPRESSION = "(coalesce(first_name_bn, '') || ' ' || coalesce(last_name_bn, ''))"
+
+
+def upgrade():
+    """Enable pg_trgm and index English and Bangla full names for similarity search."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(f"CREATE INDEX IF NOT EXISTS ix_students_name_trgm ON students USING gin (({NAME_EXPRESSION}) gin_trgm_ops)")
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS ix_students_name_bn_trgm ON students USING gin (({NAME_BN_EXPRESSION}) gin_trgm_ops)"
+    )
+
+
+def downgrade():
+    """Drop the name search indexes; the extension is left installed for other users."""
+    op.execute("DROP INDEX IF EXISTS ix_students_name_bn_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_students_name_trgm")
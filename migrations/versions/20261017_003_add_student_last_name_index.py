@@ -0,0 +1,25 @@
+"""Add keyset pagination index on student last name
+
+Revision ID: 20261017_003
+Revises: 20261017_002
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_003"
+down_revision = "20261017_002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Index (last_name, id) so cursor pages sorted by last name seek instead of sorting."""
+    op.execute("CREATE INDEX IF NOT EXISTS idx_student_last_name_id ON students (last_name, id)")
+
+
+def downgrade():
+    """Drop the last name pagination index."""
+    op.execute("DROP INDEX IF EXISTS idx_student_last_name_id")
@@ -0,0 +1,85 @@
+"""
+Batch request bodies
+====================
+Reading bulk payloads sent as a JSON array or streamed as NDJSON
+"""
+
+import json
+from typing import Any, AsyncIterator, List, Optional
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class BatchTooLargeError(ValueError):
+    """Raised when a batch holds more items or bytes than the endpoint accepts"""
+
+
+async def read_batch_items(
+    chunks: AsyncIterator[bytes], content_type: str, max_items: int, key: str, max_bytes: Optional[int] = None
+) -> List[Any]:
+    """Items of a request body: a JSON array, an object holding the array under ``key``, or NDJSON
+
+    NDJSON bodies are parsed line by line as they arrive and rejected as soon
+    as they pass ``max_items``, without buffering the rest of the upload. JSON
+    bodies are only parsed once complete, so ``max_bytes`` bounds how much of
+    either is read before giving up.
+
+    Raises:
+        BatchTooLargeError: If the body holds more than ``max_items`` items or ``max_bytes`` bytes
+        ValueError: If the body (or an NDJSON line) is not valid JSON of the expected shape
+    """
+    if max_bytes is not None:
+        chunks = _limit_bytes(chunks, max_bytes)
+
+    if content_type.split(";")[0].strip().lower() in NDJSON_CONTENT_TYPES:
+        return await _read_ndjson(chunks, max_items)
+
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise ValueError("Request body is not valid JSON") from e
+
+    if isinstance(payload, dict):
+        payload = payload.get(key)
+    if not isinstance(payload, list):
+        raise ValueError(f"Expected a JSON array or an object with a '{key}' array")
+    if len(payload) > max_items:
+        raise BatchTooLargeError(f"Batch holds {len(payload)} items; at most {max_items} are accepted")
+    return payload
+
+
+async def _limit_bytes(chunks: AsyncIterator[bytes], max_bytes: int) -> AsyncIterator[bytes]:
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise BatchTooLargeError(f"Request body exceeds {max_bytes} bytes")
+        yield chunk
+
+
+async def _read_ndjson(chunks: AsyncIterator[bytes], max_items: int) -> List[Any]:
+    items: List[Any] = []
+    line_number = 0
+    buffer = b""
+    async for chunk in chunks:
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            line_number += 1
+            _append_line(items, line, line_number, max_items)
+    _append_line(items, buffer, line_number + 1, max_items)
+    return items
+
+
+def _append_line(items: List[Any], line: bytes, line_number: int, max_items: int):
+    line = line.strip()
+    if not line:
+        return
+    if len(items) >= max_items:
+        raise BatchTooLargeError(f"Batch holds more than {max_items} items")
+    try:
+        items.append(json.loads(line))
+    except ValueError as e:
+        raise ValueError(f"Line {line_number} is not valid JSON") from e
@@ -1,14 +1,34 @@
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from api.batch import BatchTooLargeError, read_batch_items
+from api.export import EXPORT_FORMATS, arrow_schema, csv_chunks, gzip_chunks, ndjson_chunks, parquet_chunks
+from api.pagination import CountCache, InvalidCursorError, decode_cursor, encode_cursor, estimated_row_count
+from api.search import NGramIndex, name_tokens, pg_name_search
 from auth.dependencies import admin_required, get_current_active_user, teacher_or_admin_required
 from auth.models import UserInDB, UserRole
-from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
-from models.student import PaginatedStudentResponse, StudentCreate, StudentResponse, StudentUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Security, status
+from fastapi.responses import StreamingResponse
+from models.student import (
+    PaginatedStudentResponse,
+    StudentBatchItemResult,
+    StudentBatchResponse,
+    StudentCreate,
+    StudentResponse,
+    StudentSearchHit,
+    StudentSearchResponse,
+    StudentUpdate,
+)
 from models.student_model import Gender, StudentDB
-from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from sqlalchemy import Date, DateTime, Integer, func, literal_column, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.base import get_db
+from database import base
+from database.base import get_async_db
 
 router = APIRouter(
     prefix="/api/students",
@@ -16,6 +36,135 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Sort keys allowed in cursor mode; each is paired with the primary key as a tie-breaker
+CURSOR_SORT_COLUMNS = {
+    "id": StudentDB.id,
+    "student_id": StudentDB.student_id,
+    "last_name": StudentDB.last_name,
+}
+
+# Filtered totals in cursor mode are counted once per filter set and reused across pages
+student_count_cache = CountCache(ttl=60.0)
+
+# Largest batch accepted by POST /batch, in items and in body bytes
+MAX_BATCH_SIZE = 1000
+MAX_BATCH_BYTES = 4 * 1024 * 1024
+
+# Dialects with INSERT ... ON CONFLICT, used for single-statement batch upserts
+UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# Columns a batch upsert may overwrite on students that already exist; each item only overwrites those it sets
+UPSERT_COLUMNS = [name for name in StudentCreate.model_fields if name != "student_id"]
+
+# Rows fetched from the server-side cursor, and encoded, per export chunk
+EXPORT_BATCH_SIZE = 5000
+
+EXPORT_COLUMNS = list(StudentDB.__table__.columns)
+
+
+def _export_kind(column) -> str:
+    for column_type, kind in ((Integer, "int"), (DateTime, "datetime"), (Date, "date")):
+        if isinstance(column.type, column_type):
+            return kind
+    return "string"
+
+
+EXPORT_SCHEMA = arrow_schema({column.name: _export_kind(column) for column in EXPORT_COLUMNS})
+
+
+async def _estimated_student_total(db: AsyncSession) -> Optional[int]:
+    """Planner estimate of the students table size, or None off PostgreSQL or before ANALYZE"""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    try:
+        reltuples = await db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"), {"table": StudentDB.__tablename__}
+        )
+    except SQLAlchemyError:
+        return None
+    return estimated_row_count(reltuples.scalar())
+
+
+async def _count_students(db: AsyncSession, query) -> int:
+    return (await db.execute(select(func.count()).select_from(query.subquery()))).scalar_one()
+
+
+def _filter_students(query, name: Optional[str], division: Optional[str], district: Optional[str], gender: Optional[Gender]):
+    """Apply the listing filters shared by list and export"""
+    if name:
+        query = query.where((StudentDB.first_name.ilike(f"%{name}%")) | (StudentDB.last_name.ilike(f"%{name}%")))
+    if division:
+        query = query.where(StudentDB.division.ilike(f"%{division}%"))
+    if district:
+        query = query.where(StudentDB.district.ilike(f"%{district}%"))
+    if gender:
+        query = query.where(StudentDB.gender == gender)
+    return query
+
+
+async def _get_student(db: AsyncSession, student_id: str) -> Optional[StudentDB]:
+    result = await db.execute(select(StudentDB).where(StudentDB.student_id == student_id))
+    return result.scalars().first()
+
+
+# pg_trgm availability per database URL, and the in-memory index used where it is missing
+_pg_trgm_available: Dict[str, bool] = {}
+_name_index: Optional[NGramIndex] = None
+
+
+async def _trigram_search_available(db: AsyncSession) -> bool:
+    bind = db.get_bind()
+    key = str(bind.url)
+    if key not in _pg_trgm_available:
+        available = False
+        if bind.dialect.name == "postgresql":
+            try:
+                result = await db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+                available = result.scalar() is not None
+            except SQLAlchemyError:
+                pass
+        _pg_trgm_available[key] = available
+    return _pg_trgm_available[key]
+
+
+NAME_COLUMNS = ["first_name", "last_name", "first_name_bn", "last_name_bn"]
+
+
+def _student_names(student) -> List[Optional[str]]:
+    return [getattr(student, name) for name in NAME_COLUMNS]
+
+
+async def _fallback_name_index(db: AsyncSession) -> NGramIndex:
+    """Build the in-memory name index on first use; later writes keep it current"""
+    global _name_index
+    if _name_index is None:
+        index = NGramIndex()
+        rows = await db.stream(
+            select(
+                StudentDB.id, StudentDB.first_name, StudentDB.last_name, StudentDB.first_name_bn, StudentDB.last_name_bn
+            ).execution_options(yield_per=10000)
+        )
+        async for row in rows:
+            index.add(row.id, _student_names(row))
+        _name_index = index
+    return _name_index
+
+
+async def _search_student_ids(db: AsyncSession, query: str, limit: int, threshold: float) -> List[Tuple[int, float, bool]]:
+    """Ranked ``(id, score, prefix_match)`` for a name query, best first"""
+    if not await _trigram_search_available(db):
+        return (await _fallback_name_index(db)).search(query, limit=limit, threshold=threshold)
+
+    if not name_tokens(query):
+        return []
+    statement, params = pg_name_search(query, limit)
+    # Transaction-local, so other queries on this connection keep the default threshold
+    await db.execute(
+        text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"), {"threshold": str(threshold)}
+    )
+    rows = await db.execute(statement, params)
+    return [(row.id, float(row.score), bool(row.prefix_match)) for row in rows]
+
 
 @router.post(
     "/",
@@ -24,41 +173,269 @@ router = APIRouter(
     summary="Create a new student record",
     dependencies=[Depends(teacher_or_admin_required)],
 )
-async def create_student(student: StudentCreate, db: Session = Depends(get_db)):
+async def create_student(student: StudentCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create a new student record with the provided information.
     """
-    # Check if student with same ID or email already exists
-    db_student = (
-        db.query(StudentDB).filter((StudentDB.student_id == student.student_id) | (StudentDB.email == student.email)).first()
-    )
+    # Check if student with same ID or email already exists; students without an email never clash on it
+    duplicate = StudentDB.student_id == student.student_id
+    if student.email is not None:
+        duplicate = or_(duplicate, StudentDB.email == student.email)
+    result = await db.execute(select(StudentDB).where(duplicate))
+    db_student = result.scalars().first()
 
     if db_student:
         if db_student.student_id == student.student_id:
             raise HTTPException(status_code=400, detail=f"Student with ID {student.student_id} already exists")
-        if db_student.email == student.email:
+        if student.email is not None and db_student.email == student.email:
             raise HTTPException(status_code=400, detail=f"Email {student.email} is already registered")
 
     # Create new student
     db_student = StudentDB(**student.dict())
     db.add(db_student)
-    db.commit()
-    db.refresh(db_student)
+    await db.commit()
+    await db.refresh(db_student)
+    if _name_index is not None:
+        _name_index.add(db_student.id, _student_names(db_student))
 
     return db_student
 
 
+@router.post(
+    "/batch",
+    response_model=StudentBatchResponse,
+    summary="Create or update students in bulk",
+    dependencies=[Depends(teacher_or_admin_required)],
+)
+async def batch_upsert_students(
+    request: Request,
+    on_conflict: str = Query("update", pattern="^(update|skip)$", description="What to do with existing student IDs"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Create or update up to 1000 students in one request.
+
+    The body is a JSON array, an object with a ``students`` array, or NDJSON
+    (``application/x-ndjson``) with one student per line. Items are validated
+    individually; existing IDs and emails are looked up in one query and valid
+    items are written with one upsert per set of fields they provide, so an
+    existing student keeps the fields an item leaves out. Each item gets a status:
+    created, updated, skipped (existing ID with ``on_conflict=skip``), invalid,
+    duplicate (ID or email repeated within the batch) or conflict (email
+    registered to another student).
+    """
+    try:
+        payload = await read_batch_items(
+            request.stream(),
+            request.headers.get("content-type", ""),
+            MAX_BATCH_SIZE,
+            key="students",
+            max_bytes=MAX_BATCH_BYTES,
+        )
+    except BatchTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    results = []
+    valid: Dict[int, StudentCreate] = {}
+    seen_ids: Dict[str, int] = {}
+    seen_emails: Dict[str, int] = {}
+    for index, item in enumerate(payload):
+        result = StudentBatchItemResult(index=index, status="invalid")
+        results.append(result)
+        if isinstance(item, dict) and isinstance(item.get("student_id"), str):
+            result.student_id = item["student_id"]
+        try:
+            student = StudentCreate.model_validate(item)
+        except ValidationError as e:
+            result.errors = [f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()]
+            continue
+
+        if student.student_id in seen_ids:
+            result.status = "duplicate"
+            result.errors = [f"student_id repeats item {seen_ids[student.student_id]}"]
+            continue
+        if student.email and student.email in seen_emails:
+            result.status = "duplicate"
+            result.errors = [f"email repeats item {seen_emails[student.email]}"]
+            continue
+        seen_ids[student.student_id] = index
+        if student.email:
+            seen_emails[student.email] = index
+        valid[index] = student
+
+    existing_ids = set()
+    if valid:
+        # One set-based lookup of every ID and email the batch uses
+        rows = await db.execute(
+            select(StudentDB.student_id, StudentDB.email).where(
+                or_(StudentDB.student_id.in_(list(seen_ids)), StudentDB.email.in_(list(seen_emails)))
+            )
+        )
+        email_owners = {}
+        for row in rows:
+            existing_ids.add(row.student_id)
+            if row.email:
+                email_owners[row.email] = row.student_id
+
+        for index, student in list(valid.items()):
+            owner = email_owners.get(student.email) if student.email else None
+            if owner is not None and owner != student.student_id:
+                results[index].status = "conflict"
+                results[index].errors = [f"Email {student.email} is already registered to {owner}"]
+                del valid[index]
+            elif student.student_id in existing_ids and on_conflict == "skip":
+                results[index].status = "skipped"
+                del valid[index]
+
+    if valid:
+        dialect = db.get_bind().dialect.name
+        insert = UPSERT_INSERTS.get(dialect)
+        if insert is None:
+            raise HTTPException(status_code=501, detail="Batch upserts need PostgreSQL or SQLite")
+
+        returning = [StudentDB.id, StudentDB.student_id, *[getattr(StudentDB, name) for name in NAME_COLUMNS]]
+        if dialect == "postgresql":
+            # xmax is 0 for rows this statement inserted and set for rows it updated
+            returning.append(literal_column("(xmax = 0)").label("inserted"))
+
+        groups: Dict[Tuple[str, ...], List[StudentCreate]] = {}
+        for student in valid.values():
+            fields = tuple(column for column in UPSERT_COLUMNS if column in student.model_fields_set)
+            groups.setdefault(fields, []).append(student)
+
+        written = {}
+        try:
+            for fields, students in groups.items():
+                statement = insert(StudentDB).values([student.model_dump() for student in students])
+                if on_conflict == "skip":
+                    statement = statement.on_conflict_do_nothing(index_elements=[StudentDB.student_id])
+                else:
+                    statement = statement.on_conflict_do_update(
+                        index_elements=[StudentDB.student_id],
+                        set_={**{column: statement.excluded[column] for column in fields}, "updated_at": func.now()},
+                    )
+                written.update({row.student_id: row for row in await db.execute(statement.returning(*returning))})
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="Batch conflicts with concurrent changes; retry it")
+
+        for index, student in valid.items():
+            row = written.get(student.student_id)
+            if row is None:
+                # Created by another request after the lookup; on_conflict=skip leaves it alone
+                results[index].status = "skipped"
+                continue
+            results[index].id = row.id
+            # Elsewhere the lookup above ran in this transaction and SQLite serialises writers, so it is still current
+            created = row.inserted if dialect == "postgresql" else student.student_id not in existing_ids
+            results[index].status = "created" if created else "updated"
+            if _name_index is not None:
+                _name_index.add(row.id, _student_names(row))
+
+    counts = {state: sum(result.status == state for result in results) for state in ("created", "updated", "skipped")}
+    return {
+        "total": len(results),
+        **counts,
+        "failed": len(results) - sum(counts.values()),
+        "items": results,
+    }
+
+
+@router.get(
+    "/search",
+    response_model=StudentSearchResponse,
+    summary="Search students by name",
+    dependencies=[Depends(get_current_active_user)],
+)
+async def search_students(
+    q: str = Query(..., min_length=1, max_length=200, description="Name or name prefix, in English or Bangla"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    threshold: float = Query(0.3, ge=0.0, le=1.0, description="Minimum similarity for non-prefix matches"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Search students by English or Bangla name, best matches first.
+
+    Students whose names start with every word of the query rank first, then
+    by trigram similarity, so typos and partial names still match. Uses the
+    pg_trgm indexes on PostgreSQL and an in-memory trigram index elsewhere.
+    """
+    hits = await _search_student_ids(db, q, limit, threshold)
+    result = await db.execute(select(StudentDB).where(StudentDB.id.in_([hit[0] for hit in hits])))
+    students = {student.id: student for student in result.scalars()}
+
+    items = [
+        StudentSearchHit(
+            **StudentResponse.model_validate(students[student_id]).model_dump(), score=score, prefix_match=prefix_match
+        )
+        for student_id, score, prefix_match in hits
+        if student_id in students
+    ]
+    return {"query": q, "items": items}
+
+
+@router.get(
+    "/export",
+    summary="Export students as CSV, NDJSON or Parquet",
+    dependencies=[Depends(teacher_or_admin_required)],
+)
+async def export_students(
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet)$", description="Output format"),
+    compression: Optional[str] = Query(None, pattern="^gzip$", description="Compress the stream on the fly"),
+    name: Optional[str] = Query(None, description="Filter by student name"),
+    division: Optional[str] = Query(None, description="Filter by division"),
+    district: Optional[str] = Query(None, description="Filter by district"),
+    gender: Optional[Gender] = Query(None, description="Filter by gender"),
+):
+    """
+    Stream every student matching the listing filters as a file download.
+
+    Rows are read from a server-side cursor in batches of 5000 and encoded
+    as they arrive, so memory stays flat however many students match.
+    Parquet output gets one row group per batch.
+    """
+    query = _filter_students(select(*EXPORT_COLUMNS), name, division, district, gender).order_by(StudentDB.id)
+
+    async def batches():
+        # The stream outlives the request handler, so it owns its session; the factory exists once the database is set up
+        if base.AsyncSessionLocal is None:
+            base.init_database()
+        async with base.AsyncSessionLocal() as session:
+            result = await session.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+            async for partition in result.partitions():
+                yield partition
+
+    if format == "parquet":
+        chunks = parquet_chunks(EXPORT_SCHEMA, batches())
+    elif format == "ndjson":
+        chunks = ndjson_chunks([column.name for column in EXPORT_COLUMNS], batches())
+    else:
+        chunks = csv_chunks([column.name for column in EXPORT_COLUMNS], batches())
+
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"students.{extension}"
+    if compression == "gzip":
+        chunks = gzip_chunks(chunks)
+        media_type, filename = "application/gzip", f"{filename}.gz"
+
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
 @router.get(
     "/{student_id}",
     response_model=StudentResponse,
     summary="Get a student by ID",
     dependencies=[Depends(get_current_active_user)],
 )
-async def read_student(student_id: str, db: Session = Depends(get_db)):
+async def read_student(student_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Retrieve a student's information by their unique student ID.
     """
-    db_student = db.query(StudentDB).filter(StudentDB.student_id == student_id).first()
+    db_student = await _get_student(db, student_id)
     if db_student is None:
         raise HTTPException(status_code=404, detail="Student not found")
     return db_student
@@ -71,34 +448,68 @@ async def read_student(student_id: str, db: Session = Depends(get_db)):
     dependencies=[Depends(get_current_active_user)],
 )
 async def list_students(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, le=1000, description="Maximum number of records to return"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (offset mode)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$", description="Pagination mode"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (implies cursor mode)"),
+    sort: str = Query("id", pattern="^(id|student_id|last_name)$", description="Sort key in cursor mode"),
     name: Optional[str] = Query(None, description="Filter by student name"),
     division: Optional[str] = Query(None, description="Filter by division"),
     district: Optional[str] = Query(None, description="Filter by district"),
     gender: Optional[Gender] = Query(None, description="Filter by gender"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Retrieve a paginated list of students with optional filtering.
+
+    Offset mode (the default) pages with ``skip``/``limit`` and returns an exact
+    total. Cursor mode pages by ``(sort, id)``: pass the returned ``next_cursor``
+    to fetch the following page, which costs the same however deep it is. Its
+    total is estimated (``total_is_estimate``): the planner's row estimate when
+    unfiltered, otherwise a count cached per filter set.
     """
-    query = db.query(StudentDB)
+    query = _filter_students(select(StudentDB), name, division, district, gender)
 
-    # Apply filters
-    if name:
-        query = query.filter((StudentDB.first_name.ilike(f"%{name}%")) | (StudentDB.last_name.ilike(f"%{name}%")))
-    if division:
-        query = query.filter(StudentDB.division.ilike(f"%{division}%"))
-    if district:
-        query = query.filter(StudentDB.district.ilike(f"%{district}%"))
-    if gender:
-        query = query.filter(StudentDB.gender == gender)
+    if pagination == "offset" and cursor is None:
+        # Get total count and paginated results
+        total = await _count_students(db, query)
+        students = (await db.execute(query.offset(skip).limit(limit))).scalars().all()
+
+        return {"total": total, "skip": skip, "limit": limit, "items": students}
+
+    sort_column = CURSOR_SORT_COLUMNS[sort]
+    filters = (name, division, district, gender.value if gender else None)
+    total = None if any(filters) else await _estimated_student_total(db)
+    if total is None:
+        total = await student_count_cache.get_or_count(filters, lambda: _count_students(db, query))
+
+    if cursor is not None:
+        try:
+            sort_value, last_id = decode_cursor(cursor, sort)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if sort == "id":
+            query = query.where(StudentDB.id > last_id)
+        else:
+            query = query.where(tuple_(sort_column, StudentDB.id) > tuple_(sort_value, last_id))
 
-    # Get total count and paginated results
-    total = query.count()
-    students = query.offset(skip).limit(limit).all()
+    # One extra row tells whether another page follows without a count
+    order = [StudentDB.id] if sort == "id" else [sort_column, StudentDB.id]
+    students = (await db.execute(query.order_by(*order).limit(limit + 1))).scalars().all()
+    next_cursor = None
+    if len(students) > limit:
+        students = students[:limit]
+        last = students[-1]
+        next_cursor = encode_cursor(sort, getattr(last, sort), last.id)
 
-    return {"total": total, "skip": skip, "limit": limit, "items": students}
+    return {
+        "total": total,
+        "skip": 0,
+        "limit": limit,
+        "items": students,
+        "next_cursor": next_cursor,
+        "total_is_estimate": True,
+    }
 
 
 @router.put(
@@ -107,11 +518,11 @@ async def list_students(
     summary="Update a student's information",
     dependencies=[Depends(teacher_or_admin_required)],
 )
-async def update_student(student_id: str, student_update: StudentUpdate, db: Session = Depends(get_db)):
+async def update_student(student_id: str, student_update: StudentUpdate, db: AsyncSession = Depends(get_async_db)):
     """
     Update a student's information by their ID.
     """
-    db_student = db.query(StudentDB).filter(StudentDB.student_id == student_id).first()
+    db_student = await _get_student(db, student_id)
     if db_student is None:
         raise HTTPException(status_code=404, detail="Student not found")
 
@@ -121,8 +532,10 @@ async def update_student(student_id: str, student_update: StudentUpdate, db: Ses
         setattr(db_student, field, value)
 
     db.add(db_student)
-    db.commit()
-    db.refresh(db_student)
+    await db.commit()
+    await db.refresh(db_student)
+    if _name_index is not None:
+        _name_index.add(db_student.id, _student_names(db_student))
 
     return db_student
 
@@ -133,15 +546,17 @@ async def update_student(student_id: str, student_update: StudentUpdate, db: Ses
     summary="Delete a student record",
     dependencies=[Depends(admin_required)],
 )
-async def delete_student(student_id: str, db: Session = Depends(get_db)):
+async def delete_student(student_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     Delete a student record by ID.
     """
-    db_student = db.query(StudentDB).filter(StudentDB.student_id == student_id).first()
+    db_student = await _get_student(db, student_id)
     if db_student is None:
         raise HTTPException(status_code=404, detail="Student not found")
 
-    db.delete(db_student)
-    db.commit()
+    await db.delete(db_student)
+    await db.commit()
+    if _name_index is not None:
+        _name_index.remove(db_student.id)
 
     return {"ok": True}
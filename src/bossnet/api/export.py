@@ -0,0 +1,137 @@
+"""
+Streaming export
+================
+Encoders that turn batches of rows into CSV, NDJSON or Parquet byte chunks
+
+Each encoder consumes an async iterator of row batches (e.g. the partitions
+of a server-side cursor) and yields bytes per batch, so memory is bounded by
+the batch size rather than the result size.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def _plain(value: Any) -> Any:
+    """Value as written to text formats: enums by value, dates in ISO format"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def csv_chunks(columns: List[str], batches: AsyncIterator[Sequence[Sequence[Any]]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for batch in batches:
+        writer.writerows([_plain(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header of an empty result
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def ndjson_chunks(columns: List[str], batches: AsyncIterator[Sequence[Sequence[Any]]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        lines = [json.dumps(dict(zip(columns, map(_plain, row))), ensure_ascii=False, default=str) for row in batch]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _ChunkSink:
+    """Write-only file that hands out what was written since the last ``drain()``
+
+    ``ParquetWriter`` records byte offsets from ``tell()``, so the position
+    keeps counting across drains instead of restarting at zero.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def parquet_chunks(schema: pa.Schema, batches: AsyncIterator[Sequence[Sequence[Any]]]) -> AsyncIterator[bytes]:
+    """Parquet file with one row group per batch"""
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    try:
+        async for batch in batches:
+            columns = list(zip(*batch)) if batch else [[] for _ in schema]
+            arrays = [
+                pa.array([_parquet_value(value) for value in values], type=field.type)
+                for values, field in zip(columns, schema)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def _parquet_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip-compress a byte stream as it is produced"""
+    # wbits 31 selects the gzip container rather than raw zlib
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def arrow_schema(column_types: Dict[str, str]) -> pa.Schema:
+    """Arrow schema from ``{column: kind}`` with kinds int, float, bool, date, datetime or string"""
+    types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "date": pa.date32(),
+        "datetime": pa.timestamp("us", tz="UTC"),
+        "string": pa.string(),
+    }
+    return pa.schema([(column, types[kind]) for column, kind in column_types.items()])
@@ -0,0 +1,91 @@
+"""
+Pagination helpers
+==================
+Opaque keyset cursors and cheap totals for list endpoints
+"""
+
+import base64
+import json
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor that was not issued for this listing"""
+
+
+def encode_cursor(sort: str, sort_value: Any, row_id: int) -> str:
+    """Encode the position after ``(sort_value, row_id)`` as an opaque, URL-safe cursor"""
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps({"s": sort, "v": sort_value, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """Decode a cursor from ``encode_cursor`` into ``(sort_value, row_id)``
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for another sort order
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor_sort, sort_value, row_id = payload["s"], payload["v"], int(payload["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+    if cursor_sort != sort:
+        raise InvalidCursorError(f"Cursor was issued for sort '{cursor_sort}', not '{sort}'")
+    return sort_value, row_id
+
+
+class CountCache:
+    """Thread-safe cache of row counts per filter set, expiring after ``ttl`` seconds
+
+    Exact counts over filtered tables rescan every matching row, so listings
+    reuse a recent count for the same filters instead of recounting per page.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """Cached count for ``key``, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def put(self, key: Hashable, total: int):
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Drop the oldest entry rather than growing without bound
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic(), total)
+
+    async def get_or_count(self, key: Hashable, count: Callable[[], Awaitable[int]]) -> int:
+        """Cached count for ``key``, awaiting ``count()`` and caching its result when missing"""
+        total = self.get(key)
+        if total is None:
+            total = await count()
+            self.put(key, total)
+        return total
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def estimated_row_count(reltuples: Optional[float]) -> Optional[int]:
+    """Planner row estimate from ``pg_class.reltuples``, or None if the table was never analyzed"""
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
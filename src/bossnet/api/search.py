@@ -0,0 +1,167 @@
+"""
+Name search
+===========
+Trigram matching for ranked, prefix-aware name search
+
+PostgreSQL deployments search with ``pg_trgm``; ``NGramIndex`` implements the
+same trigram scheme in memory for databases without the extension.
+"""
+
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, List, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+# Runs of letters, digits and Bengali script; Bengali vowel signs are combining marks, not \w
+_WORD_PATTERN = re.compile(r"[\w\u0980-\u09ff]+")
+
+# Name expressions must match the indexes created by the name search migration
+PG_NAME_EXPRESSION = "lower(first_name || ' ' || last_name)"
+PG_NAME_BN_EXPRESSION = "(coalesce(first_name_bn, '') || ' ' || coalesce(last_name_bn, ''))"
+# Separators between name words for PostgreSQL's regexp functions, the complement of _WORD_PATTERN
+PG_WORD_SEPARATOR = "[^[:alnum:]_\u0980-\u09ff]+"
+
+
+def normalize_name(text: str) -> str:
+    """Compose, case-fold and collapse whitespace so equivalent spellings compare equal"""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def name_tokens(text: str) -> List[str]:
+    return _WORD_PATTERN.findall(normalize_name(text))
+
+
+def trigrams(text: str, prefix: bool = False) -> Set[str]:
+    """Trigrams of each word, padded like ``pg_trgm`` (two spaces before, one after)
+
+    With ``prefix`` the last word gets no trailing pad, so a partly typed
+    name ("rah") still matches every trigram of a longer one ("rahman").
+    """
+    grams = set()
+    words = name_tokens(text)
+    for index, word in enumerate(words):
+        padded = f"  {word}" if prefix and index == len(words) - 1 else f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NGramIndex:
+    """In-memory trigram index over the names of keyed records
+
+    Scores follow ``pg_trgm``'s ``word_similarity``: the share of the query's
+    trigrams found in the record. Records where every query word starts one
+    of their name words rank first, then by score.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._records: Dict[Hashable, Tuple[List[str], Set[str]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, key: Hashable, names: Iterable[str]):
+        """Index (or re-index) ``key`` under all of its non-empty ``names``"""
+        text = " ".join(name for name in names if name)
+        tokens, grams = name_tokens(text), trigrams(text)
+        with self._lock:
+            self._discard(key)
+            self._records[key] = (tokens, grams)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: Hashable):
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: Hashable):
+        record = self._records.pop(key, None)
+        if record is None:
+            return
+        for gram in record[1]:
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 20, threshold: float = 0.3) -> List[Tuple[Hashable, float, bool]]:
+        """Best matches for ``query`` as ``(key, score, prefix_match)``, best first"""
+        query_grams = trigrams(query, prefix=True)
+        query_tokens = name_tokens(query)
+        if not query_grams:
+            return []
+
+        with self._lock:
+            matches: Dict[Hashable, int] = {}
+            for gram in query_grams:
+                for key in self._postings.get(gram, ()):
+                    matches[key] = matches.get(key, 0) + 1
+
+            hits = []
+            for key, matched in matches.items():
+                score = matched / len(query_grams)
+                tokens = self._records[key][0]
+                prefix_match = all(any(token.startswith(word) for token in tokens) for word in query_tokens)
+                if prefix_match or score >= threshold:
+                    hits.append((key, score, prefix_match))
+
+        hits.sort(key=lambda hit: (not hit[2], -hit[1], str(hit[0])))
+        return hits[:limit]
+
+
+def _like_escape(word: str) -> str:
+    return word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@lru_cache(maxsize=32)
+def _pg_name_search_sql(word_count: int) -> TextClause:
+    names = f"lower(first_name || ' ' || last_name || ' ' || {PG_NAME_BN_EXPRESSION})"
+    starts_a_word = [
+        f"EXISTS (SELECT 1 FROM regexp_split_to_table({names}, :separator) AS token WHERE token LIKE :prefix_{i})"
+        for i in range(word_count)
+    ]
+    # Substring filters let the trigram indexes find prefix matches the similarity operator misses
+    contains = [
+        f"({PG_NAME_EXPRESSION} LIKE :contains_{i} OR {PG_NAME_BN_EXPRESSION} LIKE :contains_{i})" for i in range(word_count)
+    ]
+    similar = f":query <% {PG_NAME_EXPRESSION} OR :query <% {PG_NAME_BN_EXPRESSION}"
+    return text(
+        f"""
+        SELECT id, score, prefix_match
+        FROM (
+            SELECT id,
+                   GREATEST(
+                       word_similarity(:query, {PG_NAME_EXPRESSION}), word_similarity(:query, {PG_NAME_BN_EXPRESSION})
+                   ) AS score,
+                   ({" AND ".join(starts_a_word)}) AS prefix_match,
+                   ({similar}) AS is_similar
+            FROM students
+            WHERE {similar} OR ({" AND ".join(contains)})
+        ) AS candidates
+        WHERE is_similar OR prefix_match
+        ORDER BY prefix_match DESC, score DESC, id
+        LIMIT :limit
+        """
+    )
+
+
+def pg_name_search(query: str, limit: int) -> Tuple[TextClause, Dict[str, Any]]:
+    """``pg_trgm`` statement and parameters that rank students like ``NGramIndex.search``
+
+    A student is a prefix match when every query word starts one of their
+    name words; prefix matches are returned even below the similarity
+    threshold, which callers set through ``pg_trgm.word_similarity_threshold``.
+    The query must hold at least one word.
+    """
+    words = name_tokens(query)
+    params: Dict[str, Any] = {"query": normalize_name(query), "separator": PG_WORD_SEPARATOR, "limit": limit}
+    for i, word in enumerate(words):
+        params[f"prefix_{i}"] = _like_escape(word) + "%"
+        params[f"contains_{i}"] = "%" + _like_escape(word) + "%"
+    return _pg_name_search_sql(len(words)), params
@@ -5,8 +5,9 @@ ETL pipeline components for Bangladesh Education Data Warehouse
 """
 
 from .extractors import CSVExtractor, DatabaseExtractor, ExcelExtractor
-from .loaders import DatabaseLoader, ValidationLoader
+from .loaders import CopyLoader, DatabaseLoader, ValidationLoader
 from .pipeline import DataPipeline
+from .profiling import DataProfile
 from .transformers import SchoolDataTransformer, StudentDataTransformer
 from .validators import DataQualityValidator
 
@@ -18,6 +19,8 @@ __all__ = [
     "StudentDataTransformer",
     "SchoolDataTransformer",
     "DatabaseLoader",
+    "CopyLoader",
     "ValidationLoader",
     "DataQualityValidator",
+    "DataProfile",
 ]
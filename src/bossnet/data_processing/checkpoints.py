@@ -0,0 +1,209 @@
+"""
+Pipeline Checkpoints
+====================
+Durable per-batch progress so interrupted pipeline runs can resume
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, Text, create_engine, insert, select, update
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed from each end of a source file for its fingerprint
+FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
+
+checkpoint_metadata = MetaData()
+
+etl_pipeline_runs = Table(
+    "etl_pipeline_runs",
+    checkpoint_metadata,
+    Column("pipeline_id", String(255), primary_key=True),
+    Column("source_fingerprint", String(64), nullable=False),
+    Column("config", Text, nullable=False),
+    Column("status", String(32), nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+etl_batch_checkpoints = Table(
+    "etl_batch_checkpoints",
+    checkpoint_metadata,
+    Column("pipeline_id", String(255), primary_key=True),
+    Column("source_fingerprint", String(64), primary_key=True),
+    Column("batch_index", Integer, primary_key=True),
+    Column("status", String(32), nullable=False),  # in_progress, completed
+    Column("row_count", Integer, nullable=False, default=0),
+    Column("records_inserted", Integer, nullable=False, default=0),
+    Column("records_updated", Integer, nullable=False, default=0),
+    Column("records_unchanged", Integer, nullable=False, default=0),
+    Column("updated_at", DateTime, nullable=False),
+)
+
+
+def source_fingerprint(
+    source_type: str,
+    source_path: Optional[str] = None,
+    source_config: Optional[Dict] = None,
+    byte_range: Optional[Sequence[int]] = None,
+) -> str:
+    """Identify a pipeline source so checkpoints are never applied to different data
+
+    Files are fingerprinted by path, size, modification time and the first
+    and last megabyte of content; other sources by their configuration. A
+    ``byte_range`` narrows the fingerprint to one partition of the source.
+    """
+    digest = hashlib.sha256(source_type.encode("utf-8"))
+    if byte_range:
+        digest.update(f"bytes={byte_range[0]}-{byte_range[1]}".encode("utf-8"))
+
+    if source_path and os.path.isfile(source_path):
+        stat = os.stat(source_path)
+        digest.update(f"{os.path.abspath(source_path)}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        with open(source_path, "rb") as f:
+            digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+            if stat.st_size > FINGERPRINT_SAMPLE_BYTES:
+                f.seek(-min(FINGERPRINT_SAMPLE_BYTES, stat.st_size - FINGERPRINT_SAMPLE_BYTES), os.SEEK_END)
+                digest.update(f.read())
+    else:
+        digest.update(json.dumps({"path": source_path, "config": source_config}, sort_keys=True, default=str).encode())
+
+    return digest.hexdigest()
+
+
+class CheckpointStore:
+    """Per-batch load checkpoints in a SQLite or PostgreSQL table"""
+
+    def __init__(self, connection_string: str):
+        self.engine = create_engine(connection_string.replace("+asyncpg", ""))
+        self.logger = logging.getLogger(self.__class__.__name__)
+        checkpoint_metadata.create_all(self.engine)
+
+    def start_run(self, pipeline_id: str, fingerprint: str, config: Dict[str, Any]):
+        """Record a run, or mark an existing one as running again"""
+        now = datetime.now()
+        with self.engine.begin() as conn:
+            existing = conn.execute(
+                select(etl_pipeline_runs.c.source_fingerprint).where(etl_pipeline_runs.c.pipeline_id == pipeline_id)
+            ).first()
+
+            if existing is None:
+                conn.execute(
+                    insert(etl_pipeline_runs).values(
+                        pipeline_id=pipeline_id,
+                        source_fingerprint=fingerprint,
+                        config=json.dumps(config, default=str),
+                        status="running",
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+            elif existing.source_fingerprint != fingerprint:
+                raise ValueError(f"Source of pipeline {pipeline_id} changed since it was checkpointed; cannot resume")
+            else:
+                conn.execute(
+                    update(etl_pipeline_runs)
+                    .where(etl_pipeline_runs.c.pipeline_id == pipeline_id)
+                    .values(status="running", updated_at=now)
+                )
+
+    def finish_run(self, pipeline_id: str, status: str):
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(etl_pipeline_runs)
+                .where(etl_pipeline_runs.c.pipeline_id == pipeline_id)
+                .values(status=status, updated_at=datetime.now())
+            )
+
+    def get_run(self, pipeline_id: str) -> Optional[Dict[str, Any]]:
+        """Stored run with its original pipeline config, or None"""
+        with self.engine.connect() as conn:
+            row = conn.execute(select(etl_pipeline_runs).where(etl_pipeline_runs.c.pipeline_id == pipeline_id)).first()
+
+        if row is None:
+            return None
+
+        run = dict(row._mapping)
+        run["config"] = json.loads(run["config"])
+        return run
+
+    def completed_batches(self, pipeline_id: str, fingerprint: str) -> Dict[int, Dict[str, int]]:
+        """Counters of every completed batch, keyed by batch index"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(etl_batch_checkpoints).where(
+                    etl_batch_checkpoints.c.pipeline_id == pipeline_id,
+                    etl_batch_checkpoints.c.source_fingerprint == fingerprint,
+                    etl_batch_checkpoints.c.status == "completed",
+                )
+            ).all()
+
+        return {
+            row.batch_index: {
+                "rows": row.row_count,
+                "inserted": row.records_inserted,
+                "updated": row.records_updated,
+                "unchanged": row.records_unchanged,
+            }
+            for row in rows
+        }
+
+    def claim_batch(self, pipeline_id: str, fingerprint: str, batch_index: int) -> bool:
+        """Idempotency guard: claim a batch for loading unless it is already completed
+
+        A batch left ``in_progress`` by a crashed run is claimed again; loads
+        are upserts, so replaying a partially written batch is safe.
+        """
+        key = (
+            (etl_batch_checkpoints.c.pipeline_id == pipeline_id)
+            & (etl_batch_checkpoints.c.source_fingerprint == fingerprint)
+            & (etl_batch_checkpoints.c.batch_index == batch_index)
+        )
+
+        with self.engine.begin() as conn:
+            status = conn.execute(select(etl_batch_checkpoints.c.status).where(key)).scalar()
+
+            if status == "completed":
+                return False
+            if status is None:
+                conn.execute(
+                    insert(etl_batch_checkpoints).values(
+                        pipeline_id=pipeline_id,
+                        source_fingerprint=fingerprint,
+                        batch_index=batch_index,
+                        status="in_progress",
+                        updated_at=datetime.now(),
+                    )
+                )
+            else:
+                conn.execute(update(etl_batch_checkpoints).where(key).values(updated_at=datetime.now()))
+
+        return True
+
+    def complete_batch(self, pipeline_id: str, fingerprint: str, batch_index: int, row_count: int, counts: Dict[str, Any]):
+        """Mark a claimed batch as durably loaded"""
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(etl_batch_checkpoints)
+                .where(
+                    (etl_batch_checkpoints.c.pipeline_id == pipeline_id)
+                    & (etl_batch_checkpoints.c.source_fingerprint == fingerprint)
+                    & (etl_batch_checkpoints.c.batch_index == batch_index)
+                )
+                .values(
+                    status="completed",
+                    row_count=row_count,
+                    records_inserted=counts.get("inserted", 0),
+                    records_updated=counts.get("updated", 0),
+                    records_unchanged=counts.get("unchanged", 0),
+                    updated_at=datetime.now(),
+                )
+            )
+
+    def dispose(self):
+        self.engine.dispose()
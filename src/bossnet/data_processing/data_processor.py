@@ -6,13 +6,23 @@ including BANBEIS, Education Board, and other institutional data sources.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from dotenv import load_dotenv
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -21,43 +31,95 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+def _read_csv_file(file_path: str, engine: str = CSV_ENGINE) -> Tuple[str, Optional[pd.DataFrame], Optional[str]]:
+    """Read a single CSV file, returning the error instead of raising.
+
+    Runs inside worker processes, so it must stay a picklable module-level function.
+    """
+    try:
+        return file_path, _read_csv(file_path, engine), None
+    except Exception as e:
+        return file_path, None, str(e)
+
+
+def _read_csv(file_path: str, engine: str) -> pd.DataFrame:
+    """Read a CSV file into the dtypes the C engine infers.
+
+    pyarrow also infers ISO dates and timestamps, which the C engine leaves as
+    text for ``clean_student_data`` to parse. pandas' pyarrow engine only
+    applies ``dtype`` after parsing, so those columns are pinned to strings
+    in the arrow read itself.
+    """
+    if engine != "pyarrow":
+        return pd.read_csv(file_path, engine=engine)
+
+    # The streaming reader infers types from the first block only, so this is cheap
+    with pa_csv.open_csv(file_path) as reader:
+        schema = reader.schema
+    text_columns = {field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)}
+
+    convert_options = pa_csv.ConvertOptions(column_types=text_columns, strings_can_be_null=True)
+    return pa_csv.read_csv(file_path, convert_options=convert_options).to_pandas()
+
+
 class DataProcessor:
     """Core class for processing educational data."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, max_workers: Optional[int] = None):
         """Initialize the DataProcessor.
 
         Args:
             config_path (str, optional): Path to configuration file
+            max_workers (int, optional): Worker processes used to read source files.
+                Defaults to the number of CPUs; 1 reads files sequentially.
         """
         self.raw_data_path = Path("raw_data")
         self.processed_data_path = Path("processed_data")
+        self.max_workers = max_workers
+        self.load_errors: Dict[str, str] = {}
         self.logger = logging.getLogger(__name__)
 
         # Ensure required directories exist
         self.processed_data_path.mkdir(exist_ok=True)
         self.raw_data_path.mkdir(exist_ok=True)
 
-    def load_student_data(self, source: str) -> pd.DataFrame:
+    def load_student_data(self, source: str, max_workers: Optional[int] = None) -> pd.DataFrame:
         """Load student data from specified source.
 
+        Files are read in parallel across a process pool. Files that fail to
+        parse are skipped and recorded in ``self.load_errors`` (path -> error).
+
         Args:
             source (str): Data source identifier ('banbeis', 'education_board', etc.)
+            max_workers (int, optional): Overrides the processor's worker count
 
         Returns:
-            pd.DataFrame: Loaded student data
+            pd.DataFrame: Loaded student data, in file name order
         """
         source_path = self.raw_data_path / source
         if not source_path.exists():
             raise FileNotFoundError(f"Data source directory not found: {source_path}")
 
+        files = sorted(str(file) for file in source_path.glob("*.csv"))
+        workers = max_workers or self.max_workers or os.cpu_count() or 1
+        workers = min(workers, len(files)) or 1
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_read_csv_file, files))
+        else:
+            results = [_read_csv_file(file) for file in files]
+
         dfs = []
-        for file in source_path.glob("*.csv"):
-            try:
-                df = pd.read_csv(file)
+        self.load_errors = {}
+        for file, df, error in results:
+            if error is not None:
+                self.load_errors[file] = error
+            else:
                 dfs.append(df)
-            except Exception as e:
-                self.logger.error(f"Error loading file {file}: {str(e)}")
+
+        if self.load_errors:
+            self.logger.warning(f"{len(self.load_errors)} of {len(files)} files in {source_path} could not be loaded")
 
         if not dfs:
             raise ValueError(f"No valid data files found in {source_path}")
@@ -5,21 +5,73 @@ Extract data from various sources (CSV, Excel, Database, APIs)
 """
 
 import asyncio
+import io
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 
 import aiofiles
 import aiohttp
 import openpyxl
 import pandas as pd
 from pydantic import BaseModel, Field, validator
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy import Column, DateTime, MetaData, String, Table, Text, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from src.data_processing.schemas import TableSchema, concat_typed
 
 logger = logging.getLogger(__name__)
 
+# High-water marks for incremental database extraction, one row per source
+watermark_metadata = MetaData()
+etl_watermarks = Table(
+    "etl_watermarks",
+    watermark_metadata,
+    Column("source_name", String(255), primary_key=True),
+    Column("watermark_column", String(255), nullable=False),
+    Column("watermark_value", Text, nullable=False),
+    Column("key_value", Text, nullable=True),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now(), onupdate=func.now()),
+)
+
+
+def read_csv_header(file_path: Union[str, Path], skip_rows: int = 0) -> Tuple[bytes, int]:
+    """Return the CSV header line and the byte offset where data rows start"""
+    with open(file_path, "rb") as f:
+        for _ in range(skip_rows):
+            f.readline()
+        header = f.readline()
+        return header, f.tell()
+
+
+def plan_csv_byte_ranges(file_path: Union[str, Path], partition_size_bytes: int, skip_rows: int = 0) -> List[Tuple[int, int]]:
+    """Split a CSV file into ``[start, end)`` byte ranges aligned to line starts
+
+    Each range holds whole rows, so it can be parsed on its own with the
+    header prepended. Rows must not contain quoted embedded newlines.
+    """
+    _, data_start = read_csv_header(file_path, skip_rows)
+    size = os.path.getsize(file_path)
+    boundaries = [data_start]
+
+    with open(file_path, "rb") as f:
+        offset = data_start
+        while offset + partition_size_bytes < size:
+            f.seek(offset + partition_size_bytes)
+            f.readline()  # Advance to the start of the next line
+            offset = f.tell()
+            if offset >= size:
+                break
+            boundaries.append(offset)
+
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
 
 class ExtractionResult(BaseModel):
     """Result of data extraction"""
@@ -37,6 +89,13 @@ class BaseExtractor(ABC):
     def __init__(self, source_config: Dict[str, Any]):
         self.source_config = source_config
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Explicit dtypes for the extracted columns (categoricals, Arrow strings), if configured
+        self.schema: Optional[TableSchema] = source_config.get("schema")
+
+    @property
+    def read_dtypes(self) -> Optional[Dict[str, Any]]:
+        """``dtype=`` argument for pandas readers, or None to let pandas infer"""
+        return self.schema.read_dtypes() if self.schema else None
 
     @abstractmethod
     async def extract(self) -> pd.DataFrame:
@@ -48,6 +107,20 @@ class BaseExtractor(ABC):
         """Validate that the data source is accessible"""
         pass
 
+    async def commit(self):
+        """Persist extraction progress once the extracted data has been loaded"""
+        pass
+
+    async def extract_chunks(self, chunk_size: int) -> AsyncIterator[pd.DataFrame]:
+        """Yield the source as DataFrame chunks of at most ``chunk_size`` rows.
+
+        The default implementation extracts everything and slices it; extractors
+        that can read incrementally override this to keep memory bounded.
+        """
+        df = await self.extract()
+        for i in range(0, len(df), chunk_size):
+            yield df.iloc[i : i + chunk_size]
+
 
 class CSVExtractor(BaseExtractor):
     """Extract data from CSV files"""
@@ -59,6 +132,20 @@ class CSVExtractor(BaseExtractor):
         self.delimiter = kwargs.get("delimiter", ",")
         self.skip_rows = kwargs.get("skip_rows", 0)
         self.chunk_size = kwargs.get("chunk_size", 10000)
+        # [start, end) byte range of data rows to read, for partitioned runs
+        self.byte_range: Optional[Tuple[int, int]] = tuple(kwargs["byte_range"]) if kwargs.get("byte_range") else None
+
+    def _read_source(self) -> Tuple[Union[Path, io.BytesIO], int]:
+        """Return what to hand to ``pd.read_csv`` and how many leading rows to skip"""
+        if not self.byte_range:
+            return self.file_path, self.skip_rows
+
+        header, _ = read_csv_header(self.file_path, self.skip_rows)
+        start, end = self.byte_range
+        with open(self.file_path, "rb") as f:
+            f.seek(start)
+            body = f.read(end - start)
+        return io.BytesIO(header + body), 0
 
     async def validate_source(self) -> bool:
         """Check if CSV file exists and is readable"""
@@ -95,14 +182,16 @@ class CSVExtractor(BaseExtractor):
             # Read CSV in chunks for large files
             chunks = []
             chunk_count = 0
+            source, skip_rows = self._read_source()
 
             for chunk in pd.read_csv(
-                self.file_path,
+                source,
                 encoding=self.encoding,
                 delimiter=self.delimiter,
-                skiprows=self.skip_rows,
+                skiprows=skip_rows,
                 chunksize=self.chunk_size,
                 low_memory=False,
+                dtype=self.read_dtypes,
             ):
                 chunks.append(chunk)
                 chunk_count += 1
@@ -110,7 +199,7 @@ class CSVExtractor(BaseExtractor):
 
             # Combine all chunks
             if chunks:
-                df = pd.concat(chunks, ignore_index=True)
+                df = concat_typed(chunks)
                 self.logger.info(f"Successfully extracted {len(df)} records from CSV")
                 return df
             else:
@@ -121,6 +210,27 @@ class CSVExtractor(BaseExtractor):
             self.logger.error(f"Error extracting from CSV: {str(e)}")
             raise
 
+    async def extract_chunks(self, chunk_size: int) -> AsyncIterator[pd.DataFrame]:
+        """Stream the CSV file chunk by chunk without concatenating"""
+        if not await self.validate_source():
+            raise ValueError(f"Invalid CSV source: {self.file_path}")
+
+        self.logger.info(f"Streaming data from CSV: {self.file_path}")
+        source, skip_rows = self._read_source()
+
+        for chunk in pd.read_csv(
+            source,
+            encoding=self.encoding,
+            delimiter=self.delimiter,
+            skiprows=skip_rows,
+            chunksize=chunk_size,
+            low_memory=False,
+            dtype=self.read_dtypes,
+        ):
+            yield chunk
+            # Give other tasks a chance to run between chunks
+            await asyncio.sleep(0)
+
 
 class ExcelExtractor(BaseExtractor):
     """Extract data from Excel files"""
@@ -165,7 +275,13 @@ class ExcelExtractor(BaseExtractor):
             self.logger.info(f"Extracting data from Excel: {self.file_path}")
 
             # Read Excel file
-            df = pd.read_excel(self.file_path, sheet_name=self.sheet_name, header=self.header_row, skiprows=self.skip_rows)
+            df = pd.read_excel(
+                self.file_path,
+                sheet_name=self.sheet_name,
+                header=self.header_row,
+                skiprows=self.skip_rows,
+                dtype=self.read_dtypes,
+            )
 
             self.logger.info(f"Successfully extracted {len(df)} records from Excel")
             return df
@@ -185,58 +301,60 @@ class DatabaseExtractor(BaseExtractor):
         self.table_name = connection_config.get("table_name")
         self.chunk_size = connection_config.get("chunk_size", 10000)
 
+        # Incremental extraction: only rows beyond the stored high-water mark
+        self.incremental_column = connection_config.get("incremental_column")
+        self.key_column = connection_config.get("key_column", "id")
+        self.source_name = connection_config.get("source_name", self.table_name)
+        self.state_connection_string = connection_config.get("state_connection_string", self.connection_string)
+        self._start_watermark: Optional[Tuple[Any, Any]] = None
+        self._pending_watermark: Optional[Tuple[Any, Any]] = None
+        self._engine: Optional[AsyncEngine] = None
+
         if not self.connection_string:
             raise ValueError("Database connection string is required")
 
         if not (self.query or self.table_name):
             raise ValueError("Either query or table_name must be provided")
 
+        if self.incremental_column and not self.table_name:
+            raise ValueError("Incremental extraction requires table_name")
+
+    def _get_engine(self) -> AsyncEngine:
+        """Async engine shared by validation and extraction within one call"""
+        if self._engine is None:
+            self._engine = create_async_engine(_async_url(self.connection_string))
+        return self._engine
+
+    async def _dispose_engine(self):
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
     async def validate_source(self) -> bool:
         """Test database connection"""
         try:
-            engine = create_async_engine(self.connection_string)
-
-            async with engine.begin() as conn:
+            async with self._get_engine().connect() as conn:
                 # Test connection with simple query
-                result = await conn.execute(text("SELECT 1"))
-                await result.fetchone()
+                await conn.execute(text("SELECT 1"))
 
-            await engine.dispose()
             return True
 
         except Exception as e:
             self.logger.error(f"Database connection failed: {str(e)}")
+            await self._dispose_engine()
             return False
 
     async def extract(self) -> pd.DataFrame:
         """Extract data from database"""
         try:
-            if not await self.validate_source():
-                raise ValueError("Invalid database source")
-
-            # Build query
-            if self.query:
-                query = self.query
-            else:
-                query = f"SELECT * FROM {self.table_name}"
-
-            self.logger.info(f"Extracting data from database with query: {query[:100]}...")
-
-            # Use synchronous engine for pandas compatibility
-            sync_connection_string = self.connection_string.replace("+asyncpg", "")
-            engine = create_engine(sync_connection_string)
-
-            # Read data in chunks
             chunks = []
-            for chunk in pd.read_sql(query, engine, chunksize=self.chunk_size):
+            async for chunk in self.extract_chunks(self.chunk_size):
                 chunks.append(chunk)
                 self.logger.debug(f"Read chunk with {len(chunk)} records")
 
-            engine.dispose()
-
             # Combine chunks
             if chunks:
-                df = pd.concat(chunks, ignore_index=True)
+                df = concat_typed(chunks)
                 self.logger.info(f"Successfully extracted {len(df)} records from database")
                 return df
             else:
@@ -247,10 +365,228 @@ class DatabaseExtractor(BaseExtractor):
             self.logger.error(f"Error extracting from database: {str(e)}")
             raise
 
+    async def extract_chunks(self, chunk_size: int) -> AsyncIterator[pd.DataFrame]:
+        """Stream query results through a server-side cursor.
+
+        Rows are fetched ``chunk_size`` at a time from the async engine that
+        :meth:`validate_source` already opened; nothing is buffered beyond the
+        current chunk.
+        """
+        if not await self.validate_source():
+            raise ValueError("Invalid database source")
+
+        try:
+            if self.incremental_column:
+                async for chunk in self._iter_incremental(chunk_size):
+                    yield self.schema.apply_read_dtypes(chunk) if self.schema else chunk
+                return
+
+            query = self.query or f"SELECT * FROM {self.table_name}"
+            self.logger.info(f"Streaming data from database with query: {query[:100]}...")
+
+            async with self._get_engine().connect() as conn:
+                result = await conn.stream(text(query), execution_options={"yield_per": chunk_size})
+                columns = list(result.keys())
+
+                async for rows in result.partitions(chunk_size):
+                    # coerce_float turns NUMERIC's Decimal values into floats, as pd.read_sql did
+                    chunk = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+                    yield self.schema.apply_read_dtypes(chunk) if self.schema else chunk
+
+        finally:
+            await self._dispose_engine()
+
+    async def _iter_incremental(self, chunk_size: int) -> AsyncIterator[pd.DataFrame]:
+        """Yield rows beyond the stored watermark using keyset pagination.
+
+        Each page is ``WHERE (col, key) > (:last_col, :last_key) ORDER BY col, key
+        LIMIT chunk_size``, so every page is an index range scan rather than an
+        ever-growing offset. The new watermark is only held in memory until
+        :meth:`commit` is called.
+        """
+        self._start_watermark = await self._read_watermark()
+        self._pending_watermark = None
+
+        async with self._get_engine().connect() as conn:
+            last = await self._typed_watermark(conn, self._start_watermark)
+            while True:
+                query, params = self._keyset_query(last, chunk_size)
+                result = await conn.execute(text(query), params)
+                rows = result.fetchall()
+                if not rows:
+                    break
+
+                self.logger.debug(f"Read incremental page with {len(rows)} records")
+                yield pd.DataFrame.from_records(rows, columns=list(result.keys()), coerce_float=True)
+
+                last_row = rows[-1]._mapping
+                last = (last_row[self.incremental_column], last_row[self.key_column])
+                self._pending_watermark = last
+
+                if len(rows) < chunk_size:
+                    break
+
+    async def _typed_watermark(self, conn: AsyncConnection, watermark: Optional[Tuple[Any, Any]]) -> Optional[Tuple[Any, Any]]:
+        """Convert a stored watermark back to the Python types of its columns
+
+        The state table keeps watermarks as text, which strictly typed drivers
+        (asyncpg) refuse to compare with timestamp or integer columns, so one
+        sample row decides what each component is parsed into.
+        """
+        if watermark is None:
+            return None
+
+        sample = (
+            await conn.execute(text(f"SELECT {self.incremental_column}, {self.key_column} FROM {self.table_name} LIMIT 1"))
+        ).first()
+        if sample is None:
+            return watermark
+        return tuple(_from_watermark_text(value, like) for value, like in zip(watermark, sample))
+
+    def _keyset_query(self, last: Optional[Tuple[Any, Any]], limit: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+        """Build the next keyset page query after ``last`` (watermark, key), ``limit`` rows long (default ``chunk_size``)"""
+        single_key = self.incremental_column == self.key_column
+        order_by = self.incremental_column if single_key else f"{self.incremental_column}, {self.key_column}"
+        params: Dict[str, Any] = {"limit": limit or self.chunk_size}
+        where = ""
+
+        if last is not None:
+            if single_key or last[1] is None:
+                where = f"WHERE {self.incremental_column} > :last_value"
+                params["last_value"] = last[0]
+            else:
+                where = f"WHERE ({self.incremental_column}, {self.key_column}) > (:last_value, :last_key)"
+                params.update(last_value=last[0], last_key=last[1])
+
+        return f"SELECT * FROM {self.table_name} {where} ORDER BY {order_by} LIMIT :limit", params
+
+    @asynccontextmanager
+    async def _state_transaction(self) -> AsyncIterator[AsyncConnection]:
+        """Transaction on the watermark store, on the source engine unless the state lives elsewhere"""
+        if self.state_connection_string == self.connection_string:
+            async with self._get_engine().begin() as conn:
+                yield conn
+            return
+
+        engine = create_async_engine(_async_url(self.state_connection_string))
+        try:
+            async with engine.begin() as conn:
+                yield conn
+        finally:
+            await engine.dispose()
+
+    async def _read_watermark(self) -> Optional[Tuple[Any, Any]]:
+        """Read the stored high-water mark for this source"""
+        async with self._state_transaction() as conn:
+            await conn.run_sync(watermark_metadata.create_all, tables=[etl_watermarks])
+            row = (
+                await conn.execute(
+                    select(etl_watermarks.c.watermark_value, etl_watermarks.c.key_value).where(
+                        etl_watermarks.c.source_name == self.source_name
+                    )
+                )
+            ).first()
+
+        return (row.watermark_value, row.key_value) if row else None
+
+    async def commit(self):
+        """Advance the stored watermark to the last extracted row.
+
+        The update is conditional on the watermark still holding the value read
+        at extraction start, so a concurrent run cannot be silently overwritten.
+        """
+        if not self.incremental_column or self._pending_watermark is None:
+            return
+
+        value, key = (_watermark_text(v) for v in self._pending_watermark)
+        try:
+            async with self._state_transaction() as conn:
+                if self._start_watermark is None:
+                    await conn.execute(
+                        insert(etl_watermarks).values(
+                            source_name=self.source_name,
+                            watermark_column=self.incremental_column,
+                            watermark_value=value,
+                            key_value=key,
+                        )
+                    )
+                else:
+                    start_value, start_key = self._start_watermark
+                    result = await conn.execute(
+                        update(etl_watermarks)
+                        .where(
+                            etl_watermarks.c.source_name == self.source_name,
+                            etl_watermarks.c.watermark_value == start_value,
+                            etl_watermarks.c.key_value.is_not_distinct_from(start_key),
+                        )
+                        .values(watermark_column=self.incremental_column, watermark_value=value, key_value=key)
+                    )
+                    if result.rowcount != 1:
+                        raise RuntimeError(f"Watermark for {self.source_name} was advanced by another run")
+        finally:
+            # Extraction has finished by now, so the source engine is only open for this update
+            await self._dispose_engine()
+
+        self.logger.info(f"Advanced watermark for {self.source_name} to {value}")
+        self._start_watermark = (value, key)
+        self._pending_watermark = None
+
+
+def _async_url(connection_string: str) -> str:
+    """Connection string with an async driver, asyncpg for plain ``postgresql://`` URLs"""
+    if connection_string.startswith("postgresql://"):
+        return connection_string.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return connection_string
+
+
+def _watermark_text(value: Any) -> Optional[str]:
+    """Serialise a watermark component for the state table"""
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _from_watermark_text(value: Optional[str], like: Any) -> Any:
+    """Parse a stored watermark component into the type of ``like``, a value from the same column"""
+    if value is None or like is None or isinstance(like, str):
+        return value
+    if isinstance(like, datetime):
+        return datetime.fromisoformat(value)
+    if isinstance(like, date):
+        return date.fromisoformat(value)
+    return type(like)(value)
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared by concurrent requests"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 
 class APIExtractor(BaseExtractor):
     """Extract data from REST APIs"""
 
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
     def __init__(self, api_config: Dict[str, Any]):
         super().__init__(api_config)
         self.base_url = api_config.get("base_url")
@@ -259,6 +595,12 @@ class APIExtractor(BaseExtractor):
         self.auth_token = api_config.get("auth_token")
         self.timeout = api_config.get("timeout", 30)
         self.rate_limit = api_config.get("rate_limit", 10)  # requests per second
+        self.max_concurrency = api_config.get("max_concurrency", 5)
+        self.max_retries = api_config.get("max_retries", 3)
+        self.backoff_factor = api_config.get("backoff_factor", 0.5)  # seconds, doubled per retry
+        self.max_pages = api_config.get("max_pages", 1000)  # per endpoint
+        self.cursor_param = api_config.get("cursor_param", "cursor")
+        self.page_param = api_config.get("page_param", "page")
 
         if self.auth_token:
             self.headers["Authorization"] = f"Bearer {self.auth_token}"
@@ -278,42 +620,22 @@ class APIExtractor(BaseExtractor):
             return False
 
     async def extract(self) -> pd.DataFrame:
-        """Extract data from API endpoints"""
+        """Extract data from all endpoints concurrently, following pagination"""
         try:
             if not await self.validate_source():
                 raise ValueError("Invalid API source")
 
-            all_data = []
+            limiter = TokenBucket(self.rate_limit)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
 
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                for endpoint in self.endpoints:
-                    url = f"{self.base_url}{endpoint}" if self.base_url else endpoint
-                    self.logger.info(f"Extracting data from API: {url}")
-
-                    try:
-                        async with session.get(url, headers=self.headers) as response:
-                            if response.status == 200:
-                                data = await response.json()
-
-                                # Handle different response formats
-                                if isinstance(data, list):
-                                    all_data.extend(data)
-                                elif isinstance(data, dict):
-                                    if "data" in data:
-                                        all_data.extend(data["data"])
-                                    elif "results" in data:
-                                        all_data.extend(data["results"])
-                                    else:
-                                        all_data.append(data)
-
-                            else:
-                                self.logger.error(f"API request failed: {response.status}")
-
-                    except Exception as e:
-                        self.logger.error(f"Error fetching from {url}: {str(e)}")
-
-                    # Rate limiting
-                    await asyncio.sleep(1.0 / self.rate_limit)
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout), headers=self.headers, connector=connector
+            ) as session:
+                urls = [f"{self.base_url}{endpoint}" if self.base_url else endpoint for endpoint in self.endpoints]
+                results = await asyncio.gather(*[self._fetch_endpoint(session, url, limiter, semaphore) for url in urls])
+
+            all_data = [record for records in results for record in records]
 
             if all_data:
                 df = pd.DataFrame(all_data)
@@ -327,6 +649,112 @@ class APIExtractor(BaseExtractor):
             self.logger.error(f"Error extracting from API: {str(e)}")
             raise
 
+    async def _fetch_endpoint(
+        self, session: aiohttp.ClientSession, url: str, limiter: TokenBucket, semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Fetch every page of one endpoint"""
+        self.logger.info(f"Extracting data from API: {url}")
+        records: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {}
+
+        for page in range(self.max_pages):
+            try:
+                data, next_link = await self._get_json(session, url, params, limiter, semaphore)
+            except Exception as e:
+                self.logger.error(f"Error fetching from {url}: {str(e)}")
+                break
+
+            if data is None:
+                break
+
+            records.extend(self._parse_records(data))
+
+            next_request = self._next_page(url, params, data, next_link)
+            if next_request is None:
+                break
+            url, params = next_request
+        else:
+            self.logger.warning(f"Stopped after {self.max_pages} pages of {url}")
+
+        return records
+
+    async def _get_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Dict[str, Any],
+        limiter: TokenBucket,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[Any, Optional[str]]:
+        """GET a JSON page, retrying with backoff on 429/5xx and connection errors.
+
+        Returns the decoded body and the ``Link: rel="next"`` URL if present, or
+        ``(None, None)`` when the request ultimately fails.
+        """
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            delay = self.backoff_factor * (2**attempt)
+
+            try:
+                async with semaphore:
+                    async with session.get(url, params=params) as response:
+                        if response.status == 200:
+                            next_link = response.links.get("next")
+                            return await response.json(), str(next_link["url"]) if next_link else None
+
+                        if response.status not in self.RETRY_STATUSES or attempt == self.max_retries:
+                            self.logger.error(f"API request failed: {response.status}")
+                            return None, None
+
+                        retry_after = response.headers.get("Retry-After")
+                        if retry_after and retry_after.replace(".", "", 1).isdigit():
+                            delay = float(retry_after)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise
+                self.logger.warning(f"Request to {url} failed ({str(e)}), retrying")
+
+            self.logger.debug(f"Retrying {url} in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(delay)
+
+        return None, None
+
+    def _parse_records(self, data: Any) -> List[Dict[str, Any]]:
+        """Handle different response formats"""
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            if "data" in data:
+                return data["data"]
+            if "results" in data:
+                return data["results"]
+            return [data]
+        return []
+
+    def _next_page(
+        self, url: str, params: Dict[str, Any], data: Any, next_link: Optional[str]
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Work out the next page request from a Link header, next URL, cursor or page counter"""
+        if next_link:
+            return urljoin(url, next_link), {}
+
+        if not isinstance(data, dict):
+            return None
+
+        if isinstance(data.get("next"), str) and data["next"]:
+            return urljoin(url, data["next"]), {}
+
+        cursor = data.get("next_cursor")
+        if cursor:
+            return url, {**params, self.cursor_param: cursor}
+
+        page, total_pages = data.get("page"), data.get("total_pages")
+        if isinstance(page, int) and isinstance(total_pages, int) and page < total_pages:
+            return url, {**params, self.page_param: page + 1}
+
+        return None
+
 
 # Factory function to create extractors
 def create_extractor(source_type: str, **kwargs) -> BaseExtractor:
@@ -0,0 +1,264 @@
+"""
+Pipeline Instrumentation
+========================
+Per-stage timings, throughput and resource counters for pipeline runs
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Stages in pipeline order; also the thread lanes of the JSON trace
+PIPELINE_STAGES = ["extract", "transform", "validate", "load"]
+
+# Trace events kept per run; stage totals keep counting past this
+MAX_TRACE_EVENTS = 100_000
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process so far, or 0 if unknown"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+class StageMetrics:
+    """Accumulated counters for one pipeline stage and its steps"""
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.calls = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.bytes_read = 0
+        self.db_round_trips = 0
+        self.peak_rss_bytes = 0
+        self.steps: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def add_step(self, step: str, seconds: float, calls: int = 1):
+        entry = self.steps.setdefault(step, {"calls": 0, "seconds": 0.0})
+        entry["calls"] += calls
+        entry["seconds"] += seconds
+
+    def merge(self, other: Dict[str, Any]):
+        """Fold in another run's ``to_dict`` output, e.g. from a fan-out partition"""
+        self.calls += other.get("calls", 0)
+        self.rows += other.get("rows", 0)
+        self.seconds += other.get("seconds", 0.0)
+        self.bytes_read += other.get("bytes_read", 0)
+        self.db_round_trips += other.get("db_round_trips", 0)
+        self.peak_rss_bytes = max(self.peak_rss_bytes, other.get("peak_rss_bytes", 0))
+        for step, entry in other.get("steps", {}).items():
+            self.add_step(step, entry.get("seconds", 0.0), entry.get("calls", 1))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "rows": self.rows,
+            "seconds": self.seconds,
+            "rows_per_second": self.rows_per_second,
+            "bytes_read": self.bytes_read,
+            "db_round_trips": self.db_round_trips,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "steps": {step: dict(entry) for step, entry in self.steps.items()},
+        }
+
+
+class PipelineInstrumentation:
+    """Collects stage metrics and a timeline of spans for one pipeline run
+
+    Spans are recorded with ``stage()`` (or ``record()`` when the timed work
+    cannot be wrapped in a block) and summed per stage; finer-grained timings
+    collected elsewhere, such as transformer steps or validation rules, are
+    folded in with ``add_steps()``. Results are exported as a dict for
+    ``PipelineResult``, as Prometheus/OpenMetrics text and as a JSON trace in
+    Chrome trace-event format (viewable in Perfetto or chrome://tracing).
+    """
+
+    def __init__(self, pipeline_id: str):
+        self.pipeline_id = pipeline_id
+        self.stages: Dict[str, StageMetrics] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.dropped_events = 0
+        self._origin = time.perf_counter()
+
+    def _stage_metrics(self, stage: str) -> StageMetrics:
+        if stage not in self.stages:
+            self.stages[stage] = StageMetrics(stage)
+        return self.stages[stage]
+
+    @contextmanager
+    def stage(self, stage: str, name: Optional[str] = None, rows: int = 0, **counters) -> Iterator[Dict[str, Any]]:
+        """Time the enclosed block as one span of ``stage``
+
+        Yields a dict whose ``rows``, ``bytes_read`` and ``db_round_trips``
+        may be updated inside the block once they are known. Failed blocks
+        are recorded too, so their time is not lost from the stage total.
+        """
+        span = {"rows": rows, **counters}
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            self.record(stage, start, name=name, **span)
+
+    def record(
+        self,
+        stage: str,
+        start: float,
+        end: Optional[float] = None,
+        name: Optional[str] = None,
+        rows: int = 0,
+        bytes_read: int = 0,
+        db_round_trips: int = 0,
+    ):
+        """Record a span of ``stage`` that began at ``start`` (a ``time.perf_counter()`` value)"""
+        end = time.perf_counter() if end is None else end
+        metrics = self._stage_metrics(stage)
+        metrics.calls += 1
+        metrics.rows += rows
+        metrics.seconds += end - start
+        metrics.bytes_read += bytes_read
+        metrics.db_round_trips += db_round_trips
+        metrics.peak_rss_bytes = max(metrics.peak_rss_bytes, peak_rss_bytes())
+
+        if len(self.events) >= MAX_TRACE_EVENTS:
+            self.dropped_events += 1
+            return
+
+        self.events.append(
+            {
+                "name": name or stage,
+                "cat": stage,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6),
+                "dur": round((end - start) * 1e6),
+                "pid": os.getpid(),
+                "tid": PIPELINE_STAGES.index(stage) if stage in PIPELINE_STAGES else len(PIPELINE_STAGES),
+                "args": {"rows": rows, "bytes_read": bytes_read, "db_round_trips": db_round_trips},
+            }
+        )
+
+    def add_bytes_read(self, stage: str, bytes_read: int):
+        self._stage_metrics(stage).bytes_read += bytes_read
+
+    def add_steps(self, stage: str, timings: Dict[str, Dict[str, Any]]):
+        """Fold per-step timings (``{step: {"seconds": ..., "calls": ...}}``) into ``stage``"""
+        if not timings:
+            return
+        metrics = self._stage_metrics(stage)
+        for step, timing in timings.items():
+            metrics.add_step(step, timing["seconds"], timing.get("calls", 1))
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Stage metrics keyed by stage name, in pipeline order"""
+        order = {stage: index for index, stage in enumerate(PIPELINE_STAGES)}
+        ordered = sorted(self.stages.values(), key=lambda metrics: order.get(metrics.stage, len(order)))
+        return {metrics.stage: metrics.to_dict() for metrics in ordered}
+
+    def to_prometheus(self, openmetrics: bool = False) -> str:
+        """Render the stage metrics in Prometheus text (or OpenMetrics) exposition format"""
+        return render_prometheus(self.to_dict(), {"pipeline_id": self.pipeline_id}, openmetrics=openmetrics)
+
+    def write_metrics(self, path: str, openmetrics: bool = False):
+        """Write the Prometheus text exposition, e.g. for node_exporter's textfile collector"""
+        _write_atomically(path, self.to_prometheus(openmetrics=openmetrics))
+
+    def write_trace(self, path: str):
+        """Write the run's spans as a Chrome trace-event JSON file"""
+        trace = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "pipeline_id": self.pipeline_id,
+                "stages": self.to_dict(),
+                "dropped_events": self.dropped_events,
+            },
+        }
+        _write_atomically(path, json.dumps(trace, default=str))
+
+
+def merge_stage_metrics(runs: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Sum the ``stage_metrics`` of several runs, e.g. the partitions of a fan-out"""
+    stages: Dict[str, StageMetrics] = {}
+    for run in runs:
+        for stage, metrics in run.items():
+            stages.setdefault(stage, StageMetrics(stage)).merge(metrics)
+    return {stage: metrics.to_dict() for stage, metrics in stages.items()}
+
+
+# (metric family, help text, type, stage field)
+_STAGE_METRICS = [
+    ("etl_stage_calls", "Spans recorded for the pipeline stage", "counter", "calls"),
+    ("etl_stage_rows", "Rows handled by the pipeline stage", "counter", "rows"),
+    ("etl_stage_seconds", "Wall-clock seconds spent in the pipeline stage", "counter", "seconds"),
+    ("etl_stage_bytes_read", "Source bytes read by the pipeline stage", "counter", "bytes_read"),
+    ("etl_stage_db_round_trips", "Database round-trips made by the pipeline stage", "counter", "db_round_trips"),
+    ("etl_stage_rows_per_second", "Throughput of the pipeline stage", "gauge", "rows_per_second"),
+    ("etl_stage_peak_rss_bytes", "Peak process RSS observed during the pipeline stage", "gauge", "peak_rss_bytes"),
+]
+
+
+def render_prometheus(stage_metrics: Dict[str, Dict[str, Any]], labels: Dict[str, str], openmetrics: bool = False) -> str:
+    """Render ``PipelineResult.stage_metrics`` in Prometheus text or OpenMetrics format"""
+    lines = []
+
+    def family(name: str, help_text: str, metric_type: str, samples: List[tuple]):
+        # Prometheus text names the counter family with its _total suffix, OpenMetrics without
+        sample_name = f"{name}_total" if metric_type == "counter" else name
+        family_name = name if openmetrics else sample_name
+        lines.append(f"# HELP {family_name} {help_text}")
+        lines.append(f"# TYPE {family_name} {metric_type}")
+        for sample_labels, value in samples:
+            lines.append(f"{sample_name}{{{_format_labels({**labels, **sample_labels})}}} {_format_value(value)}")
+
+    for name, help_text, metric_type, field in _STAGE_METRICS:
+        samples = [({"stage": stage}, metrics.get(field, 0)) for stage, metrics in stage_metrics.items()]
+        family(name, help_text, metric_type, samples)
+
+    step_samples = [
+        ({"stage": stage, "step": step}, entry["seconds"])
+        for stage, metrics in stage_metrics.items()
+        for step, entry in metrics.get("steps", {}).items()
+    ]
+    family("etl_step_seconds", "Wall-clock seconds spent in a transformer step or validation rule", "counter", step_samples)
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    escaped = {key: str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for key, value in labels.items()}
+    return ",".join(f'{key}="{value}"' for key, value in escaped.items())
+
+
+def _format_value(value: Any) -> str:
+    return str(int(value)) if isinstance(value, int) else repr(float(value))
+
+
+def _write_atomically(path: str, content: str):
+    """Write via a temporary file so scrapers never read a half-written file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(temp_path, path)
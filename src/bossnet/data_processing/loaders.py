@@ -4,13 +4,16 @@ Data Loaders
 Load transformed data into the database with validation and error handling
 """
 
+import io
 import logging
+import uuid
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 from pydantic import BaseModel
-from sqlalchemy import insert, select, text, update
+from sqlalchemy import Column, Integer, MetaData, Table, insert, literal_column, or_, select, text, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.persistence.sqlalchemy.database import get_async_session
@@ -28,6 +31,8 @@ class LoadResult(BaseModel):
     records_inserted: int
     records_updated: int
     records_failed: int
+    records_unchanged: int = 0
+    db_round_trips: int = 0
     errors: List[str] = []
     warnings: List[str] = []
 
@@ -58,6 +63,12 @@ class DatabaseLoader(BaseLoader):
         self.batch_size = kwargs.get("batch_size", 1000)
         self.on_conflict = kwargs.get("on_conflict", "update")  # update, ignore, error
         self.upsert_columns = kwargs.get("upsert_columns", [])
+        # Bookkeeping columns that alone should not turn an upsert into an update
+        self.change_ignore_columns = kwargs.get("change_ignore_columns", ["created_at", "updated_at"])
+        self.method = kwargs.get("method", "insert")  # insert, copy
+
+        if self.method not in ("insert", "copy"):
+            raise ValueError(f"Unsupported load method: {self.method}")
 
     async def validate_data(self, data: pd.DataFrame) -> List[str]:
         """Validate data structure and content"""
@@ -129,7 +140,9 @@ class DatabaseLoader(BaseLoader):
             # Process data in batches
             total_inserted = 0
             total_updated = 0
+            total_unchanged = 0
             total_failed = 0
+            round_trips = 0
 
             async with get_async_session() as session:
                 for i in range(0, len(data), self.batch_size):
@@ -138,19 +151,27 @@ class DatabaseLoader(BaseLoader):
 
                     total_inserted += batch_result["inserted"]
                     total_updated += batch_result["updated"]
+                    total_unchanged += batch_result.get("unchanged", 0)
                     total_failed += batch_result["failed"]
+                    round_trips += batch_result.get("round_trips", 0)
 
                     if batch_result["errors"]:
                         result.errors.extend(batch_result["errors"])
 
                 await session.commit()
+                round_trips += 1
 
             result.records_inserted = total_inserted
             result.records_updated = total_updated
+            result.records_unchanged = total_unchanged
             result.records_failed = total_failed
+            result.db_round_trips = round_trips
             result.success = total_failed == 0
 
-            self.logger.info(f"Load completed: {total_inserted} inserted, " f"{total_updated} updated, {total_failed} failed")
+            self.logger.info(
+                f"Load completed: {total_inserted} inserted, {total_updated} updated, "
+                f"{total_unchanged} unchanged, {total_failed} failed"
+            )
 
             return result
 
@@ -161,28 +182,27 @@ class DatabaseLoader(BaseLoader):
 
     async def _load_batch(self, session: AsyncSession, batch: pd.DataFrame, model_class) -> Dict[str, Any]:
         """Load a single batch of data"""
-        inserted = updated = failed = 0
+        inserted = updated = unchanged = failed = 0
+        round_trips = 0
         errors = []
 
         try:
-            # Convert DataFrame to list of dictionaries
+            if self.method == "copy":
+                return await self._copy_batch(session, batch, model_class)
+
+            # Convert DataFrame to list of dictionaries; typed frames hold pd.NA, which drivers don't accept
+            if any(pd.api.types.is_extension_array_dtype(dtype) for dtype in batch.dtypes):
+                batch = batch.astype(object).where(batch.notna(), None)
             records = batch.to_dict("records")
+            # Each branch sends the batch as a single executemany
+            round_trips = 1
 
             if self.on_conflict == "update" and self.upsert_columns:
-                # Use PostgreSQL UPSERT (ON CONFLICT DO UPDATE)
-                stmt = pg_insert(model_class.__table__)
-
-                # Define the conflict resolution
-                update_dict = {
-                    col.name: stmt.excluded[col.name]
-                    for col in model_class.__table__.columns
-                    if col.name not in self.upsert_columns
-                }
-
-                stmt = stmt.on_conflict_do_update(index_elements=self.upsert_columns, set_=update_dict)
+                # Use PostgreSQL UPSERT (ON CONFLICT DO UPDATE ... RETURNING)
+                stmt = self._build_upsert(pg_insert(model_class.__table__), list(batch.columns))
 
                 result = await session.execute(stmt, records)
-                inserted = len(records)  # PostgreSQL doesn't distinguish in UPSERT
+                inserted, updated, unchanged = self._count_upserted(result.scalars().all(), len(records))
 
             elif self.on_conflict == "ignore":
                 # Use PostgreSQL ON CONFLICT DO NOTHING
@@ -201,7 +221,142 @@ class DatabaseLoader(BaseLoader):
             errors.append(str(e))
             failed = len(batch)
 
-        return {"inserted": inserted, "updated": updated, "failed": failed, "errors": errors}
+        return {
+            "inserted": inserted,
+            "updated": updated,
+            "unchanged": unchanged,
+            "failed": failed,
+            "errors": errors,
+            "round_trips": round_trips,
+        }
+
+    def _build_upsert(self, stmt, column_names: List[str]):
+        """Attach ON CONFLICT DO UPDATE with change detection and insert/update reporting.
+
+        Only columns present in the batch are updated, and the update is skipped
+        when none of them differ (``IS DISTINCT FROM``) so unchanged rows don't
+        generate dead tuples. ``RETURNING (xmax = 0)`` is true for freshly
+        inserted rows and false for updated ones.
+
+        With nothing to compare (e.g. only key or bookkeeping columns) there is
+        no change to apply, so conflicts fall back to ``DO NOTHING``; RETURNING
+        then only yields inserted rows and the rest count as unchanged.
+        """
+        table = stmt.table
+        update_columns = [name for name in column_names if name in table.c and name not in self.upsert_columns]
+        compare_columns = [name for name in update_columns if name not in self.change_ignore_columns]
+
+        if compare_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=self.upsert_columns,
+                set_={name: stmt.excluded[name] for name in update_columns},
+                where=or_(*[table.c[name].is_distinct_from(stmt.excluded[name]) for name in compare_columns]),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=self.upsert_columns)
+        return stmt.returning(literal_column("(xmax = 0)").label("inserted"))
+
+    @staticmethod
+    def _count_upserted(inserted_flags: List[bool], total: int) -> tuple:
+        """Split RETURNING (xmax = 0) flags into inserted, updated and unchanged counts"""
+        inserted = sum(1 for flag in inserted_flags if flag)
+        updated = len(inserted_flags) - inserted
+        return inserted, updated, total - len(inserted_flags)
+
+    async def _copy_batch(self, session: AsyncSession, batch: pd.DataFrame, model_class) -> Dict[str, Any]:
+        """Load a batch with COPY into a temp staging table, then merge into the target.
+
+        The batch is serialised once as CSV and streamed through ``COPY ... FROM STDIN``,
+        avoiding a Python dict per row. A single ``INSERT ... SELECT`` then moves the
+        rows into the target table honouring ``on_conflict``/``upsert_columns``.
+        COPY and merge run in a savepoint, so a failed batch leaves the session's
+        transaction usable for dropping the staging table and for later batches.
+        """
+        inserted = updated = unchanged = failed = 0
+        errors = []
+        # Counted as each statement is sent, so a failed batch reports the trips it made
+        round_trips = 0
+
+        table = model_class.__table__
+        columns = [col for col in table.columns if col.name in batch.columns]
+        column_names = [col.name for col in columns]
+
+        staging = Table(
+            f"_stg_{table.name}_{uuid.uuid4().hex[:8]}",
+            MetaData(),
+            *[Column(col.name, col.type) for col in columns],
+            prefixes=["TEMPORARY"],
+        )
+
+        connection = await session.connection()
+        round_trips += 1
+        await connection.run_sync(staging.create)
+        round_trips += 1
+        savepoint = await connection.begin_nested()
+
+        try:
+            buffer = io.BytesIO()
+            self._copy_frame(batch, columns).to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+
+            raw_connection = await connection.get_raw_connection()
+            round_trips += 1
+            await raw_connection.driver_connection.copy_to_table(
+                staging.name, source=buffer, columns=column_names, format="csv"
+            )
+
+            stmt = pg_insert(table).from_select(column_names, select(*staging.c))
+
+            round_trips += 1
+            if self.on_conflict == "update" and self.upsert_columns:
+                result = await connection.execute(self._build_upsert(stmt, column_names))
+                inserted, updated, unchanged = self._count_upserted(result.scalars().all(), len(batch))
+            else:
+                if self.on_conflict == "ignore":
+                    stmt = stmt.on_conflict_do_nothing()
+
+                result = await connection.execute(stmt)
+                # ON CONFLICT DO NOTHING only counts rows that were actually written
+                inserted = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(batch)
+                unchanged = len(batch) - inserted
+
+            round_trips += 1
+            await savepoint.commit()
+
+        except Exception as e:
+            self.logger.error(f"COPY batch load error: {str(e)}")
+            errors.append(str(e))
+            inserted = updated = unchanged = 0
+            failed = len(batch)
+            round_trips += 1
+            await savepoint.rollback()
+
+        round_trips += 1
+        await connection.run_sync(staging.drop)
+
+        return {
+            "inserted": inserted,
+            "updated": updated,
+            "unchanged": unchanged,
+            "failed": failed,
+            "errors": errors,
+            "round_trips": round_trips,
+        }
+
+    @staticmethod
+    def _copy_frame(batch: pd.DataFrame, columns: List[Column]) -> pd.DataFrame:
+        """Select the COPY columns, keeping integer columns integral.
+
+        A nullable integer column arrives as float64 ("1.0"), which COPY into an
+        INTEGER column rejects; nullable Int64 writes "1" and an empty field (NULL).
+        """
+        frame = batch[[col.name for col in columns]]
+        integer_columns = [
+            col.name for col in columns if isinstance(col.type, Integer) and pd.api.types.is_float_dtype(frame[col.name].dtype)
+        ]
+        if integer_columns:
+            frame = frame.astype({name: "Int64" for name in integer_columns})
+        return frame
 
     def _get_model_class(self):
         """Get SQLAlchemy model class for the target table"""
@@ -220,6 +375,14 @@ class DatabaseLoader(BaseLoader):
         return required_columns
 
 
+class CopyLoader(DatabaseLoader):
+    """Database loader that bulk loads through PostgreSQL COPY"""
+
+    def __init__(self, target_table: str, **kwargs):
+        kwargs["method"] = "copy"
+        super().__init__(target_table, **kwargs)
+
+
 class ValidationLoader(DatabaseLoader):
     """Loader with enhanced data validation"""
 
@@ -388,7 +551,7 @@ class CSVLoader(BaseLoader):
 # Factory function to create loaders
 def create_loader(loader_type: str, target: str, **kwargs) -> BaseLoader:
     """Factory function to create appropriate loader"""
-    loaders = {"database": DatabaseLoader, "validation": ValidationLoader, "csv": CSVLoader}
+    loaders = {"database": DatabaseLoader, "copy": CopyLoader, "validation": ValidationLoader, "csv": CSVLoader}
 
     if loader_type not in loaders:
         raise ValueError(f"Unsupported loader type: {loader_type}")
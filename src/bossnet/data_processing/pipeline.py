@@ -6,6 +6,10 @@ Orchestrates the complete data processing workflow
 
 import asyncio
 import logging
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -15,10 +19,14 @@ from celery import Celery
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.config.settings import settings
+from src.data_processing.checkpoints import CheckpointStore, source_fingerprint
 from src.data_processing.extractors import CSVExtractor, DatabaseExtractor, ExcelExtractor
-from src.data_processing.loaders import DatabaseLoader, ValidationLoader
+from src.data_processing.instrumentation import PipelineInstrumentation
+from src.data_processing.loaders import DatabaseLoader, LoadResult, ValidationLoader
+from src.data_processing.schemas import get_schema
+from src.data_processing.staging import ParquetStagingArea
 from src.data_processing.transformers import SchoolDataTransformer, StudentDataTransformer
-from src.data_processing.validators import DataQualityValidator
+from src.data_processing.validators import DataQualityValidator, ValidationResult
 from src.infrastructure.persistence.sqlalchemy.database import get_async_session
 
 # Configure logging
@@ -43,17 +51,42 @@ celery_app.conf.update(
 )
 
 
+def new_pipeline_id() -> str:
+    """Unique pipeline id; runs started within the same second must not share checkpoints"""
+    return f"pipeline_{uuid.uuid4().hex}"
+
+
 class PipelineConfig(BaseModel):
     """Configuration for ETL pipeline execution"""
 
     source_type: str = Field(..., description="Type of data source (csv, excel, database)")
     source_path: Optional[str] = Field(None, description="Path to source file")
     source_config: Optional[Dict[str, Any]] = Field(None, description="Database connection config")
+    skip_rows: int = Field(0, description="Leading lines of a csv source to skip before its header")
     target_table: str = Field(..., description="Target database table")
     batch_size: int = Field(1000, description="Processing batch size")
     validate_data: bool = Field(True, description="Enable data validation")
     skip_duplicates: bool = Field(True, description="Skip duplicate records")
     dry_run: bool = Field(False, description="Run without committing changes")
+    streaming: bool = Field(False, description="Process the source chunk by chunk instead of all at once")
+    load_method: str = Field("insert", description="Database write method (insert, copy)")
+    staging_dir: Optional[str] = Field(None, description="Stage intermediate frames as Parquet under this directory")
+    staging_partition_cols: List[str] = Field(["division"], description="Columns staged frames are partitioned on, if present")
+    transformation_rules: List[Dict[str, Any]] = Field([], description="Declarative cleaning rules for the transformer")
+    rule_workers: int = Field(0, description="Worker processes for independent transformation rule columns (0 = inline)")
+    approximate_validation: bool = Field(False, description="Validate with mergeable sketches instead of exact scans")
+    validator_options: Dict[str, Any] = Field({}, description="Extra DataQualityValidator config (GE sampling, result store)")
+    fan_out: bool = Field(False, description="Split the source into partitions processed by separate Celery tasks")
+    partition_size_bytes: int = Field(64 * 1024 * 1024, description="Target source bytes per fan-out partition")
+    partition: Optional[Dict[str, Any]] = Field(None, description="Source partition handled by this run (set by fan-out)")
+    checkpoint_store: Optional[str] = Field(None, description="Database URL for per-batch checkpoints (sqlite or postgres)")
+    pipelined: bool = Field(False, description="Run extract, transform and load as concurrent stages")
+    queue_size: int = Field(4, description="Chunks buffered between pipelined stages")
+    transform_workers: int = Field(0, description="Worker processes for pipelined transforms (0 = event loop)")
+    trace_path: Optional[str] = Field(None, description="Write a JSON trace of stage spans to this file")
+    metrics_path: Optional[str] = Field(None, description="Write stage metrics in Prometheus text format to this file")
+    openmetrics: bool = Field(False, description="Write metrics_path in OpenMetrics instead of Prometheus text format")
+    typed_schema: bool = Field(False, description="Read and transform with the registry's categorical/Arrow dtypes")
 
     @validator("source_type")
     def validate_source_type(cls, v):
@@ -62,6 +95,13 @@ class PipelineConfig(BaseModel):
             raise ValueError(f"source_type must be one of {valid_types}")
         return v
 
+    @validator("load_method")
+    def validate_load_method(cls, v):
+        valid_methods = ["insert", "copy"]
+        if v not in valid_methods:
+            raise ValueError(f"load_method must be one of {valid_methods}")
+        return v
+
 
 class PipelineResult(BaseModel):
     """Result of pipeline execution"""
@@ -73,53 +113,78 @@ class PipelineResult(BaseModel):
     records_processed: int = 0
     records_inserted: int = 0
     records_updated: int = 0
+    records_unchanged: int = 0
     records_failed: int = 0
     validation_errors: List[str] = []
     processing_errors: List[str] = []
     execution_time_seconds: Optional[float] = None
+    staged_artifacts: Dict[str, str] = {}
+    partitions: List[Dict[str, Any]] = []
+    batches_resumed: int = 0
+    stage_metrics: Dict[str, Dict[str, Any]] = {}
 
 
 class DataPipeline:
     """Main ETL Pipeline orchestrator"""
 
-    def __init__(self, config: PipelineConfig):
+    def __init__(self, config: PipelineConfig, pipeline_id: Optional[str] = None):
         self.config = config
-        self.pipeline_id = f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.pipeline_id = pipeline_id or new_pipeline_id()
         self.result = PipelineResult(pipeline_id=self.pipeline_id, status="initialized", start_time=datetime.now())
+        self.schema = get_schema(config.target_table) if config.typed_schema else None
 
         # Initialize components
         self.extractor = self._get_extractor()
         self.transformer = self._get_transformer()
         self.loader = self._get_loader()
-        self.validator = DataQualityValidator()
+        self.validator = DataQualityValidator({**config.validator_options, "approximate": config.approximate_validation})
+        self.staging = ParquetStagingArea(config.staging_dir, self.pipeline_id) if config.staging_dir else None
+
+        # Batches are numbered across the whole run so checkpoints line up between attempts
+        self.checkpoints = CheckpointStore(config.checkpoint_store) if config.checkpoint_store else None
+        self.source_fingerprint: Optional[str] = None
+        self._completed_batches: Dict[int, Dict[str, int]] = {}
+        self._batch_index = 0
+
+        self.instrumentation = PipelineInstrumentation(self.pipeline_id)
 
     def _get_extractor(self):
         """Get appropriate data extractor based on source type"""
         if self.config.source_type == "csv":
-            return CSVExtractor(self.config.source_path)
+            return CSVExtractor(
+                self.config.source_path,
+                skip_rows=self.config.skip_rows,
+                byte_range=(self.config.partition or {}).get("byte_range"),
+                schema=self.schema,
+            )
         elif self.config.source_type == "excel":
-            return ExcelExtractor(self.config.source_path)
+            return ExcelExtractor(self.config.source_path, schema=self.schema)
         elif self.config.source_type == "database":
-            return DatabaseExtractor(self.config.source_config)
+            return DatabaseExtractor({**(self.config.source_config or {}), "schema": self.schema})
         else:
             raise ValueError(f"Unsupported source type: {self.config.source_type}")
 
     def _get_transformer(self):
         """Get appropriate data transformer based on target table"""
         if "student" in self.config.target_table.lower():
-            return StudentDataTransformer()
+            transformer = StudentDataTransformer()
         elif "school" in self.config.target_table.lower():
-            return SchoolDataTransformer()
+            transformer = SchoolDataTransformer()
         else:
             # Generic transformer for other tables
-            return StudentDataTransformer()  # Default
+            transformer = StudentDataTransformer()  # Default
+
+        transformer.add_transformation_rules(self.config.transformation_rules)
+        transformer.rule_workers = self.config.rule_workers
+        transformer.schema = self.schema
+        return transformer
 
     def _get_loader(self):
         """Get appropriate data loader"""
         if self.config.validate_data:
-            return ValidationLoader(self.config.target_table)
+            return ValidationLoader(self.config.target_table, method=self.config.load_method)
         else:
-            return DatabaseLoader(self.config.target_table)
+            return DatabaseLoader(self.config.target_table, method=self.config.load_method)
 
     async def execute(self) -> PipelineResult:
         """Execute the complete ETL pipeline"""
@@ -127,26 +192,38 @@ class DataPipeline:
         self.result.status = "running"
 
         try:
+            self._start_checkpointing()
+
+            if self.config.pipelined:
+                return self._finish_run(await self._execute_pipelined())
+
+            if self.config.streaming:
+                return self._finish_run(await self._execute_streaming())
+
             # Step 1: Extract data
             logger.info("Step 1: Extracting data")
-            raw_data = await self.extractor.extract()
+            with self.instrumentation.stage("extract") as span:
+                raw_data = await self.extractor.extract()
+                span["rows"] = len(raw_data)
             logger.info(f"Extracted {len(raw_data)} records")
 
             if raw_data.empty:
                 self.result.status = "completed"
                 self.result.end_time = datetime.now()
                 logger.warning("No data to process")
-                return self.result
+                return self._finish_run(self.result)
+
+            records_extracted = len(raw_data)
 
             # Step 2: Transform data
             logger.info("Step 2: Transforming data")
-            transformed_data = await self.transformer.transform(raw_data)
+            transformed_data = await self._transform_chunk(raw_data)
             logger.info(f"Transformed {len(transformed_data)} records")
 
             # Step 3: Validate data (if enabled)
             if self.config.validate_data:
                 logger.info("Step 3: Validating data quality")
-                validation_result = await self.validator.validate(transformed_data)
+                validation_result = await self._validate(transformed_data)
 
                 if not validation_result.is_valid:
                     self.result.validation_errors = validation_result.errors
@@ -155,53 +232,253 @@ class DataPipeline:
                     if validation_result.critical_errors:
                         self.result.status = "failed"
                         self.result.end_time = datetime.now()
-                        return self.result
+                        return self._finish_run(self.result)
 
             # Step 4: Load data in batches
             logger.info("Step 4: Loading data to database")
-            load_result = await self._load_in_batches(transformed_data)
+            if self.staging:
+                # Hand off through Parquet so the in-memory frames can be released before loading
+                self._stage("transformed", transformed_data)
+                del raw_data, transformed_data
+                load_result = await self._load_staged("transformed")
+            else:
+                load_result = await self._load_in_batches(transformed_data)
 
             # Update results
-            self.result.records_processed = len(raw_data)
+            self.result.records_processed = records_extracted
             self.result.records_inserted = load_result.get("inserted", 0)
             self.result.records_updated = load_result.get("updated", 0)
+            self.result.records_unchanged = load_result.get("unchanged", 0)
             self.result.records_failed = load_result.get("failed", 0)
             self.result.processing_errors = load_result.get("errors", [])
 
+            await self._commit_extraction()
+            self._cleanup_staging()
+
             self.result.status = "completed"
             self.result.end_time = datetime.now()
             self.result.execution_time_seconds = (self.result.end_time - self.result.start_time).total_seconds()
 
             logger.info(f"Pipeline {self.pipeline_id} completed successfully")
-            return self.result
+            return self._finish_run(self.result)
 
         except Exception as e:
             logger.error(f"Pipeline {self.pipeline_id} failed: {str(e)}")
             self.result.status = "failed"
             self.result.end_time = datetime.now()
             self.result.processing_errors.append(str(e))
-            return self.result
+            return self._finish_run(self.result)
+
+    async def _execute_streaming(self) -> PipelineResult:
+        """Run extract -> transform -> validate -> load one chunk at a time.
+
+        Only a single chunk of ``batch_size`` rows is held in memory at once;
+        per-chunk counters are rolled up into the pipeline result.
+        """
+        logger.info(f"Streaming source in chunks of {self.config.batch_size} records")
+        chunk_num = 0
+
+        async for raw_chunk in self._extract_chunks():
+            chunk_num += 1
+            if raw_chunk.empty:
+                continue
+
+            logger.info(f"Processing chunk {chunk_num} ({len(raw_chunk)} records)")
+            transformed_chunk = await self._transform_chunk(raw_chunk)
+
+            if not await self._validate_chunk(chunk_num, transformed_chunk):
+                return self._abort_on_critical_errors(len(raw_chunk))
+
+            load_result = await self._load_in_batches(transformed_chunk)
+            self._record_chunk(len(raw_chunk), load_result)
+
+        if chunk_num == 0:
+            logger.warning("No data to process")
+
+        return await self._complete_chunked_run(chunk_num)
+
+    async def _execute_pipelined(self) -> PipelineResult:
+        """Run extraction, transformation and loading as concurrent stages.
+
+        The stages are connected by bounded queues, so a slow loader applies
+        back-pressure all the way to the extractor. Transforms are submitted
+        in extraction order (to a process pool when ``transform_workers`` is
+        set) and awaited in that order by the load stage, keeping batch
+        numbering deterministic for checkpoints.
+        """
+        queue_size = max(1, self.config.queue_size)
+        extracted: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        transformed: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        executor = ProcessPoolExecutor(max_workers=self.config.transform_workers) if self.config.transform_workers else None
+        chunk_count = 0
+
+        logger.info(f"Pipelining source in chunks of {self.config.batch_size} records (queue size {queue_size})")
+
+        # Each stage ends the next one with a None sentinel; a failing stage is surfaced by gather instead
+        async def extract_stage():
+            async for raw_chunk in self._extract_chunks():
+                if not raw_chunk.empty:
+                    await extracted.put(raw_chunk)
+            await extracted.put(None)
+
+        async def transform_stage():
+            while True:
+                raw_chunk = await extracted.get()
+                if raw_chunk is None:
+                    break
+                pending = asyncio.ensure_future(self._transform_chunk(raw_chunk, executor))
+                await transformed.put((len(raw_chunk), pending))
+            await transformed.put(None)
+
+        async def load_stage():
+            nonlocal chunk_count
+            while True:
+                item = await transformed.get()
+                if item is None:
+                    break
+
+                chunk_count += 1
+                raw_count, pending = item
+                transformed_chunk = await pending
+                logger.info(f"Loading chunk {chunk_count} ({raw_count} records)")
+
+                if not await self._validate_chunk(chunk_count, transformed_chunk):
+                    raise _CriticalValidationError(raw_count)
+
+                load_result = await self._load_in_batches(transformed_chunk)
+                self._record_chunk(raw_count, load_result)
+
+        stages = [asyncio.ensure_future(stage()) for stage in (extract_stage, transform_stage, load_stage)]
+        try:
+            await asyncio.gather(*stages)
+        except _CriticalValidationError as e:
+            return self._abort_on_critical_errors(e.records)
+        finally:
+            for stage in stages:
+                stage.cancel()
+            while not transformed.empty():
+                item = transformed.get_nowait()
+                if item is not None:
+                    item[1].cancel()
+            if executor:
+                executor.shutdown(wait=False)
+
+        if chunk_count == 0:
+            logger.warning("No data to process")
+
+        return await self._complete_chunked_run(chunk_count)
+
+    async def _extract_chunks(self):
+        """Iterate the extractor's chunks, timing each one as an extract span"""
+        start = time.perf_counter()
+        async for raw_chunk in self.extractor.extract_chunks(self.config.batch_size):
+            self.instrumentation.record("extract", start, rows=len(raw_chunk))
+            yield raw_chunk
+            start = time.perf_counter()
+
+    async def _transform_chunk(self, data: pd.DataFrame, executor: Optional[ProcessPoolExecutor] = None) -> pd.DataFrame:
+        """Transform a frame in the event loop, or in ``executor`` when given, as one transform span"""
+        with self.instrumentation.stage("transform", rows=len(data)):
+            if executor is None:
+                return await self.transformer.transform(data)
+
+            loop = asyncio.get_running_loop()
+            transformed, step_timings = await loop.run_in_executor(executor, _transform_in_worker, self.transformer, data)
+            # Worker processes time their steps on a copy of the transformer
+            self.instrumentation.add_steps("transform", step_timings)
+            return transformed
+
+    async def _validate(self, data: pd.DataFrame) -> ValidationResult:
+        """Validate a frame as one validate span, folding in the per-rule timings"""
+        with self.instrumentation.stage("validate", rows=len(data)):
+            validation_result = await self.validator.validate(data)
+
+        rule_timings = getattr(validation_result, "validation_details", {}).get("rule_timings")
+        if isinstance(rule_timings, dict):
+            self.instrumentation.add_steps("validate", rule_timings)
+        return validation_result
+
+    async def _validate_chunk(self, chunk_num: int, data: pd.DataFrame) -> bool:
+        """Validate one chunk, recording its errors; False if it has critical errors"""
+        if not self.config.validate_data:
+            return True
+
+        validation_result = await self._validate(data)
+
+        if not validation_result.is_valid:
+            self.result.validation_errors.extend(f"Chunk {chunk_num}: {error}" for error in validation_result.errors)
+            logger.error(f"Chunk {chunk_num} validation failed: {validation_result.errors}")
+
+            if validation_result.critical_errors:
+                return False
+
+        return True
+
+    def _record_chunk(self, records: int, load_result: Dict[str, Any]):
+        """Roll one chunk's load counters into the pipeline result"""
+        self.result.records_processed += records
+        self.result.records_inserted += load_result.get("inserted", 0)
+        self.result.records_updated += load_result.get("updated", 0)
+        self.result.records_unchanged += load_result.get("unchanged", 0)
+        self.result.records_failed += load_result.get("failed", 0)
+        self.result.processing_errors.extend(load_result.get("errors", []))
+
+    def _abort_on_critical_errors(self, records: int) -> PipelineResult:
+        self.result.records_processed += records
+        self.result.status = "failed"
+        self.result.end_time = datetime.now()
+        self.result.execution_time_seconds = (self.result.end_time - self.result.start_time).total_seconds()
+        return self.result
+
+    async def _complete_chunked_run(self, chunk_count: int) -> PipelineResult:
+        await self._commit_extraction()
+
+        self.result.status = "completed"
+        self.result.end_time = datetime.now()
+        self.result.execution_time_seconds = (self.result.end_time - self.result.start_time).total_seconds()
+
+        logger.info(f"Pipeline {self.pipeline_id} completed successfully ({chunk_count} chunks)")
+        return self.result
 
     async def _load_in_batches(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Load data in batches to avoid memory issues"""
         batch_size = self.config.batch_size
         total_records = len(data)
-        inserted = updated = failed = 0
+        inserted = updated = unchanged = failed = 0
         errors = []
 
         for i in range(0, total_records, batch_size):
             batch = data.iloc[i : i + batch_size]
             batch_num = (i // batch_size) + 1
             total_batches = (total_records + batch_size - 1) // batch_size
+            batch_index = self._batch_index
+            self._batch_index += 1
+
+            if self._skip_checkpointed_batch(batch_index):
+                checkpoint = self._completed_batches[batch_index]
+                inserted += checkpoint["inserted"]
+                updated += checkpoint["updated"]
+                unchanged += checkpoint["unchanged"]
+                continue
 
             logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} records)")
 
             try:
                 if not self.config.dry_run:
-                    batch_result = await self.loader.load(batch)
+                    with self.instrumentation.stage("load", name=f"batch {batch_index}", rows=len(batch)) as span:
+                        batch_result = self._load_result_counts(await self.loader.load(batch))
+                        span["db_round_trips"] = batch_result.get("db_round_trips", 0)
                     inserted += batch_result.get("inserted", 0)
                     updated += batch_result.get("updated", 0)
+                    unchanged += batch_result.get("unchanged", 0)
                     failed += batch_result.get("failed", 0)
+                    errors.extend(batch_result.get("errors", []))
+
+                    # Only fully loaded batches are checkpointed; anything else is retried on resume
+                    if self.checkpoints and not batch_result.get("failed", 0):
+                        self.checkpoints.complete_batch(
+                            self.pipeline_id, self.source_fingerprint, batch_index, len(batch), batch_result
+                        )
                 else:
                     logger.info(f"DRY RUN: Would process {len(batch)} records")
 
@@ -211,7 +488,156 @@ class DataPipeline:
                 errors.append(error_msg)
                 failed += len(batch)
 
-        return {"inserted": inserted, "updated": updated, "failed": failed, "errors": errors}
+        return {"inserted": inserted, "updated": updated, "unchanged": unchanged, "failed": failed, "errors": errors}
+
+    def _start_checkpointing(self):
+        """Register the run and load the batches a previous attempt already completed"""
+        if not self.checkpoints or self.config.dry_run:
+            return
+
+        self.source_fingerprint = source_fingerprint(
+            self.config.source_type,
+            self.config.source_path,
+            self.config.source_config,
+            byte_range=(self.config.partition or {}).get("byte_range"),
+        )
+        self.checkpoints.start_run(self.pipeline_id, self.source_fingerprint, self.config.dict(exclude={"checkpoint_store"}))
+        self._completed_batches = self.checkpoints.completed_batches(self.pipeline_id, self.source_fingerprint)
+
+        if self._completed_batches:
+            logger.info(f"Resuming pipeline {self.pipeline_id}: {len(self._completed_batches)} batches already loaded")
+
+    def _skip_checkpointed_batch(self, batch_index: int) -> bool:
+        """True if ``batch_index`` was loaded before; otherwise claim it for this run"""
+        if not self.checkpoints or self.config.dry_run:
+            return False
+
+        if batch_index in self._completed_batches or not self.checkpoints.claim_batch(
+            self.pipeline_id, self.source_fingerprint, batch_index
+        ):
+            logger.info(f"Skipping batch {batch_index}: already loaded by an earlier attempt")
+            self._completed_batches.setdefault(batch_index, {"rows": 0, "inserted": 0, "updated": 0, "unchanged": 0})
+            self.result.batches_resumed += 1
+            return True
+
+        return False
+
+    def _finish_run(self, result: PipelineResult) -> PipelineResult:
+        self._finish_instrumentation(result)
+        return self._finish_checkpointing(result)
+
+    def _finish_checkpointing(self, result: PipelineResult) -> PipelineResult:
+        if self.checkpoints and self.source_fingerprint:
+            self.checkpoints.finish_run(self.pipeline_id, result.status)
+        if self.checkpoints:
+            # Release pooled connections; the engine reconnects if the pipeline runs again
+            self.checkpoints.dispose()
+        return result
+
+    def _finish_instrumentation(self, result: PipelineResult):
+        """Publish stage metrics on the result and write the configured trace and metrics files"""
+        if "extract" in self.instrumentation.stages:
+            self.instrumentation.add_bytes_read("extract", self._source_bytes())
+        # Transformers are pluggable; only BaseTransformer subclasses time their steps
+        step_timings = getattr(self.transformer, "step_timings", None)
+        if isinstance(step_timings, dict):
+            self.instrumentation.add_steps("transform", step_timings)
+        result.stage_metrics = self.instrumentation.to_dict()
+
+        # Instrumentation output must never fail an otherwise finished run
+        try:
+            if self.config.trace_path:
+                self.instrumentation.write_trace(self.config.trace_path)
+            if self.config.metrics_path:
+                self.instrumentation.write_metrics(self.config.metrics_path, openmetrics=self.config.openmetrics)
+        except OSError as e:
+            logger.warning(f"Could not write pipeline instrumentation: {str(e)}")
+
+    def _source_bytes(self) -> int:
+        """Bytes of the source file (or of this run's partition of it); 0 for non-file sources"""
+        byte_range = (self.config.partition or {}).get("byte_range")
+        if byte_range:
+            return byte_range[1] - byte_range[0]
+        if self.config.source_path and os.path.isfile(self.config.source_path):
+            return os.path.getsize(self.config.source_path)
+        return 0
+
+    async def _commit_extraction(self):
+        """Let the extractor persist its progress (e.g. a watermark) after a clean load"""
+        if self.config.dry_run or self.result.records_failed:
+            logger.info("Extraction progress not committed (dry run or failed records)")
+            return
+        await self.extractor.commit()
+
+    def _stage(self, stage: str, data: pd.DataFrame):
+        """Write a stage's output to the Parquet staging area and record its path"""
+        partition_cols = [column for column in self.config.staging_partition_cols if column in data.columns]
+        artifact = self.staging.write(stage, data, partition_cols=partition_cols)
+        self.result.staged_artifacts[stage] = artifact.path
+        logger.info(f"Staged {artifact.row_count} {stage} records to {artifact.path}")
+
+    def _cleanup_staging(self):
+        """Remove the run's staged frames once everything loaded; failed runs keep them for inspection"""
+        if not self.staging or self.result.records_failed:
+            return
+        self.staging.cleanup()
+        self.result.staged_artifacts = {}
+
+    async def _load_staged(self, stage: str) -> Dict[str, Any]:
+        """Load a staged Parquet dataset batch by batch"""
+        totals = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0, "errors": []}
+
+        columns = self._load_columns(self.staging.artifact(stage).columns)
+        for batch in self.staging.iter_batches(stage, self.config.batch_size, columns=columns):
+            batch_result = await self._load_in_batches(batch)
+            for key in ("inserted", "updated", "unchanged", "failed"):
+                totals[key] += batch_result.get(key, 0)
+            totals["errors"].extend(batch_result.get("errors", []))
+
+        return totals
+
+    def _load_columns(self, staged_columns: List[str]) -> Optional[List[str]]:
+        """Staged columns the loader's target table has; None reads them all"""
+        model_class = getattr(self.loader, "_get_model_class", lambda: None)()
+        table = getattr(model_class, "__table__", None)
+        if table is None:
+            return None
+
+        columns = [column for column in staged_columns if column in table.c]
+        skipped = set(staged_columns) - set(columns)
+        if skipped:
+            logger.info(f"Not reading staged columns absent from {table.name}: {sorted(skipped)}")
+        return columns or None
+
+    @staticmethod
+    def _load_result_counts(load_result: Union[LoadResult, Dict[str, Any]]) -> Dict[str, Any]:
+        """Normalise a loader's LoadResult into the counter dict used by the pipeline"""
+        if isinstance(load_result, LoadResult):
+            return {
+                "inserted": load_result.records_inserted,
+                "updated": load_result.records_updated,
+                "unchanged": load_result.records_unchanged,
+                "failed": load_result.records_failed,
+                "errors": load_result.errors,
+                "db_round_trips": load_result.db_round_trips,
+            }
+        return load_result
+
+
+class _CriticalValidationError(Exception):
+    """Raised inside the pipelined load stage to stop every stage"""
+
+    def __init__(self, records: int):
+        super().__init__(f"Critical validation errors in a chunk of {records} records")
+        self.records = records
+
+
+def _transform_in_worker(transformer, data: pd.DataFrame) -> tuple:
+    """Run a transformer's async ``transform`` inside a worker process, returning its step timings too"""
+    transformer.step_timings = {}
+    # The chunk already has a process of its own; another pool per column would oversubscribe the cores
+    transformer.rule_workers = 0
+    return asyncio.run(transformer.transform(data)), transformer.step_timings
 
 
 # Celery task for async pipeline execution
@@ -220,6 +646,15 @@ def run_pipeline_task(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Celery task to run ETL pipeline asynchronously"""
     try:
         config = PipelineConfig(**config_dict)
+
+        if config.fan_out:
+            # Imported here: the tasks module builds on this one
+            from src.data_processing.tasks import dispatch_partitions
+
+            pipeline_id = new_pipeline_id()
+            chord_result = dispatch_partitions(config, pipeline_id=pipeline_id)
+            return {"pipeline_id": pipeline_id, "status": "dispatched", "chord_id": chord_result.id}
+
         pipeline = DataPipeline(config)
 
         # Run the async pipeline in the event loop
@@ -264,6 +699,21 @@ async def run_school_data_pipeline(source_path: str, source_type: str = "csv") -
     return await pipeline.execute()
 
 
+async def resume_pipeline(pipeline_id: str, checkpoint_store: str) -> PipelineResult:
+    """Re-run a checkpointed pipeline, skipping the batches it already loaded"""
+    store = CheckpointStore(checkpoint_store)
+    try:
+        run = store.get_run(pipeline_id)
+    finally:
+        store.dispose()
+    if run is None:
+        raise ValueError(f"No checkpointed run found for pipeline {pipeline_id}")
+
+    config = PipelineConfig(**{**run["config"], "checkpoint_store": checkpoint_store})
+    pipeline = DataPipeline(config, pipeline_id=pipeline_id)
+    return await pipeline.execute()
+
+
 def schedule_pipeline(config: PipelineConfig) -> str:
     """Schedule pipeline to run asynchronously with Celery"""
     task = run_pipeline_task.delay(config.dict())
@@ -0,0 +1,180 @@
+"""
+Data Profiling
+==============
+Single-pass columnar profile shared by the data quality checks
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+
+class ColumnProfile:
+    """Distinct values and their counts for one column
+
+    The column is hashed once; null counts, distinct counts, min/max,
+    quantiles, set membership and pattern-match counts are all derived from
+    the distinct values and their frequencies, so checks cost O(distinct)
+    rather than another scan over the rows.
+    """
+
+    def __init__(self, series: pd.Series):
+        self.name = series.name
+        self.dtype = series.dtype
+        self.row_count = len(series)
+        self.is_numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+        if self.is_numeric and pd.api.types.is_extension_array_dtype(series.dtype):
+            # Nullable Int64/Float64 columns are profiled as float64 so sorting and quantiles stay in NumPy
+            series = series.astype("float64")
+
+        try:
+            codes, uniques = pd.factorize(series)
+        except TypeError:
+            # Unhashable values (lists, dicts from JSON sources) are profiled by their string form
+            codes, uniques = pd.factorize(series.astype(str).where(series.notna()))
+
+        self.uniques = pd.Series(np.asarray(uniques), dtype=series.dtype if self.is_numeric else object)
+        self.counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        self.null_count = int(self.row_count - self.counts.sum())
+        self._sorted: Optional[tuple] = None
+        self._pattern_counts: Dict[str, int] = {}
+
+    @property
+    def non_null_count(self) -> int:
+        return self.row_count - self.null_count
+
+    @property
+    def distinct_count(self) -> int:
+        """Distinct non-null values"""
+        return len(self.uniques)
+
+    @property
+    def duplicate_count(self) -> int:
+        """Rows repeating an earlier value, nulls included, as ``Series.duplicated().sum()``"""
+        return self.row_count - self.distinct_count - (1 if self.null_count else 0)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.null_count == self.row_count
+
+    @property
+    def min(self) -> Any:
+        return self._sorted_values()[0][0] if self.distinct_count else None
+
+    @property
+    def max(self) -> Any:
+        return self._sorted_values()[0][-1] if self.distinct_count else None
+
+    def quantiles(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[float, float]:
+        """Linearly interpolated quantiles, matching ``Series.quantile``"""
+        if not self.is_numeric or not self.distinct_count:
+            return {}
+
+        values, cumulative = self._sorted_values()
+        n = cumulative[-1]
+        result = {}
+        for q in quantiles:
+            position = q * (n - 1)
+            lower, upper = int(np.floor(position)), int(np.ceil(position))
+            low_value = values[np.searchsorted(cumulative, lower, side="right")]
+            high_value = values[np.searchsorted(cumulative, upper, side="right")]
+            result[q] = float(low_value + (high_value - low_value) * (position - lower))
+        return result
+
+    def count_below(self, value: Any) -> int:
+        """Non-null rows strictly below ``value``"""
+        return int(self.counts[(self.uniques < value).to_numpy()].sum())
+
+    def count_above(self, value: Any) -> int:
+        """Non-null rows strictly above ``value``"""
+        return int(self.counts[(self.uniques > value).to_numpy()].sum())
+
+    def count_not_in(self, values: Iterable[Any]) -> int:
+        """Non-null rows whose value is not in ``values``"""
+        return int(self.counts[~self.uniques.isin(list(values)).to_numpy()].sum())
+
+    def count_not_matching(self, pattern: Union[str, Pattern]) -> int:
+        """Rows not matching ``pattern`` from the start, as ``astype(str).str.match``
+
+        Nulls count as non-matching unless the pattern accepts their string form.
+        """
+        key = pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+        if key not in self._pattern_counts:
+            matches = self.uniques.astype(str).str.match(pattern).to_numpy(dtype=bool)
+            mismatched = int(self.counts[~matches].sum())
+            if self.null_count and not re.match(pattern, "nan"):
+                mismatched += self.null_count
+            self._pattern_counts[key] = mismatched
+        return self._pattern_counts[key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly summary of the profile"""
+        summary = {
+            "dtype": str(self.dtype),
+            "null_count": self.null_count,
+            "distinct_count": self.distinct_count,
+        }
+        if self.is_numeric and self.distinct_count:
+            summary["min"] = _to_python(self.min)
+            summary["max"] = _to_python(self.max)
+            summary["quantiles"] = {str(q): v for q, v in self.quantiles().items()}
+        return summary
+
+    def _sorted_values(self) -> tuple:
+        """Distinct values in ascending order with cumulative row counts"""
+        if self._sorted is None:
+            order = np.argsort(self.uniques.to_numpy(), kind="stable")
+            self._sorted = (self.uniques.to_numpy()[order], np.cumsum(self.counts[order]))
+        return self._sorted
+
+
+class DataProfile:
+    """Profiles of every column in a frame, built in one pass per column"""
+
+    def __init__(self, data: pd.DataFrame):
+        self.row_count = len(data)
+        self.column_count = len(data.columns)
+        self.columns: Dict[str, ColumnProfile] = {}
+
+        # Duplicate column names cannot be profiled separately; the structure check reports them
+        for column in data.columns.unique():
+            series = data[column]
+            if isinstance(series, pd.DataFrame):
+                series = series.iloc[:, 0]
+            self.columns[column] = ColumnProfile(series)
+
+        logger.debug(f"Profiled {self.column_count} columns over {self.row_count} rows")
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    def __getitem__(self, column: str) -> ColumnProfile:
+        return self.columns[column]
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        return [name for name, profile in self.columns.items() if profile.is_numeric]
+
+    @property
+    def empty_columns(self) -> List[str]:
+        return [name for name, profile in self.columns.items() if profile.is_empty]
+
+    def null_percentage(self, column: str) -> float:
+        return (self.columns[column].null_count / self.row_count) * 100 if self.row_count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly summary of all column profiles"""
+        return {str(name): profile.to_dict() for name, profile in self.columns.items()}
+
+
+def _to_python(value: Any) -> Any:
+    """Convert numpy scalars to plain Python values"""
+    return value.item() if isinstance(value, np.generic) else value
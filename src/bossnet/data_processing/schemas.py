@@ -0,0 +1,192 @@
+"""
+Ingestion Schemas
+=================
+Explicit dtypes for student, school and enrollment frames
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from pydantic import BaseModel, validator
+
+logger = logging.getLogger(__name__)
+
+# Fixed category sets, as spelled by the transformers and validators
+DIVISIONS = ["Dhaka", "Chittagong", "Rajshahi", "Khulna", "Barisal", "Sylhet", "Rangpur", "Mymensingh"]
+GENDERS = ["Male", "Female", "Other", "Unknown"]
+SCHOOL_TYPES = ["Government", "Private", "NGO", "Madrasa", "Technical", "Other"]
+EDUCATION_LEVELS = ["Primary", "Secondary", "Higher Secondary", "Technical", "Madrasa", "Other"]
+GRADE_LEVELS = [str(grade) for grade in range(1, 13)]
+
+# Arrow-backed strings hold text in contiguous buffers instead of one Python object per value
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+COLUMN_KINDS = ["category", "string", "Int64", "Float64", "boolean"]
+
+
+class ColumnSpec(BaseModel):
+    """Dtype of one column, before and after transformation"""
+
+    kind: str
+    categories: Optional[List[str]] = None  # fixed category set for the cleaned column
+    aliases: List[str] = []  # raw column names the transformers rename to this column
+
+    @validator("kind")
+    def validate_kind(cls, v):
+        if v not in COLUMN_KINDS:
+            raise ValueError(f"kind must be one of {COLUMN_KINDS}")
+        return v
+
+    @property
+    def read_dtype(self) -> Any:
+        """Dtype for raw values at read time
+
+        Raw categoricals have not been cleaned yet ("dhaka", "M"), so their
+        categories are inferred from the data rather than fixed.
+        """
+        if self.kind == "category":
+            return "category"
+        # Numbers are cleaned by the transformers too; read as text so a bad value can't fail the read
+        return STRING_DTYPE
+
+    def clean_dtype(self, values: pd.Series) -> Any:
+        """Dtype for cleaned values
+
+        Values outside a fixed category set are kept as extra categories, so
+        validity checks still see (and report) them instead of silent nulls.
+        """
+        if self.kind == "category":
+            if not self.categories:
+                return "category"
+            present = values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype) else values.dropna().unique()
+            extra = sorted(str(value) for value in set(present) - set(self.categories))
+            return pd.CategoricalDtype(self.categories + extra)
+        if self.kind == "string":
+            return STRING_DTYPE
+        return self.kind
+
+
+class TableSchema(BaseModel):
+    """Column dtypes for one target table"""
+
+    table: str
+    columns: Dict[str, ColumnSpec]
+
+    def read_dtypes(self) -> Dict[str, Any]:
+        """``dtype=`` mapping for ``pd.read_csv``/``pd.read_excel``, covering raw column aliases"""
+        dtypes = {}
+        for name, spec in self.columns.items():
+            for column in [name, *spec.aliases]:
+                dtypes[column] = spec.read_dtype
+        return dtypes
+
+    def apply_read_dtypes(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Cast an already loaded raw frame (e.g. from a database) to the read dtypes"""
+        dtypes = {column: dtype for column, dtype in self.read_dtypes().items() if column in data.columns}
+        return data.astype(dtypes) if dtypes else data
+
+    def conform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Cast cleaned columns to their final dtypes; other columns are left alone"""
+        for name, spec in self.columns.items():
+            if name not in data.columns:
+                continue
+            try:
+                data[name] = data[name].astype(spec.clean_dtype(data[name]))
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Keeping {self.table}.{name} as {data[name].dtype}: {str(e)}")
+        return data
+
+
+def _categorical(categories: Optional[List[str]] = None, aliases: Optional[List[str]] = None) -> ColumnSpec:
+    return ColumnSpec(kind="category", categories=categories, aliases=aliases or [])
+
+
+def _string(aliases: Optional[List[str]] = None) -> ColumnSpec:
+    return ColumnSpec(kind="string", aliases=aliases or [])
+
+
+SCHEMA_REGISTRY: Dict[str, TableSchema] = {
+    "students": TableSchema(
+        table="students",
+        columns={
+            "student_id": _string(),
+            "full_name": _string(["name"]),
+            "gender": _categorical(GENDERS, ["sex"]),
+            "division": _categorical(DIVISIONS),
+            "district": _categorical(),
+            "upazila": _categorical(),
+            "phone_number": _string(["phone", "mobile"]),
+            "email": _string(["email_address"]),
+            "father_full_name": _string(["father_name"]),
+            "mother_full_name": _string(["mother_name"]),
+            "guardian_full_name": _string(["guardian_name"]),
+            "current_address": _string(["address"]),
+            "permanent_address": _string(),
+            "school_id": _string(),
+            "grade_level": _categorical(GRADE_LEVELS),
+            "age": ColumnSpec(kind="Int64"),
+            "enrollment_status": _categorical(),
+        },
+    ),
+    "schools": TableSchema(
+        table="schools",
+        columns={
+            "school_id": _string(),
+            "school_name": _string(["name", "institution_name"]),
+            "school_type": _categorical(SCHOOL_TYPES, ["type"]),
+            "education_level": _categorical(EDUCATION_LEVELS, ["level"]),
+            "division": _categorical(DIVISIONS),
+            "district": _categorical(),
+            "upazila": _categorical(),
+            "union": _categorical(),
+            "phone_number": _string(["phone", "mobile"]),
+            "email": _string(["email_address"]),
+            "head_teacher_name": _string(["head_teacher", "principal"]),
+            "operational_status": _categorical(),
+        },
+    ),
+    "enrollments": TableSchema(
+        table="enrollments",
+        columns={
+            "student_id": _string(),
+            "school_id": _string(),
+            "academic_year": _categorical(),
+            "grade_level": _categorical(GRADE_LEVELS),
+            "enrollment_status": _categorical(),
+        },
+    ),
+}
+
+
+def get_schema(table_name: str) -> Optional[TableSchema]:
+    """Schema for a target table, matched the way the pipeline picks transformers"""
+    name = table_name.lower()
+    for key in ("enrollment", "student", "school"):
+        if key in name:
+            return SCHEMA_REGISTRY[f"{key}s"]
+    return None
+
+
+def concat_typed(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate chunks without losing categoricals whose categories differ between chunks
+
+    ``pd.concat`` falls back to ``object`` when chunk categories differ, as
+    they do for categories inferred per chunk at read time, so such columns
+    are first recoded to the union of their categories.
+    """
+    if len(frames) == 1:
+        return frames[0]
+
+    recoded = {}
+    for column in frames[0].columns:
+        parts = [frame[column] for frame in frames if column in frame.columns]
+        if len(parts) == len(frames) and all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            categories = parts[0].cat.categories
+            for part in parts[1:]:
+                categories = categories.union(part.cat.categories)
+            recoded[column] = pd.CategoricalDtype(categories)
+
+    if recoded:
+        frames = [frame.astype(recoded) for frame in frames]
+    return pd.concat(frames, ignore_index=True)
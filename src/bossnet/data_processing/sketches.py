@@ -0,0 +1,312 @@
+"""
+Approximate Sketches
+====================
+Mergeable, fixed-memory summaries for validating data that arrives in chunks
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def hash_values(data: Union[pd.Series, pd.DataFrame]) -> np.ndarray:
+    """64-bit hash per row, stable across chunks
+
+    Numeric columns are hashed as float64 so a key keeps its hash when a
+    chunk with nulls turns an integer column into floats.
+    """
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+
+    normalised = {}
+    for column in data.columns:
+        series = data[column]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            series = series.astype("float64")
+        normalised[column] = series
+
+    frame = pd.DataFrame(normalised, index=data.index)
+    try:
+        return pd.util.hash_pandas_object(frame, index=False).to_numpy(dtype=np.uint64)
+    except TypeError:
+        # Unhashable values (lists, dicts from JSON sources) are hashed by their string form
+        return pd.util.hash_pandas_object(frame.astype(str), index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorised ``int.bit_length`` for uint64 arrays"""
+    values = values.copy()
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        lengths[mask] += shift
+        values[mask] >>= np.uint64(shift)
+    return lengths + (values > 0)
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter with ``2 ** precision`` one-byte registers"""
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = np.zeros(self.num_registers, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of the estimate"""
+        return 1.04 / np.sqrt(self.num_registers)
+
+    def update(self, values: Union[pd.Series, pd.DataFrame]):
+        """Add the non-null values of ``values``"""
+        if isinstance(values, pd.Series):
+            values = values.dropna()
+        if len(values):
+            self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray):
+        value_bits = 64 - self.precision
+        index = (hashes >> np.uint64(value_bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << value_bits) - 1)
+        rank = (value_bits - _bit_length(remainder) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog"):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        """Estimated number of distinct values"""
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+
+        # Linear counting is more accurate while many registers are still empty
+        empty = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and empty:
+            estimate = m * np.log(m / empty)
+
+        return int(round(estimate))
+
+
+class KLLSketch:
+    """KLL quantile sketch: a stack of compactors where level ``h`` items weigh ``2 ** h``"""
+
+    def __init__(self, k: int = 200, c: float = 2 / 3, seed: Optional[int] = None):
+        self.k = k
+        self.c = c
+        self.count = 0
+        self.compactors: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Normalised rank error at ~99% confidence (empirical KLL bound)"""
+        return 2.296 / self.k**0.9723
+
+    def update(self, values: Union[pd.Series, np.ndarray]):
+        """Add the non-null numeric values of ``values``"""
+        values = pd.to_numeric(pd.Series(values), errors="coerce").dropna().to_numpy(dtype=np.float64)
+        if not len(values):
+            return
+
+        self.count += len(values)
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, quantiles: Iterable[float]) -> Dict[float, float]:
+        """Approximate quantiles of everything added so far"""
+        if not self.count:
+            return {}
+
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(level_items), 1 << h) for h, level_items in enumerate(self.compactors)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+
+        result = {}
+        for q in quantiles:
+            index = min(int(np.searchsorted(cumulative, q * cumulative[-1], side="left")), len(items) - 1)
+            result[q] = float(items[index])
+        return result
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return int(np.ceil(self.k * self.c**depth)) + 1
+
+    def _compress(self):
+        while sum(len(items) for items in self.compactors) > sum(
+            self._capacity(level) for level in range(len(self.compactors))
+        ):
+            for level in range(len(self.compactors)):
+                if len(self.compactors[level]) >= self._capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self.compactors.append(np.empty(0))
+                    promoted, kept = self._compact(self.compactors[level])
+                    self.compactors[level] = kept
+                    self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], promoted])
+                    break
+
+    def _compact(self, items: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Promote every other sorted item; an odd one out stays at its level"""
+        kept = np.empty(0)
+        if len(items) % 2:
+            index = self._rng.integers(len(items))
+            kept = items[index : index + 1]
+            items = np.delete(items, index)
+
+        items = np.sort(items)
+        return items[self._rng.integers(2) :: 2], kept
+
+
+class BloomFilter:
+    """Bit-packed Bloom filter sized for ``capacity`` items at ``error_rate`` false positives"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * np.log(2))))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Current false positive probability given how full the filter is"""
+        fill = np.unpackbits(self.bits)[: self.num_bits].mean()
+        return float(fill**self.num_hashes)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        positions = self._positions(hashes)
+        present = (self.bits[(positions >> np.uint64(3)).astype(np.int64)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return present.all(axis=1)
+
+    def add(self, hashes: np.ndarray):
+        positions = self._positions(hashes).ravel()
+        masks = np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8))
+        np.bitwise_or.at(self.bits, (positions >> np.uint64(3)).astype(np.int64), masks)
+        self.count += len(hashes)
+
+    def merge(self, other: "BloomFilter"):
+        if (other.num_bits, other.num_hashes) != (self.num_bits, self.num_hashes):
+            raise ValueError("Cannot merge Bloom filters with different sizes")
+        np.bitwise_or(self.bits, other.bits, out=self.bits)
+        self.count += other.count
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        """Double hashing: ``h1 + i * h2`` for each of the filter's hash functions"""
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        rounds = np.arange(self.num_hashes, dtype=np.uint64)
+        return (h1[:, None] + rounds[None, :] * h2[:, None]) % np.uint64(self.num_bits)
+
+
+class ValidationSketch:
+    """Mergeable per-dataset sketches fed chunk by chunk during validation
+
+    Holds a HyperLogLog per column, a KLL sketch per numeric column and a
+    Bloom filter per uniqueness key. Memory stays fixed however many chunks
+    pass through, so a whole file can be validated while streaming.
+    Duplicates are found across every chunk passed to ``count_duplicates``
+    on the same sketch; merging sketches built independently sums their
+    duplicate counts but cannot see keys repeated between them.
+    """
+
+    def __init__(
+        self,
+        precision: int = 14,
+        k: int = 200,
+        bloom_capacity: int = 1_000_000,
+        bloom_error_rate: float = 0.001,
+        seed: Optional[int] = None,
+    ):
+        self.precision = precision
+        self.k = k
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.seed = seed
+        self.row_count = 0
+        self.distinct: Dict[str, HyperLogLog] = {}
+        self.quantile_sketches: Dict[str, KLLSketch] = {}
+        self.filters: Dict[Tuple[str, ...], BloomFilter] = {}
+        self.duplicates: Dict[Tuple[str, ...], int] = {}
+
+    def update(self, data: pd.DataFrame, numeric_columns: Optional[Sequence[str]] = None):
+        """Add a chunk to the distinct-count and quantile sketches"""
+        if numeric_columns is None:
+            numeric_columns = data.select_dtypes(include=[np.number]).columns
+
+        self.row_count += len(data)
+        for column in data.columns:
+            self.distinct.setdefault(column, HyperLogLog(self.precision)).update(data[column])
+        for column in numeric_columns:
+            self.quantile_sketches.setdefault(column, KLLSketch(self.k, seed=self.seed)).update(data[column])
+
+    def count_duplicates(self, data: pd.DataFrame, columns: Sequence[str]) -> int:
+        """Rows of ``data`` whose key was already seen in this chunk or an earlier one"""
+        key = tuple(columns)
+        bloom = self.filters.setdefault(key, BloomFilter(self.bloom_capacity, self.bloom_error_rate))
+
+        hashes = hash_values(data[list(columns)])
+        within_chunk = pd.Series(hashes).duplicated().to_numpy()
+        first_seen = hashes[~within_chunk]
+        seen_before = bloom.contains(first_seen)
+        bloom.add(first_seen)
+
+        duplicates = int(within_chunk.sum() + seen_before.sum())
+        self.duplicates[key] = self.duplicates.get(key, 0) + duplicates
+        return duplicates
+
+    def quantiles(self, column: str, quantiles: Iterable[float]) -> Dict[float, float]:
+        sketch = self.quantile_sketches.get(column)
+        return sketch.quantiles(quantiles) if sketch else {}
+
+    def merge(self, other: "ValidationSketch"):
+        self.row_count += other.row_count
+        for column, sketch in other.distinct.items():
+            self.distinct.setdefault(column, HyperLogLog(self.precision)).merge(sketch)
+        for column, sketch in other.quantile_sketches.items():
+            self.quantile_sketches.setdefault(column, KLLSketch(self.k, seed=self.seed)).merge(sketch)
+        for key, bloom in other.filters.items():
+            self.filters.setdefault(key, BloomFilter(self.bloom_capacity, self.bloom_error_rate)).merge(bloom)
+            self.duplicates[key] = self.duplicates.get(key, 0) + other.duplicates.get(key, 0)
+
+    def accuracy(self) -> Dict[str, Any]:
+        """Error bounds of the current estimates"""
+        return {
+            "distinct_relative_error": 1.04 / np.sqrt(1 << self.precision),
+            "quantile_rank_error": 2.296 / self.k**0.9723,
+            "duplicate_false_positive_rate": {"+".join(key): bloom.false_positive_rate for key, bloom in self.filters.items()},
+            "bloom_capacity": self.bloom_capacity,
+            "bloom_over_capacity": ["+".join(key) for key, bloom in self.filters.items() if bloom.count > self.bloom_capacity],
+        }
+
+    def to_dict(self, quantiles: Iterable[float] = (0.25, 0.5, 0.75)) -> Dict[str, Any]:
+        """JSON-friendly estimates with their accuracy bounds"""
+        quantiles = list(quantiles)
+        return {
+            "rows": self.row_count,
+            "distinct_estimates": {str(column): sketch.count() for column, sketch in self.distinct.items()},
+            "quantiles": {
+                str(column): {str(q): v for q, v in sketch.quantiles(quantiles).items()}
+                for column, sketch in self.quantile_sketches.items()
+            },
+            "duplicates": {"+".join(key): count for key, count in self.duplicates.items()},
+            "accuracy": self.accuracy(),
+        }
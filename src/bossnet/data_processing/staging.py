@@ -0,0 +1,139 @@
+"""
+Parquet Staging
+===============
+Columnar hand-off of intermediate frames between pipeline stages
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Partition directory for rows with no value in a partition column; pyarrow cannot read null hive partitions back
+NULL_PARTITION = "__null__"
+
+
+class StagedArtifact(BaseModel):
+    """Reference to a staged Parquet dataset"""
+
+    stage: str
+    path: str
+    row_count: int
+    columns: List[str]
+    partition_cols: List[str] = []
+
+
+class ParquetStagingArea:
+    """Writes and reads per-stage Parquet datasets under ``<staging_dir>/<run_id>``"""
+
+    def __init__(self, staging_dir: str, run_id: str):
+        self.root = Path(staging_dir) / run_id
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._part_counters: Dict[str, int] = {}
+        self._layouts: Dict[str, StagedArtifact] = {}
+
+    def stage_path(self, stage: str) -> Path:
+        """Directory holding the dataset for ``stage``"""
+        return self.root / stage
+
+    def write(self, stage: str, data: pd.DataFrame, partition_cols: Optional[List[str]] = None) -> StagedArtifact:
+        """Replace the dataset for ``stage`` with ``data``"""
+        path = self.stage_path(stage)
+        if path.exists():
+            shutil.rmtree(path)
+        self._part_counters.pop(stage, None)
+        self._layouts.pop(stage, None)
+
+        return self.append(stage, data, partition_cols)
+
+    def append(self, stage: str, data: pd.DataFrame, partition_cols: Optional[List[str]] = None) -> StagedArtifact:
+        """Add ``data`` as a new part of the dataset for ``stage``"""
+        path = self.stage_path(stage)
+        path.mkdir(parents=True, exist_ok=True)
+
+        part = self._part_counters.get(stage, 0)
+        self._part_counters[stage] = part + 1
+
+        if partition_cols:
+            data = self._fill_null_partitions(data, partition_cols)
+
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        pq.write_to_dataset(
+            table,
+            root_path=str(path),
+            partition_cols=partition_cols or None,
+            basename_template=f"part-{part:05d}-{{i}}.parquet",
+        )
+
+        self.logger.debug(f"Staged {len(data)} records to {path} (part {part})")
+        artifact = StagedArtifact(
+            stage=stage,
+            path=str(path),
+            row_count=self.row_count(stage),
+            columns=list(data.columns),
+            partition_cols=partition_cols or [],
+        )
+        self._layouts[stage] = artifact
+        return artifact
+
+    def artifact(self, stage: str) -> Optional[StagedArtifact]:
+        """Layout of the last write to ``stage`` by this staging area"""
+        return self._layouts.get(stage)
+
+    def row_count(self, stage: str) -> int:
+        """Number of rows staged for ``stage``, read from Parquet footers only"""
+        return self._dataset(stage).count_rows()
+
+    def read(self, stage: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the dataset for ``stage``, projecting ``columns`` if given"""
+        return self._restore(stage, self._dataset(stage).to_table(columns=columns).to_pandas())
+
+    def iter_batches(self, stage: str, batch_size: int, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Yield the dataset for ``stage`` as DataFrames of at most ``batch_size`` rows"""
+        for record_batch in self._dataset(stage).to_batches(columns=columns, batch_size=batch_size):
+            if record_batch.num_rows:
+                yield self._restore(stage, record_batch.to_pandas())
+
+    def cleanup(self):
+        """Remove everything staged for this run"""
+        if self.root.exists():
+            shutil.rmtree(self.root)
+
+    def _fill_null_partitions(self, data: pd.DataFrame, partition_cols: List[str]) -> pd.DataFrame:
+        data = data.copy()
+        for column in partition_cols:
+            values = data[column].astype("string")
+            missing = values.isna() | (values.str.strip() == "")
+            if missing.any():
+                self.logger.info(f"Staging {int(missing.sum())} records without a {column} under {NULL_PARTITION}")
+            data[column] = values.mask(missing, NULL_PARTITION).astype(object)
+        return data
+
+    def _restore(self, stage: str, frame: pd.DataFrame) -> pd.DataFrame:
+        """Undo partitioning: plain partition values, nulls for NULL_PARTITION, and the staged column order"""
+        artifact = self._layouts.get(stage)
+        if artifact is None or not artifact.partition_cols:
+            return frame
+
+        for column in artifact.partition_cols:
+            if column in frame.columns:
+                values = frame[column].astype(object)
+                frame[column] = values.mask(values == NULL_PARTITION, None)
+        return frame[[column for column in artifact.columns if column in frame.columns]]
+
+    def _dataset(self, stage: str) -> ds.Dataset:
+        artifact = self._layouts.get(stage)
+        partitioning = "hive"
+        if artifact is not None and artifact.partition_cols:
+            # Read partition values back as the strings they were written as, not inferred or dictionary types
+            schema = pa.schema([(column, pa.string()) for column in artifact.partition_cols])
+            partitioning = ds.partitioning(schema, flavor="hive")
+        return ds.dataset(str(self.stage_path(stage)), format="parquet", partitioning=partitioning)
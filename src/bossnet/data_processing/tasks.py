@@ -0,0 +1,137 @@
+"""
+Pipeline Tasks
+==============
+Celery fan-out of a pipeline run across source partitions
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from celery import chord, group
+from celery.result import AsyncResult
+from src.data_processing.extractors import plan_csv_byte_ranges
+from src.data_processing.instrumentation import merge_stage_metrics
+from src.data_processing.pipeline import DataPipeline, PipelineConfig, PipelineResult, celery_app, new_pipeline_id
+
+logger = logging.getLogger(__name__)
+
+PARTITION_COUNTERS = ["records_processed", "records_inserted", "records_updated", "records_unchanged", "records_failed"]
+
+
+def plan_partitions(config: PipelineConfig) -> List[Dict[str, Any]]:
+    """Split the pipeline source into partitions of roughly ``partition_size_bytes``"""
+    if config.source_type != "csv":
+        raise ValueError(f"Fan-out is only supported for csv sources, not {config.source_type}")
+
+    byte_ranges = plan_csv_byte_ranges(config.source_path, config.partition_size_bytes, config.skip_rows)
+    return [
+        {"partition_id": f"part-{index:05d}", "byte_range": [start, end]} for index, (start, end) in enumerate(byte_ranges)
+    ]
+
+
+@celery_app.task(bind=True)
+def run_partition_task(self, config_dict: Dict[str, Any], partition: Dict[str, Any], pipeline_id: str) -> Dict[str, Any]:
+    """Extract, transform and load a single source partition
+
+    Each partition checkpoints under its own run id, derived from the fan-out
+    ``pipeline_id``, so a resumed partition skips the batches it already loaded.
+    """
+    summary = {**partition, "status": "failed", "validation_errors": [], "processing_errors": []}
+
+    try:
+        config = PipelineConfig(**{**config_dict, "fan_out": False, "partition": partition})
+        pipeline = DataPipeline(config, pipeline_id=f"{pipeline_id}_{partition['partition_id']}")
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            result = loop.run_until_complete(pipeline.execute())
+        finally:
+            loop.close()
+
+        summary.update({counter: getattr(result, counter) for counter in PARTITION_COUNTERS})
+        summary["validation_errors"] = result.validation_errors
+        summary["processing_errors"] = result.processing_errors
+        summary["stage_metrics"] = result.stage_metrics
+        # A partition with failed records or errors is retried as a whole on resume; upserts make that safe
+        succeeded = result.status == "completed" and not result.records_failed and not result.processing_errors
+        summary["status"] = "completed" if succeeded else "failed"
+
+    except Exception as e:
+        # Report the failure instead of raising so the chord callback still aggregates the other partitions
+        logger.error(f"Partition {partition.get('partition_id')} failed: {str(e)}")
+        summary["processing_errors"].append(str(e))
+
+    return summary
+
+
+@celery_app.task
+def aggregate_partition_results(
+    partition_results: List[Dict[str, Any]],
+    pipeline_id: str,
+    start_time: str,
+    previous_partitions: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Chord callback: roll per-partition summaries up into one PipelineResult"""
+    partitions = {partition["partition_id"]: partition for partition in previous_partitions or []}
+    partitions.update({partition["partition_id"]: partition for partition in partition_results})
+
+    result = PipelineResult(pipeline_id=pipeline_id, status="running", start_time=start_time)
+    result.partitions = [partitions[partition_id] for partition_id in sorted(partitions)]
+
+    for partition in result.partitions:
+        for counter in PARTITION_COUNTERS:
+            setattr(result, counter, getattr(result, counter) + partition.get(counter, 0))
+        result.validation_errors.extend(f"{partition['partition_id']}: {e}" for e in partition["validation_errors"])
+        result.processing_errors.extend(f"{partition['partition_id']}: {e}" for e in partition["processing_errors"])
+
+    # Stage seconds are summed across partitions, i.e. worker time rather than wall-clock time
+    result.stage_metrics = merge_stage_metrics([partition.get("stage_metrics", {}) for partition in result.partitions])
+
+    failed = [partition["partition_id"] for partition in result.partitions if partition["status"] != "completed"]
+    result.status = "failed" if failed else "completed"
+    result.end_time = datetime.now()
+    result.execution_time_seconds = (result.end_time - result.start_time).total_seconds()
+
+    if failed:
+        logger.warning(f"Pipeline {pipeline_id}: {len(failed)} of {len(result.partitions)} partitions failed: {failed}")
+    else:
+        logger.info(f"Pipeline {pipeline_id} completed across {len(result.partitions)} partitions")
+
+    return result.dict()
+
+
+def dispatch_partitions(
+    config: PipelineConfig,
+    partitions: Optional[List[Dict[str, Any]]] = None,
+    pipeline_id: Optional[str] = None,
+    previous_partitions: Optional[List[Dict[str, Any]]] = None,
+) -> AsyncResult:
+    """Run one task per partition as a chord whose callback aggregates the results"""
+    pipeline_id = pipeline_id or new_pipeline_id()
+    partitions = plan_partitions(config) if partitions is None else partitions
+    callback = aggregate_partition_results.s(pipeline_id, datetime.now().isoformat(), previous_partitions or [])
+
+    logger.info(f"Dispatching pipeline {pipeline_id} as {len(partitions)} partitions")
+
+    if not partitions:
+        return callback.delay([])
+
+    config_dict = config.dict()
+    return chord(group(run_partition_task.s(config_dict, partition, pipeline_id) for partition in partitions))(callback)
+
+
+def resume_failed_partitions(previous_result: Dict[str, Any], config: PipelineConfig) -> AsyncResult:
+    """Re-dispatch only the partitions that did not complete in ``previous_result``"""
+    completed = [p for p in previous_result.get("partitions", []) if p["status"] == "completed"]
+    failed = [
+        {"partition_id": p["partition_id"], "byte_range": p["byte_range"]}
+        for p in previous_result.get("partitions", [])
+        if p["status"] != "completed"
+    ]
+
+    logger.info(f"Resuming pipeline {previous_result['pipeline_id']}: {len(failed)} failed partitions")
+    return dispatch_partitions(config, failed, previous_result["pipeline_id"], completed)
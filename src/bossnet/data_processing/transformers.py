@@ -4,18 +4,103 @@ Data Transformers
 Transform and clean extracted data for loading into the warehouse
 """
 
+import asyncio
 import logging
 import re
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime
 from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field, validator
+from src.data_processing.schemas import TableSchema
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by the vectorised cleaning helpers
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SPECIAL_CHARS_PATTERN = re.compile(r"[^\w\s]")
+NON_DIGIT_PATTERN = re.compile(r"\D")
+PHONE_PREFIX_PATTERN = re.compile(r"^(?:880|0)")
+BD_MOBILE_PATTERN = re.compile(r"1\d{9}")
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+def map_unique(series: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Apply a vectorised string function to the distinct values only and broadcast back.
+
+    Low-cardinality columns (divisions, districts, repeated names) are cleaned
+    once per distinct value instead of once per row.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Clean the categories and keep the column categorical; categories that clean alike merge
+        cleaned = func(pd.Series(series.cat.categories, dtype=object)).to_numpy(dtype=object)
+        values = pd.Categorical(cleaned).take(series.cat.codes.to_numpy(), allow_fill=True)
+        return pd.Series(values, index=series.index, name=series.name)
+
+    codes, uniques = pd.factorize(series)
+    cleaned = func(pd.Series(uniques, dtype=object)).to_numpy(dtype=object)
+    # Missing values factorize to -1, which picks up the trailing None
+    cleaned = np.append(cleaned, [None])
+    return pd.Series(cleaned[codes], index=series.index, name=series.name, dtype=object)
+
+
+def as_text(series: pd.Series) -> pd.Series:
+    """``series.astype(str)``, except that categoricals stay categorical
+
+    Only the categories are converted; nulls become ``"nan"`` as they do
+    with ``astype(str)``.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(str)
+
+    codes = series.cat.codes.to_numpy()
+    labels = series.cat.categories.astype(str).to_numpy(dtype=object)
+    if (codes == -1).any():
+        # -1 (missing) picks up the trailing "nan"
+        labels = np.append(labels, "nan")
+    return pd.Series(pd.Categorical(labels).take(codes), index=series.index, name=series.name)
+
+
+def _clean_text_values(values: pd.Series, case: str = "title", remove_special_chars: bool = False) -> pd.Series:
+    """Strip, collapse whitespace, convert case and optionally drop special characters"""
+    # Remove extra whitespace and collapse multiple spaces
+    values = values.str.strip().str.replace(WHITESPACE_PATTERN, " ", regex=True)
+
+    # Handle case conversion
+    if case == "upper":
+        values = values.str.upper()
+    elif case == "lower":
+        values = values.str.lower()
+    elif case == "title":
+        values = values.str.title()
+
+    # Remove special characters if specified
+    if remove_special_chars:
+        values = values.str.replace(SPECIAL_CHARS_PATTERN, "", regex=True)
+
+    return values
+
+
+# String operations work on distinct values only, so consecutive ones on a column are fused into one pass
+STRING_OPERATIONS: Dict[str, Callable[..., pd.Series]] = {
+    "strip": lambda values: values.str.strip(),
+    "upper": lambda values: values.str.upper(),
+    "lower": lambda values: values.str.lower(),
+    "title": lambda values: values.str.title(),
+    "collapse_whitespace": lambda values: values.str.replace(WHITESPACE_PATTERN, " ", regex=True),
+    "remove_special_chars": lambda values: values.str.replace(SPECIAL_CHARS_PATTERN, "", regex=True),
+    "replace": lambda values, pattern, repl="": values.str.replace(pattern, repl, regex=True),
+    "clean": _clean_text_values,
+}
+
+# Operations that need the whole column and always run as their own step
+COLUMN_OPERATIONS = ["normalize_phone", "validate_email", "parse_date", "map", "fillna"]
+
 
 class TransformationRule(BaseModel):
     """Configuration for a single transformation rule"""
@@ -25,6 +110,40 @@ class TransformationRule(BaseModel):
     parameters: Dict[str, Any] = {}
     required: bool = True
 
+    @validator("operation")
+    def validate_operation(cls, v):
+        valid_operations = list(STRING_OPERATIONS) + COLUMN_OPERATIONS
+        if v not in valid_operations:
+            raise ValueError(f"operation must be one of {valid_operations}")
+        return v
+
+    @property
+    def is_string_operation(self) -> bool:
+        return self.operation in STRING_OPERATIONS
+
+
+class PlanStep(BaseModel):
+    """One pass over a column: a run of fused string operations or a single column operation"""
+
+    column: str
+    rules: List[TransformationRule]
+    fused: bool = False
+
+    @property
+    def operations(self) -> List[str]:
+        return [rule.operation for rule in self.rules]
+
+
+class TransformationPlan(BaseModel):
+    """Compiled, ordered execution plan for the registered transformation rules"""
+
+    steps: Dict[str, List[PlanStep]] = {}
+    skipped_columns: List[str] = []
+
+    @property
+    def passes(self) -> int:
+        return sum(len(steps) for steps in self.steps.values())
+
 
 class TransformationResult(BaseModel):
     """Result of data transformation"""
@@ -46,16 +165,144 @@ class BaseTransformer(ABC):
         self.transformation_rules: List[TransformationRule] = []
         self.column_mappings: Dict[str, str] = {}
         self.required_columns: List[str] = []
+        # Worker processes for independent rule columns (0 = inline)
+        self.rule_workers = 0
+        # Final dtypes for the transformed frame, applied last when set
+        self.schema: Optional[TableSchema] = None
+        # Cumulative seconds and calls per transform step, read by pipeline instrumentation
+        self.step_timings: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def _step(self, name: str):
+        """Time one step of ``transform`` into ``step_timings``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self.step_timings.setdefault(name, {"calls": 0, "seconds": 0.0})
+            timing["calls"] += 1
+            timing["seconds"] += time.perf_counter() - start
 
     @abstractmethod
     async def transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """Transform the input data"""
         pass
 
+    def _conform_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast the transformed frame to the schema's final dtypes, if a schema is set"""
+        if self.schema is None:
+            return df
+        with self._step("conform_dtypes"):
+            return self.schema.conform(df)
+
     def add_transformation_rule(self, rule: TransformationRule):
         """Add a transformation rule"""
         self.transformation_rules.append(rule)
 
+    def add_transformation_rules(self, rules: List[Union[TransformationRule, Dict[str, Any]]]):
+        """Add transformation rules, e.g. per-board cleaning rules loaded from configuration"""
+        for rule in rules:
+            self.add_transformation_rule(rule if isinstance(rule, TransformationRule) else TransformationRule(**rule))
+
+    def compile_rules(self, columns: List[str]) -> TransformationPlan:
+        """Compile the registered rules into an ordered plan for a frame with ``columns``
+
+        Rules keep their registration order per column, consecutive string
+        operations on a column are fused into one step and rules for columns
+        that are not present are skipped.
+        """
+        plan = TransformationPlan()
+        available = set(columns)
+
+        for rule in self.transformation_rules:
+            if rule.column not in available:
+                if rule.column not in plan.skipped_columns:
+                    plan.skipped_columns.append(rule.column)
+                continue
+
+            steps = plan.steps.setdefault(rule.column, [])
+            if rule.is_string_operation and steps and steps[-1].fused:
+                steps[-1].rules.append(rule)
+            else:
+                steps.append(PlanStep(column=rule.column, rules=[rule], fused=rule.is_string_operation))
+
+        return plan
+
+    async def apply_transformation_rules(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Execute the registered rules, running independent columns in worker processes when enabled
+
+        Rules never read across columns, so with ``rule_workers`` set each
+        column's steps run in their own process. The column and its result are
+        pickled both ways, which only pays off when several columns have
+        expensive steps; by default columns run inline.
+        """
+        if not self.transformation_rules:
+            return df
+
+        plan = self.compile_rules(list(df.columns))
+
+        missing_required = [
+            rule.column for rule in self.transformation_rules if rule.required and rule.column in plan.skipped_columns
+        ]
+        if missing_required:
+            self.logger.warning(f"Skipping transformation rules for missing columns: {sorted(set(missing_required))}")
+
+        if not plan.steps:
+            return df
+
+        workers = min(self.rule_workers, len(plan.steps))
+        if workers <= 1:
+            results = [self._run_plan_steps(df[column], steps) for column, steps in plan.steps.items()]
+        else:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, self._run_plan_steps, df[column], steps)
+                        for column, steps in plan.steps.items()
+                    )
+                )
+
+        for column, series in zip(plan.steps, results):
+            df[column] = series
+
+        self.logger.info(
+            f"Applied {len(self.transformation_rules)} transformation rules in {plan.passes} column passes "
+            f"across {len(plan.steps)} columns"
+        )
+        return df
+
+    def _run_plan_steps(self, series: pd.Series, steps: List[PlanStep]) -> pd.Series:
+        """Run the plan steps for a single column in order"""
+        for step in steps:
+            if step.fused:
+                series = map_unique(series, lambda values, rules=step.rules: self._apply_string_rules(values, rules))
+            else:
+                series = self._apply_column_rule(series, step.rules[0])
+        return series
+
+    @staticmethod
+    def _apply_string_rules(values: pd.Series, rules: List[TransformationRule]) -> pd.Series:
+        values = values.astype(str)
+        for rule in rules:
+            values = STRING_OPERATIONS[rule.operation](values, **rule.parameters)
+        return values
+
+    def _apply_column_rule(self, series: pd.Series, rule: TransformationRule) -> pd.Series:
+        if rule.operation == "normalize_phone":
+            return self._normalize_phone_number(series)
+        elif rule.operation == "validate_email":
+            return self._validate_email(series)
+        elif rule.operation == "parse_date":
+            return self._parse_date_column(series, **rule.parameters)
+        elif rule.operation == "map":
+            mapped = series.map(rule.parameters["mapping"])
+            return mapped.fillna(rule.parameters["default"]) if "default" in rule.parameters else mapped
+        elif rule.operation == "fillna":
+            return series.fillna(rule.parameters["value"])
+        else:
+            raise ValueError(f"Unsupported column operation: {rule.operation}")
+
     def set_column_mapping(self, source_column: str, target_column: str):
         """Set column name mapping"""
         self.column_mappings[source_column] = target_column
@@ -81,50 +328,21 @@ class BaseTransformer(ABC):
 
     def _clean_text_column(self, series: pd.Series, **kwargs) -> pd.Series:
         """Clean text data"""
-        # Remove extra whitespace
-        series = series.astype(str).str.strip()
-
-        # Remove multiple spaces
-        series = series.str.replace(r"\s+", " ", regex=True)
-
-        # Handle case conversion
         case = kwargs.get("case", "title")
-        if case == "upper":
-            series = series.str.upper()
-        elif case == "lower":
-            series = series.str.lower()
-        elif case == "title":
-            series = series.str.title()
+        remove_special_chars = kwargs.get("remove_special_chars", False)
 
-        # Remove special characters if specified
-        if kwargs.get("remove_special_chars", False):
-            series = series.str.replace(r"[^\w\s]", "", regex=True)
-
-        return series
+        return map_unique(as_text(series), lambda values: _clean_text_values(values, case, remove_special_chars))
 
     def _normalize_phone_number(self, series: pd.Series) -> pd.Series:
         """Normalize phone numbers to standard format"""
+        # Remove all non-digits, then the country code or leading zero
+        digits = series.astype(str).str.replace(NON_DIGIT_PATTERN, "", regex=True)
+        digits = digits.str.replace(PHONE_PREFIX_PATTERN, "", regex=True)
 
-        def clean_phone(phone):
-            if pd.isna(phone):
-                return None
-
-            # Convert to string and remove all non-digits
-            phone_str = re.sub(r"\D", "", str(phone))
-
-            # Handle Bangladesh phone numbers
-            if phone_str.startswith("880"):
-                phone_str = phone_str[3:]  # Remove country code
-            elif phone_str.startswith("0"):
-                phone_str = phone_str[1:]  # Remove leading zero
-
-            # Validate length (should be 10 digits for Bangladesh mobile)
-            if len(phone_str) == 10 and phone_str.startswith("1"):
-                return f"+880{phone_str}"
-
-            return None
+        # Valid Bangladesh mobile numbers are 10 digits starting with 1
+        valid = digits.str.fullmatch(BD_MOBILE_PATTERN) & series.notna()
 
-        return series.apply(clean_phone)
+        return ("+880" + digits).astype(object).where(valid, None)
 
     def _parse_date_column(self, series: pd.Series, **kwargs) -> pd.Series:
         """Parse and standardize date columns"""
@@ -141,14 +359,8 @@ class BaseTransformer(ABC):
 
     def _validate_email(self, series: pd.Series) -> pd.Series:
         """Validate email addresses"""
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-        def is_valid_email(email):
-            if pd.isna(email):
-                return None
-            return email if re.match(email_pattern, str(email)) else None
-
-        return series.apply(is_valid_email)
+        valid = series.astype(str).str.match(EMAIL_PATTERN) & series.notna()
+        return series.astype(object).where(valid, None)
 
 
 class StudentDataTransformer(BaseTransformer):
@@ -179,7 +391,8 @@ class StudentDataTransformer(BaseTransformer):
             self.logger.info(f"Starting transformation of {len(data)} student records")
 
             # Apply column mappings
-            df = self._apply_column_mappings(data.copy())
+            with self._step("column_mappings"):
+                df = self._apply_column_mappings(data.copy())
 
             # Validate required columns
             missing_cols = self._validate_required_columns(df)
@@ -187,19 +400,28 @@ class StudentDataTransformer(BaseTransformer):
                 raise ValueError(f"Missing required columns: {missing_cols}")
 
             # Transform individual columns
-            df = await self._transform_student_columns(df)
+            with self._step("clean_columns"):
+                df = await self._transform_student_columns(df)
+
+            # Apply configured transformation rules
+            with self._step("transformation_rules"):
+                df = await self.apply_transformation_rules(df)
 
             # Add computed columns
-            df = self._add_computed_columns(df)
+            with self._step("computed_columns"):
+                df = self._add_computed_columns(df)
 
             # Remove duplicates
             initial_count = len(df)
-            df = df.drop_duplicates(subset=["student_id"], keep="first")
+            with self._step("deduplicate"):
+                df = df.drop_duplicates(subset=["student_id"], keep="first")
             duplicates_removed = initial_count - len(df)
 
             if duplicates_removed > 0:
                 self.logger.info(f"Removed {duplicates_removed} duplicate records")
 
+            df = self._conform_dtypes(df)
+
             self.logger.info(f"Successfully transformed {len(df)} student records")
             return df
 
@@ -232,8 +454,9 @@ class StudentDataTransformer(BaseTransformer):
                 "2": "Female",
                 "3": "Other",
             }
-            df["gender"] = df["gender"].astype(str).str.upper().map(gender_mapping)
-            df["gender"] = df["gender"].fillna("Unknown")
+            df["gender"] = map_unique(
+                as_text(df["gender"]), lambda values: values.str.upper().map(gender_mapping).fillna("Unknown")
+            )
 
         # Parse date of birth
         if "date_of_birth" in df.columns:
@@ -317,7 +540,8 @@ class SchoolDataTransformer(BaseTransformer):
             self.logger.info(f"Starting transformation of {len(data)} school records")
 
             # Apply column mappings
-            df = self._apply_column_mappings(data.copy())
+            with self._step("column_mappings"):
+                df = self._apply_column_mappings(data.copy())
 
             # Validate required columns
             missing_cols = self._validate_required_columns(df)
@@ -325,19 +549,28 @@ class SchoolDataTransformer(BaseTransformer):
                 raise ValueError(f"Missing required columns: {missing_cols}")
 
             # Transform individual columns
-            df = await self._transform_school_columns(df)
+            with self._step("clean_columns"):
+                df = await self._transform_school_columns(df)
+
+            # Apply configured transformation rules
+            with self._step("transformation_rules"):
+                df = await self.apply_transformation_rules(df)
 
             # Add computed columns
-            df = self._add_school_computed_columns(df)
+            with self._step("computed_columns"):
+                df = self._add_school_computed_columns(df)
 
             # Remove duplicates
             initial_count = len(df)
-            df = df.drop_duplicates(subset=["school_id"], keep="first")
+            with self._step("deduplicate"):
+                df = df.drop_duplicates(subset=["school_id"], keep="first")
             duplicates_removed = initial_count - len(df)
 
             if duplicates_removed > 0:
                 self.logger.info(f"Removed {duplicates_removed} duplicate records")
 
+            df = self._conform_dtypes(df)
+
             self.logger.info(f"Successfully transformed {len(df)} school records")
             return df
 
@@ -366,8 +599,9 @@ class SchoolDataTransformer(BaseTransformer):
                 "MADRASA": "Madrasa",
                 "TECHNICAL": "Technical",
             }
-            df["school_type"] = df["school_type"].astype(str).str.upper()
-            df["school_type"] = df["school_type"].map(type_mapping).fillna("Other")
+            df["school_type"] = map_unique(
+                as_text(df["school_type"]), lambda values: values.str.upper().map(type_mapping).fillna("Other")
+            )
 
         # Standardize education level
         if "education_level" in df.columns:
@@ -378,8 +612,9 @@ class SchoolDataTransformer(BaseTransformer):
                 "TECHNICAL": "Technical",
                 "MADRASA": "Madrasa",
             }
-            df["education_level"] = df["education_level"].astype(str).str.upper()
-            df["education_level"] = df["education_level"].map(level_mapping).fillna("Other")
+            df["education_level"] = map_unique(
+                as_text(df["education_level"]), lambda values: values.str.upper().map(level_mapping).fillna("Other")
+            )
 
         # Clean geographic information
         for col in ["division", "district", "upazila", "union"]:
@@ -439,21 +674,27 @@ class EnrollmentDataTransformer(BaseTransformer):
             if missing_cols:
                 raise ValueError(f"Missing required columns: {missing_cols}")
 
-            # Clean IDs
-            df["student_id"] = df["student_id"].astype(str).str.strip().str.upper()
-            df["school_id"] = df["school_id"].astype(str).str.strip().str.upper()
+            with self._step("clean_columns"):
+                # Clean IDs
+                df["student_id"] = df["student_id"].astype(str).str.strip().str.upper()
+                df["school_id"] = df["school_id"].astype(str).str.strip().str.upper()
 
-            # Standardize academic year format
-            df["academic_year"] = df["academic_year"].astype(str).str.strip()
+                # Standardize academic year format
+                df["academic_year"] = df["academic_year"].astype(str).str.strip()
 
-            # Standardize grade level
-            df["grade_level"] = df["grade_level"].astype(str).str.strip()
+                # Standardize grade level
+                df["grade_level"] = df["grade_level"].astype(str).str.strip()
+
+            # Apply configured transformation rules
+            with self._step("transformation_rules"):
+                df = await self.apply_transformation_rules(df)
 
             # Parse enrollment date
-            if "enrollment_date" in df.columns:
-                df["enrollment_date"] = self._parse_date_column(df["enrollment_date"])
-            else:
-                df["enrollment_date"] = pd.Timestamp.now()
+            with self._step("parse_dates"):
+                if "enrollment_date" in df.columns:
+                    df["enrollment_date"] = self._parse_date_column(df["enrollment_date"])
+                else:
+                    df["enrollment_date"] = pd.Timestamp.now()
 
             # Add enrollment status
             if "enrollment_status" not in df.columns:
@@ -465,12 +706,15 @@ class EnrollmentDataTransformer(BaseTransformer):
 
             # Remove duplicates
             initial_count = len(df)
-            df = df.drop_duplicates(subset=["student_id", "school_id", "academic_year"], keep="first")
+            with self._step("deduplicate"):
+                df = df.drop_duplicates(subset=["student_id", "school_id", "academic_year"], keep="first")
             duplicates_removed = initial_count - len(df)
 
             if duplicates_removed > 0:
                 self.logger.info(f"Removed {duplicates_removed} duplicate enrollment records")
 
+            df = self._conform_dtypes(df)
+
             self.logger.info(f"Successfully transformed {len(df)} enrollment records")
             return df
 
@@ -4,20 +4,31 @@ Data Quality Validators
 Comprehensive data validation using Great Expectations and custom rules
 """
 
+import hashlib
 import logging
+import time
+from collections import deque
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 import great_expectations as ge
-import numpy as np
 import pandas as pd
 from great_expectations.checkpoint import SimpleCheckpoint
 from great_expectations.core.batch import RuntimeBatchRequest
 from pydantic import BaseModel, Field
 
+from .profiling import DataProfile
+from .sketches import ValidationSketch
+
 logger = logging.getLogger(__name__)
 
 
+def schema_hash(data: pd.DataFrame) -> str:
+    """Stable hash of column names and dtypes, used to key cached expectation suites"""
+    schema = "|".join(f"{column}:{dtype}" for column, dtype in data.dtypes.items())
+    return hashlib.sha1(schema.encode("utf-8")).hexdigest()
+
+
 class ValidationRule(BaseModel):
     """Configuration for a validation rule"""
 
@@ -51,8 +62,27 @@ class DataQualityValidator:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.validation_rules: List[ValidationRule] = []
         self.ge_context = None
+        self._ge_cache: Dict[Tuple[str, str], Tuple[SimpleCheckpoint, str]] = {}
+        self.ge_results: Deque[Dict[str, Any]] = deque(maxlen=self.config.get("ge_result_history", 100))
         self._initialize_great_expectations()
 
+        # Approximate mode keeps mergeable sketches across every batch this validator sees
+        self.approximate = self.config.get("approximate", False)
+        self.sketch: Optional[ValidationSketch] = self._new_sketch() if self.approximate else None
+
+    def _new_sketch(self) -> ValidationSketch:
+        return ValidationSketch(
+            precision=self.config.get("hll_precision", 14),
+            k=self.config.get("quantile_k", 200),
+            bloom_capacity=self.config.get("bloom_capacity", 1_000_000),
+            bloom_error_rate=self.config.get("bloom_error_rate", 0.001),
+        )
+
+    def reset_sketches(self):
+        """Start a new dataset in approximate mode"""
+        if self.approximate:
+            self.sketch = self._new_sketch()
+
     def _initialize_great_expectations(self):
         """Initialize Great Expectations context"""
         try:
@@ -76,20 +106,25 @@ class DataQualityValidator:
         try:
             self.logger.info(f"Starting validation of {len(data)} records")
 
+            # Profile every column once; the checks below read from the shared profile
+            profile = DataProfile(data)
+            result.validation_details["profile"] = profile.to_dict()
+
             # Basic data structure validation
-            structure_errors = self._validate_data_structure(data)
+            structure_errors = self._validate_data_structure(data, profile)
             if structure_errors:
                 result.errors.extend(structure_errors)
                 result.is_valid = False
 
             # Apply custom validation rules
-            custom_errors, custom_warnings = await self._apply_custom_rules(data)
+            custom_errors, custom_warnings, rule_timings = await self._apply_custom_rules(data, profile)
             result.errors.extend(custom_errors)
             result.warnings.extend(custom_warnings)
+            result.validation_details["rule_timings"] = rule_timings
 
             # Great Expectations validation
             if self.ge_context:
-                ge_result = await self._run_great_expectations(data, table_name)
+                ge_result = await self._run_great_expectations(data, table_name, profile)
                 result.validation_details["great_expectations"] = ge_result
 
                 if not ge_result.get("success", True):
@@ -97,12 +132,16 @@ class DataQualityValidator:
                     result.is_valid = False
 
             # Statistical validation
-            stats_result = self._validate_statistics(data)
+            stats_result = self._validate_statistics(data, profile)
             result.validation_details["statistics"] = stats_result
             result.warnings.extend(stats_result.get("warnings", []))
 
+            # Sketch estimates cover every batch seen so far, with their error bounds
+            if self.sketch:
+                result.validation_details["sketches"] = self.sketch.to_dict()
+
             # Business rule validation
-            business_errors = await self._validate_business_rules(data, table_name)
+            business_errors = await self._validate_business_rules(data, table_name, profile)
             result.errors.extend(business_errors)
 
             # Calculate final results
@@ -130,7 +169,7 @@ class DataQualityValidator:
             result.is_valid = False
             return result
 
-    def _validate_data_structure(self, data: pd.DataFrame) -> List[str]:
+    def _validate_data_structure(self, data: pd.DataFrame, profile: Optional[DataProfile] = None) -> List[str]:
         """Validate basic data structure"""
         errors = []
 
@@ -138,8 +177,10 @@ class DataQualityValidator:
             errors.append("CRITICAL: DataFrame is empty")
             return errors
 
+        profile = profile or DataProfile(data)
+
         # Check for completely empty columns
-        empty_columns = data.columns[data.isnull().all()].tolist()
+        empty_columns = profile.empty_columns
         if empty_columns:
             errors.append(f"Columns are completely empty: {empty_columns}")
 
@@ -155,54 +196,87 @@ class DataQualityValidator:
 
         return errors
 
-    async def _apply_custom_rules(self, data: pd.DataFrame) -> tuple[List[str], List[str]]:
-        """Apply custom validation rules"""
+    async def _apply_custom_rules(
+        self, data: pd.DataFrame, profile: Optional[DataProfile] = None
+    ) -> tuple[List[str], List[str], Dict[str, Dict[str, Any]]]:
+        """Apply custom validation rules in registration order, timing each rule
+
+        Rules run inline rather than in parallel groups. Most read the shared
+        profile in O(distinct values), so once it is built they take well
+        under a millisecond even for a million rows, far less than pickling
+        the frame and profile to a worker process. Approximate mode also
+        updates ``self.sketch``, which a worker process could not share.
+        """
         errors = []
         warnings = []
+        timings = {}
+        profile = profile or DataProfile(data)
 
         for rule in self.validation_rules:
+            rule_result, error = None, None
+            start = time.perf_counter()
             try:
-                rule_result = await self._execute_validation_rule(data, rule)
-
-                if rule.severity == "error" and not rule_result["passed"]:
-                    errors.extend(rule_result["messages"])
-                elif rule.severity == "warning" and not rule_result["passed"]:
-                    warnings.extend(rule_result["messages"])
-
+                rule_result = self._evaluate_rule(data, rule, profile)
             except Exception as e:
-                errors.append(f"Rule '{rule.rule_name}' execution failed: {str(e)}")
+                error = str(e)
+            seconds = time.perf_counter() - start
 
-        return errors, warnings
-
-    async def _execute_validation_rule(self, data: pd.DataFrame, rule: ValidationRule) -> Dict[str, Any]:
+            # Rules sharing a name (e.g. one range check per column) add up under that name
+            timing = timings.setdefault(
+                rule.rule_name, {"rule_type": rule.rule_type, "calls": 0, "seconds": 0.0, "passed": True}
+            )
+            timing["calls"] += 1
+            timing["seconds"] += seconds
+            timing["passed"] = timing["passed"] and bool(rule_result and rule_result["passed"])
+
+            if error:
+                errors.append(f"Rule '{rule.rule_name}' execution failed: {error}")
+            elif rule.severity == "error" and not rule_result["passed"]:
+                errors.extend(rule_result["messages"])
+            elif rule.severity == "warning" and not rule_result["passed"]:
+                warnings.extend(rule_result["messages"])
+
+        slowest = max(timings.items(), key=lambda item: item[1]["seconds"], default=None)
+        if slowest:
+            self.logger.debug(f"Slowest validation rule: {slowest[0]} ({slowest[1]['seconds']:.4f}s)")
+
+        return errors, warnings, timings
+
+    async def _execute_validation_rule(
+        self, data: pd.DataFrame, rule: ValidationRule, profile: Optional[DataProfile] = None
+    ) -> Dict[str, Any]:
         """Execute a single validation rule"""
+        return self._evaluate_rule(data, rule, profile or DataProfile(data))
+
+    def _evaluate_rule(self, data: pd.DataFrame, rule: ValidationRule, profile: DataProfile) -> Dict[str, Any]:
+        """Dispatch a rule to its check"""
         result = {"passed": True, "messages": []}
 
         if rule.rule_type == "completeness":
-            result = self._check_completeness(data, rule)
+            result = self._check_completeness(profile, rule)
         elif rule.rule_type == "uniqueness":
-            result = self._check_uniqueness(data, rule)
+            result = self._check_uniqueness(data, rule, profile)
         elif rule.rule_type == "validity":
-            result = self._check_validity(data, rule)
+            result = self._check_validity(profile, rule)
         elif rule.rule_type == "consistency":
             result = self._check_consistency(data, rule)
         elif rule.rule_type == "accuracy":
-            result = self._check_accuracy(data, rule)
+            result = self._check_accuracy(profile, rule)
         else:
             result["passed"] = False
             result["messages"] = [f"Unknown rule type: {rule.rule_type}"]
 
         return result
 
-    def _check_completeness(self, data: pd.DataFrame, rule: ValidationRule) -> Dict[str, Any]:
+    def _check_completeness(self, profile: DataProfile, rule: ValidationRule) -> Dict[str, Any]:
         """Check data completeness"""
         column = rule.column
         threshold = rule.parameters.get("threshold", 0.95)  # 95% completeness by default
 
-        if column not in data.columns:
+        if column not in profile:
             return {"passed": False, "messages": [f"Column '{column}' not found"]}
 
-        completeness_ratio = 1 - (data[column].isnull().sum() / len(data))
+        completeness_ratio = 1 - (profile[column].null_count / profile.row_count)
 
         if completeness_ratio < threshold:
             return {
@@ -212,22 +286,29 @@ class DataQualityValidator:
 
         return {"passed": True, "messages": []}
 
-    def _check_uniqueness(self, data: pd.DataFrame, rule: ValidationRule) -> Dict[str, Any]:
+    def _check_uniqueness(self, data: pd.DataFrame, rule: ValidationRule, profile: DataProfile) -> Dict[str, Any]:
         """Check data uniqueness"""
         columns = rule.parameters.get("columns", [rule.column])
 
-        if not all(col in data.columns for col in columns):
-            missing = [col for col in columns if col not in data.columns]
+        if not all(col in profile for col in columns):
+            missing = [col for col in columns if col not in profile]
             return {"passed": False, "messages": [f"Columns not found: {missing}"]}
 
-        duplicates = data.duplicated(subset=columns).sum()
+        # Approximate mode checks keys against all earlier batches; otherwise single-column keys
+        # come straight from the profile and composite keys need the rows
+        if self.sketch:
+            duplicates = self.sketch.count_duplicates(data, columns)
+        elif len(columns) == 1:
+            duplicates = profile[columns[0]].duplicate_count
+        else:
+            duplicates = data.duplicated(subset=columns).sum()
 
         if duplicates > 0:
             return {"passed": False, "messages": [f"Found {duplicates} duplicate records in columns: {columns}"]}
 
         return {"passed": True, "messages": []}
 
-    def _check_validity(self, data: pd.DataFrame, rule: ValidationRule) -> Dict[str, Any]:
+    def _check_validity(self, profile: DataProfile, rule: ValidationRule) -> Dict[str, Any]:
         """Check data validity"""
         column = rule.column
         valid_values = rule.parameters.get("valid_values", [])
@@ -235,35 +316,32 @@ class DataQualityValidator:
         min_value = rule.parameters.get("min_value")
         max_value = rule.parameters.get("max_value")
 
-        if column not in data.columns:
+        if column not in profile:
             return {"passed": False, "messages": [f"Column '{column}' not found"]}
 
+        column_profile = profile[column]
         messages = []
 
         # Check valid values
         if valid_values:
-            invalid_mask = ~data[column].isin(valid_values) & data[column].notna()
-            invalid_count = invalid_mask.sum()
+            invalid_count = column_profile.count_not_in(valid_values)
             if invalid_count > 0:
                 messages.append(f"Column '{column}' has {invalid_count} invalid values")
 
         # Check pattern
         if pattern:
-            invalid_pattern = ~data[column].astype(str).str.match(pattern, na=True)
-            invalid_pattern_count = invalid_pattern.sum()
+            invalid_pattern_count = column_profile.count_not_matching(pattern)
             if invalid_pattern_count > 0:
                 messages.append(f"Column '{column}' has {invalid_pattern_count} values not matching pattern")
 
         # Check numeric ranges
         if min_value is not None:
-            below_min = (data[column] < min_value) & data[column].notna()
-            below_min_count = below_min.sum()
+            below_min_count = column_profile.count_below(min_value)
             if below_min_count > 0:
                 messages.append(f"Column '{column}' has {below_min_count} values below minimum {min_value}")
 
         if max_value is not None:
-            above_max = (data[column] > max_value) & data[column].notna()
-            above_max_count = above_max.sum()
+            above_max_count = column_profile.count_above(max_value)
             if above_max_count > 0:
                 messages.append(f"Column '{column}' has {above_max_count} values above maximum {max_value}")
 
@@ -298,7 +376,7 @@ class DataQualityValidator:
 
         return {"passed": True, "messages": []}
 
-    def _check_accuracy(self, data: pd.DataFrame, rule: ValidationRule) -> Dict[str, Any]:
+    def _check_accuracy(self, profile: DataProfile, rule: ValidationRule) -> Dict[str, Any]:
         """Check data accuracy using reference data"""
         # This would typically involve checking against external reference data
         # For now, implement basic accuracy checks
@@ -306,13 +384,12 @@ class DataQualityValidator:
         column = rule.column
         reference_values = rule.parameters.get("reference_values", {})
 
-        if column not in data.columns:
+        if column not in profile:
             return {"passed": False, "messages": [f"Column '{column}' not found"]}
 
         # Example: Check if division names are accurate
         if reference_values:
-            inaccurate_mask = ~data[column].isin(reference_values) & data[column].notna()
-            inaccurate_count = inaccurate_mask.sum()
+            inaccurate_count = profile[column].count_not_in(reference_values)
 
             if inaccurate_count > 0:
                 return {
@@ -322,55 +399,34 @@ class DataQualityValidator:
 
         return {"passed": True, "messages": []}
 
-    async def _run_great_expectations(self, data: pd.DataFrame, table_name: str) -> Dict[str, Any]:
+    async def _run_great_expectations(
+        self, data: pd.DataFrame, table_name: str, profile: Optional[DataProfile] = None
+    ) -> Dict[str, Any]:
         """Run Great Expectations validation"""
         if not self.ge_context:
             return {"success": True, "message": "Great Expectations not available"}
 
         try:
+            profile = profile or DataProfile(data)
+            batch = self._sample_for_expectations(data)
+
             # Create a batch request
             batch_request = RuntimeBatchRequest(
                 datasource_name="pandas_datasource",
                 data_connector_name="default_runtime_data_connector_name",
                 data_asset_name=table_name,
-                runtime_parameters={"batch_data": data},
+                runtime_parameters={"batch_data": batch},
                 batch_identifiers={"default_identifier_name": "default_identifier"},
             )
 
-            # Get or create expectation suite
-            suite_name = f"{table_name}_suite"
-            try:
-                suite = self.ge_context.get_expectation_suite(suite_name)
-            except:
-                suite = self.ge_context.create_expectation_suite(suite_name)
-                self._add_default_expectations(suite, data)
-
-            # Run validation
-            checkpoint_config = {
-                "name": f"{table_name}_checkpoint",
-                "config_version": 1.0,
-                "template_name": None,
-                "module_name": "great_expectations.checkpoint",
-                "class_name": "SimpleCheckpoint",
-                "run_name_template": "%Y%m%d-%H%M%S-my-run-name-template",
-                "expectation_suite_name": suite_name,
-                "batch_request": batch_request,
-                "action_list": [
-                    {
-                        "name": "store_validation_result",
-                        "action": {"class_name": "StoreValidationResultAction"},
-                    }
-                ],
-            }
-
-            checkpoint = SimpleCheckpoint(f"{table_name}_checkpoint", self.ge_context, **checkpoint_config)
-
-            checkpoint_result = checkpoint.run()
+            # Suites and checkpoints are built once per table and schema, then reused for every batch
+            checkpoint, suite_name = self._get_checkpoint(table_name, data, profile)
+            checkpoint_result = checkpoint.run(batch_request=batch_request, expectation_suite_name=suite_name)
 
             # Extract results
             validation_result = checkpoint_result.list_validation_results()[0]
 
-            return {
+            ge_result = {
                 "success": validation_result.success,
                 "statistics": validation_result.statistics,
                 "results": [
@@ -386,47 +442,149 @@ class DataQualityValidator:
                     for result in validation_result.results
                     if not result.success
                 ],
+                "sampled_records": len(batch),
             }
 
+            if self.config.get("ge_result_store", "full") == "lightweight":
+                self.ge_results.append(
+                    {
+                        "table_name": table_name,
+                        "suite_name": suite_name,
+                        "success": ge_result["success"],
+                        "statistics": ge_result["statistics"],
+                        "errors": ge_result["errors"],
+                        "validated_at": datetime.now().isoformat(),
+                    }
+                )
+
+            return ge_result
+
         except Exception as e:
             self.logger.error(f"Great Expectations validation failed: {str(e)}")
             return {"success": False, "error": str(e), "errors": [str(e)]}
 
-    def _add_default_expectations(self, suite, data: pd.DataFrame):
+    def _get_checkpoint(self, table_name: str, data: pd.DataFrame, profile: DataProfile):
+        """Return the cached checkpoint and suite name for this table and schema, building them on first use"""
+        cache_key = (table_name, schema_hash(data))
+        if cache_key in self._ge_cache:
+            return self._ge_cache[cache_key]
+
+        # One suite per schema, so a changed schema never inherits another schema's column expectations
+        suite_name = f"{table_name}_{cache_key[1][:12]}_suite"
+        try:
+            suite = self.ge_context.get_expectation_suite(suite_name)
+        except Exception:
+            suite = self.ge_context.create_expectation_suite(suite_name)
+            if not self._copy_table_suite(suite, table_name, data):
+                self._add_default_expectations(suite, data, profile)
+            self.ge_context.save_expectation_suite(suite)
+
+        # Lightweight mode keeps a summary in memory instead of writing every result to the GE store
+        action_list = []
+        if self.config.get("ge_result_store", "full") == "full":
+            action_list.append(
+                {
+                    "name": "store_validation_result",
+                    "action": {"class_name": "StoreValidationResultAction"},
+                }
+            )
+
+        checkpoint_config = {
+            "name": f"{table_name}_checkpoint",
+            "config_version": 1.0,
+            "template_name": None,
+            "module_name": "great_expectations.checkpoint",
+            "class_name": "SimpleCheckpoint",
+            "run_name_template": "%Y%m%d-%H%M%S-my-run-name-template",
+            "expectation_suite_name": suite_name,
+            "action_list": action_list,
+        }
+
+        checkpoint = SimpleCheckpoint(f"{table_name}_checkpoint", self.ge_context, **checkpoint_config)
+
+        self._ge_cache[cache_key] = (checkpoint, suite_name)
+        self.logger.debug(f"Cached Great Expectations checkpoint for {table_name} ({suite_name})")
+        return checkpoint, suite_name
+
+    def _copy_table_suite(self, suite, table_name: str, data: pd.DataFrame) -> bool:
+        """Seed ``suite`` from the per-table ``{table_name}_suite`` of earlier releases if it fits ``data``
+
+        Returns False when there is no such suite or its ordered column list
+        belongs to a different schema.
+        """
+        try:
+            table_suite = self.ge_context.get_expectation_suite(f"{table_name}_suite")
+        except Exception:
+            return False
+
+        column_lists = [
+            expectation.kwargs.get("column_list")
+            for expectation in table_suite.expectations
+            if expectation.expectation_type == "expect_table_columns_to_match_ordered_list"
+        ]
+        if any(column_list != data.columns.tolist() for column_list in column_lists):
+            return False
+
+        suite.add_expectation_configurations(table_suite.expectations)
+        self.logger.info(f"Seeded expectation suite {suite.expectation_suite_name} from {table_name}_suite")
+        return True
+
+    def _sample_for_expectations(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Stratified sample of ``data`` when it exceeds ``ge_sample_size`` rows"""
+        sample_size = self.config.get("ge_sample_size")
+        if not sample_size or len(data) <= sample_size:
+            return data
+
+        fraction = sample_size / len(data)
+        strata = [col for col in self.config.get("ge_stratify_by", []) if col in data.columns]
+        random_state = self.config.get("ge_sample_seed", 42)
+
+        if strata:
+            # Same fraction from every stratum so small groups (e.g. divisions) stay represented
+            return data.groupby(strata, dropna=False, group_keys=False).sample(frac=fraction, random_state=random_state)
+
+        return data.sample(n=sample_size, random_state=random_state)
+
+    def _add_default_expectations(self, suite, data: pd.DataFrame, profile: Optional[DataProfile] = None):
         """Add default expectations for common data quality checks"""
         try:
+            profile = profile or DataProfile(data)
+
             # Table-level expectations
             suite.expect_table_row_count_to_be_between(min_value=1)
             suite.expect_table_columns_to_match_ordered_list(column_list=data.columns.tolist())
 
             # Column-level expectations
-            for column in data.columns:
+            for column in profile.columns:
+                column_profile = profile[column]
+
                 # Basic existence
                 suite.expect_column_to_exist(column)
 
                 # Type-specific expectations
-                if data[column].dtype in ["object", "string"]:
+                if column_profile.dtype in ["object", "string"]:
                     # String columns
-                    if data[column].notna().any():
+                    if column_profile.non_null_count:
                         suite.expect_column_values_to_not_be_null(column)
                         suite.expect_column_value_lengths_to_be_between(column, min_value=1, max_value=1000)
 
-                elif data[column].dtype in ["int64", "float64"]:
+                elif column_profile.dtype in ["int64", "float64"]:
                     # Numeric columns
-                    if data[column].notna().any():
-                        min_val = data[column].min()
-                        max_val = data[column].max()
-                        suite.expect_column_values_to_be_between(column, min_value=min_val, max_value=max_val)
+                    if column_profile.non_null_count:
+                        suite.expect_column_values_to_be_between(
+                            column, min_value=column_profile.min, max_value=column_profile.max
+                        )
 
-                elif "datetime" in str(data[column].dtype):
+                elif "datetime" in str(column_profile.dtype):
                     # Date columns
                     suite.expect_column_values_to_be_of_type(column, "datetime64")
 
         except Exception as e:
             self.logger.warning(f"Failed to add default expectations: {str(e)}")
 
-    def _validate_statistics(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _validate_statistics(self, data: pd.DataFrame, profile: Optional[DataProfile] = None) -> Dict[str, Any]:
         """Validate statistical properties of the data"""
+        profile = profile or DataProfile(data)
         stats = {
             "warnings": [],
             "row_count": len(data),
@@ -437,25 +595,31 @@ class DataQualityValidator:
         }
 
         # Check null percentages
-        for column in data.columns:
-            null_pct = (data[column].isnull().sum() / len(data)) * 100
+        for column in profile.columns:
+            null_pct = profile.null_percentage(column)
             stats["null_percentages"][column] = null_pct
 
             if null_pct > 50:
                 stats["warnings"].append(f"Column '{column}' has {null_pct:.1f}% null values")
 
+        if self.sketch:
+            self.sketch.update(data, profile.numeric_columns)
+
         # Check for outliers in numeric columns
-        numeric_columns = data.select_dtypes(include=[np.number]).columns
-        for column in numeric_columns:
-            if data[column].notna().any():
-                Q1 = data[column].quantile(0.25)
-                Q3 = data[column].quantile(0.75)
+        for column in profile.numeric_columns:
+            column_profile = profile[column]
+            if column_profile.non_null_count:
+                if self.sketch:
+                    quartiles = self.sketch.quantiles(column, (0.25, 0.75))
+                else:
+                    quartiles = column_profile.quantiles((0.25, 0.75))
+                Q1 = quartiles[0.25]
+                Q3 = quartiles[0.75]
                 IQR = Q3 - Q1
                 lower_bound = Q1 - 1.5 * IQR
                 upper_bound = Q3 + 1.5 * IQR
 
-                outliers = ((data[column] < lower_bound) | (data[column] > upper_bound)) & data[column].notna()
-                outlier_count = outliers.sum()
+                outlier_count = column_profile.count_below(lower_bound) + column_profile.count_above(upper_bound)
                 outlier_pct = (outlier_count / len(data)) * 100
 
                 stats["outliers"][column] = {"count": int(outlier_count), "percentage": outlier_pct}
@@ -465,28 +629,30 @@ class DataQualityValidator:
 
         return stats
 
-    async def _validate_business_rules(self, data: pd.DataFrame, table_name: str) -> List[str]:
+    async def _validate_business_rules(
+        self, data: pd.DataFrame, table_name: str, profile: Optional[DataProfile] = None
+    ) -> List[str]:
         """Validate business-specific rules"""
         errors = []
+        profile = profile or DataProfile(data)
 
         if table_name.lower() == "students":
-            errors.extend(self._validate_student_business_rules(data))
+            errors.extend(self._validate_student_business_rules(data, profile))
         elif table_name.lower() == "schools":
-            errors.extend(self._validate_school_business_rules(data))
+            errors.extend(self._validate_school_business_rules(profile))
         elif table_name.lower() == "enrollments":
             errors.extend(self._validate_enrollment_business_rules(data))
 
         return errors
 
-    def _validate_student_business_rules(self, data: pd.DataFrame) -> List[str]:
+    def _validate_student_business_rules(self, data: pd.DataFrame, profile: DataProfile) -> List[str]:
         """Validate student-specific business rules"""
         errors = []
 
         # Age validation
-        if "age" in data.columns:
-            invalid_ages = (data["age"] < 3) | (data["age"] > 25)
-            if invalid_ages.any():
-                count = invalid_ages.sum()
+        if "age" in profile:
+            count = profile["age"].count_below(3) + profile["age"].count_above(25)
+            if count:
                 errors.append(f"BUSINESS RULE VIOLATION: {count} students have unrealistic ages")
 
         # Date of birth vs enrollment date
@@ -506,16 +672,15 @@ class DataQualityValidator:
 
         return errors
 
-    def _validate_school_business_rules(self, data: pd.DataFrame) -> List[str]:
+    def _validate_school_business_rules(self, profile: DataProfile) -> List[str]:
         """Validate school-specific business rules"""
         errors = []
 
         # Check for valid Bangladesh divisions
-        if "division" in data.columns:
+        if "division" in profile:
             valid_divisions = ["Dhaka", "Chittagong", "Rajshahi", "Khulna", "Barisal", "Sylhet", "Rangpur", "Mymensingh"]
-            invalid_divisions = ~data["division"].isin(valid_divisions) & data["division"].notna()
-            if invalid_divisions.any():
-                count = invalid_divisions.sum()
+            count = profile["division"].count_not_in(valid_divisions)
+            if count:
                 errors.append(f"BUSINESS RULE VIOLATION: {count} schools have invalid division names")
 
         return errors
@@ -269,6 +269,8 @@ class StudentBase(BaseModel):
     student_id: str = Field(..., description="Unique identifier for the student")
     first_name: str = Field(..., max_length=100)
     last_name: str = Field(..., max_length=100)
+    first_name_bn: Optional[str] = Field(None, max_length=100)
+    last_name_bn: Optional[str] = Field(None, max_length=100)
     date_of_birth: date
     gender: Gender
     email: Optional[EmailStr] = None
@@ -306,6 +308,8 @@ class StudentCreate(StudentBase):
 class StudentUpdate(BaseModel):
     first_name: Optional[str] = Field(None, max_length=100)
     last_name: Optional[str] = Field(None, max_length=100)
+    first_name_bn: Optional[str] = Field(None, max_length=100)
+    last_name_bn: Optional[str] = Field(None, max_length=100)
     date_of_birth: Optional[date] = None
     gender: Optional[Gender] = None
     email: Optional[EmailStr] = None
@@ -320,7 +324,7 @@ class StudentUpdate(BaseModel):
 class StudentInDB(StudentBase):
     id: int
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None  # Only set once the row is updated
 
     model_config = {"from_attributes": True}
 
@@ -334,3 +338,32 @@ class PaginatedStudentResponse(BaseModel):
     skip: int
     limit: int
     items: List[StudentResponse]
+    next_cursor: Optional[str] = None  # set in cursor mode while more pages follow
+    total_is_estimate: bool = False
+
+
+class StudentSearchHit(StudentResponse):
+    score: float  # share of the query's trigrams found in the name, 0-1
+    prefix_match: bool  # every query word starts a word of the name
+
+
+class StudentSearchResponse(BaseModel):
+    query: str
+    items: List[StudentSearchHit]
+
+
+class StudentBatchItemResult(BaseModel):
+    index: int  # position of the item in the request
+    student_id: Optional[str] = None
+    status: str  # created, updated, skipped, invalid, duplicate or conflict
+    id: Optional[int] = None
+    errors: List[str] = []
+
+
+class StudentBatchResponse(BaseModel):
+    total: int
+    created: int
+    updated: int
+    skipped: int
+    failed: int
+    items: List[StudentBatchItemResult]
@@ -22,6 +22,8 @@ class StudentDB(Base):
     student_id = Column(String(50), unique=True, index=True, nullable=False)
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
+    first_name_bn = Column(String(100), nullable=True)  # Bengali name
+    last_name_bn = Column(String(100), nullable=True)  # Bengali name
     date_of_birth = Column(Date, nullable=False)
     gender = Column(PgEnum(Gender, name="gender_enum"), nullable=False)
     email = Column(String(255), unique=True, index=True, nullable=True)
@@ -38,6 +40,8 @@ class StudentDB(Base):
     __table_args__ = (
         Index("idx_student_name", "first_name", "last_name"),
         Index("idx_student_location", "division", "district", "city"),
+        # Keyset pagination by last name
+        Index("idx_student_last_name_id", "last_name", "id"),
     )
 
     def __repr__(self):
@@ -50,6 +54,8 @@ class StudentDB(Base):
             "student_id": self.student_id,
             "first_name": self.first_name,
             "last_name": self.last_name,
+            "first_name_bn": self.first_name_bn,
+            "last_name_bn": self.last_name_bn,
             "date_of_birth": self.date_of_birth.isoformat() if self.date_of_birth else None,
             "gender": self.gender.value if self.gender else None,
             "email": self.email,
@@ -5,19 +5,55 @@ Comprehensive tests for ETL pipeline components
 """
 
 import asyncio
+import json
 import os
+import re
+import sqlite3
 import tempfile
 from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
-from src.data_processing.extractors import CSVExtractor, DatabaseExtractor, ExcelExtractor
-from src.data_processing.loaders import DatabaseLoader, ValidationLoader
-from src.data_processing.pipeline import DataPipeline, PipelineConfig, PipelineResult
-from src.data_processing.transformers import SchoolDataTransformer, StudentDataTransformer
-from src.data_processing.validators import DataQualityValidator, ValidationRule
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from sqlalchemy import Column, Integer, MetaData, String, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from src.data_processing.checkpoints import CheckpointStore
+from src.data_processing.extractors import (
+    APIExtractor,
+    CSVExtractor,
+    DatabaseExtractor,
+    ExcelExtractor,
+    TokenBucket,
+    _from_watermark_text,
+)
+from src.data_processing.loaders import CopyLoader, DatabaseLoader, ValidationLoader, create_loader
+from src.data_processing.pipeline import DataPipeline, PipelineConfig, PipelineResult, celery_app, resume_pipeline
+from src.data_processing.profiling import DataProfile
+from src.data_processing.schemas import SCHEMA_REGISTRY, concat_typed, get_schema
+from src.data_processing.sketches import BloomFilter, HyperLogLog, KLLSketch, ValidationSketch, hash_values
+from src.data_processing.staging import NULL_PARTITION, ParquetStagingArea
+from src.data_processing.tasks import dispatch_partitions, plan_partitions, resume_failed_partitions
+from src.data_processing.transformers import SchoolDataTransformer, StudentDataTransformer, TransformationRule
+from src.data_processing.validators import DataQualityValidator, ValidationRule, schema_hash
+
+
+def recording_load(fail_on: set, error: str):
+    """Loader ``load`` side effect that records loaded student ids and raises for batches holding any in ``fail_on``"""
+    loaded = []
+
+    async def load(batch):
+        if fail_on & set(batch["student_id"]):
+            raise RuntimeError(error)
+        loaded.extend(batch["student_id"])
+        return {"inserted": len(batch), "updated": 0, "failed": 0, "errors": []}
+
+    return loaded, load
 
 
 class TestDataPipeline:
@@ -90,6 +126,50 @@ class TestDataPipeline:
                     assert result.records_failed == 0
                     assert len(result.processing_errors) == 0
 
+    @pytest.mark.asyncio
+    async def test_staged_run_cleans_up_after_a_clean_load(self, pipeline_config, sample_student_data, tmp_path):
+        """Test the staged frames are removed once loaded, and kept when records fail"""
+        pipeline_config.dry_run = False
+        pipeline_config.validate_data = False
+        pipeline_config.staging_dir = str(tmp_path)
+
+        fail_on = set()
+        loaded, load = recording_load(fail_on, "connection reset")
+
+        with patch("src.data_processing.pipeline.CSVExtractor") as mock_extractor_class:
+            with patch("src.data_processing.pipeline.StudentDataTransformer") as mock_transformer_class:
+                with patch("src.data_processing.pipeline.DatabaseLoader") as mock_loader_class:
+                    mock_extractor_class.return_value.extract = AsyncMock(return_value=sample_student_data)
+                    mock_extractor_class.return_value.commit = AsyncMock()
+                    mock_transformer_class.return_value.transform = AsyncMock(side_effect=lambda data: data)
+                    mock_loader_class.return_value.load = AsyncMock(side_effect=load)
+
+                    clean = DataPipeline(pipeline_config)
+                    clean_result = await clean.execute()
+
+                    fail_on.add("STU002")
+                    failing = DataPipeline(pipeline_config)
+                    failing_result = await failing.execute()
+
+        assert clean_result.status == "completed"
+        assert clean_result.records_inserted == 3
+        assert clean_result.staged_artifacts == {}
+        assert not clean.staging.root.exists()
+
+        # Staged frames are partitioned by division, so only STU002's batch fails
+        assert failing_result.records_failed == 1
+        assert failing_result.records_inserted == 2
+        assert list(failing_result.staged_artifacts) == ["transformed"]
+        assert failing.staging.row_count("transformed") == 3
+
+    def test_staged_load_reads_only_target_columns(self, pipeline_config):
+        """Test staged frames are read back projected onto the target table's columns"""
+        pipeline = DataPipeline(pipeline_config)
+        assert pipeline._load_columns(["student_id", "division", "raw_notes"]) == ["student_id", "division"]
+
+        pipeline.loader = MagicMock(spec=["load"])
+        assert pipeline._load_columns(["student_id", "raw_notes"]) is None
+
     @pytest.mark.asyncio
     async def test_pipeline_execution_failure(self, pipeline_config):
         """Test pipeline execution with failure"""
@@ -108,6 +188,253 @@ class TestDataPipeline:
             assert len(result.processing_errors) > 0
             assert "File not found" in result.processing_errors[0]
 
+    @pytest.mark.asyncio
+    async def test_pipeline_streaming_execution(self, pipeline_config, sample_student_data):
+        """Test streaming execution rolls per-chunk counters into the result"""
+        pipeline_config.streaming = True
+        pipeline_config.dry_run = False
+        pipeline_config.batch_size = 2
+
+        async def fake_chunks(chunk_size):
+            for i in range(0, len(sample_student_data), chunk_size):
+                yield sample_student_data.iloc[i : i + chunk_size]
+
+        with patch("src.data_processing.pipeline.CSVExtractor") as mock_extractor_class:
+            with patch("src.data_processing.pipeline.StudentDataTransformer") as mock_transformer_class:
+                with patch("src.data_processing.pipeline.ValidationLoader") as mock_loader_class:
+                    mock_extractor = Mock()
+                    mock_extractor.extract_chunks = fake_chunks
+                    mock_extractor.commit = AsyncMock()
+                    mock_extractor_class.return_value = mock_extractor
+
+                    mock_transformer = Mock()
+                    mock_transformer.transform = AsyncMock(side_effect=lambda chunk: chunk)
+                    mock_transformer_class.return_value = mock_transformer
+
+                    mock_loader = Mock()
+                    mock_loader.load = AsyncMock(
+                        side_effect=lambda batch: {"inserted": len(batch), "updated": 0, "failed": 0, "errors": []}
+                    )
+                    mock_loader_class.return_value = mock_loader
+
+                    pipeline = DataPipeline(pipeline_config)
+                    pipeline.validator.validate = AsyncMock(return_value=Mock(is_valid=True))
+                    result = await pipeline.execute()
+
+                    assert result.status == "completed"
+                    assert result.records_processed == 3
+                    assert result.records_inserted == 3
+                    assert mock_transformer.transform.await_count == 2
+                    mock_extractor.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_records_stage_metrics(self, pipeline_config, sample_student_data):
+        """Test per-stage metrics land on the result and in the trace and metrics files"""
+        pipeline_config.streaming = True
+        pipeline_config.dry_run = False
+        pipeline_config.batch_size = 2
+
+        async def fake_chunks(chunk_size):
+            for i in range(0, len(sample_student_data), chunk_size):
+                yield sample_student_data.iloc[i : i + chunk_size]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pipeline_config.trace_path = os.path.join(temp_dir, "trace.json")
+            pipeline_config.metrics_path = os.path.join(temp_dir, "metrics.prom")
+
+            with patch("src.data_processing.pipeline.CSVExtractor") as mock_extractor_class:
+                with patch("src.data_processing.pipeline.ValidationLoader") as mock_loader_class:
+                    mock_extractor = Mock()
+                    mock_extractor.extract_chunks = fake_chunks
+                    mock_extractor.commit = AsyncMock()
+                    mock_extractor_class.return_value = mock_extractor
+
+                    mock_loader = Mock()
+                    mock_loader.load = AsyncMock(
+                        side_effect=lambda batch: {
+                            "inserted": len(batch),
+                            "updated": 0,
+                            "failed": 0,
+                            "errors": [],
+                            "db_round_trips": 2,
+                        }
+                    )
+                    mock_loader_class.return_value = mock_loader
+
+                    pipeline = DataPipeline(pipeline_config)
+                    pipeline.validator.add_validation_rule(
+                        ValidationRule(rule_name="student_id_complete", rule_type="completeness", column="student_id")
+                    )
+                    result = await pipeline.execute()
+
+            assert result.status == "completed"
+            assert list(result.stage_metrics) == ["extract", "transform", "validate", "load"]
+            assert result.stage_metrics["extract"]["rows"] == 3
+            assert result.stage_metrics["load"]["calls"] == 2
+            assert result.stage_metrics["load"]["db_round_trips"] == 4
+            assert result.stage_metrics["load"]["peak_rss_bytes"] > 0
+            assert "clean_columns" in result.stage_metrics["transform"]["steps"]
+            assert "student_id_complete" in result.stage_metrics["validate"]["steps"]
+
+            with open(pipeline_config.trace_path) as f:
+                trace = json.load(f)
+            assert [event["name"] for event in trace["traceEvents"] if event["cat"] == "load"] == ["batch 0", "batch 1"]
+
+            with open(pipeline_config.metrics_path) as f:
+                metrics = f.read()
+            assert f'etl_stage_rows_total{{pipeline_id="{pipeline.pipeline_id}",stage="load"}} 3' in metrics
+
+    @pytest.mark.asyncio
+    async def test_pipelined_execution_overlaps_stages(self, pipeline_config):
+        """Test pipelined stages overlap, keep chunk order and respect the queue bound"""
+        pipeline_config.pipelined = True
+        pipeline_config.dry_run = False
+        pipeline_config.batch_size = 1
+        pipeline_config.queue_size = 1
+
+        data = pd.DataFrame({"student_id": [f"STU{i:03d}" for i in range(20)]})
+        events = []
+
+        async def fake_chunks(chunk_size):
+            for i in range(len(data)):
+                events.append(("extract", i))
+                yield data.iloc[i : i + 1]
+
+        async def load(batch):
+            events.append(("load", int(batch["student_id"].iloc[0][3:])))
+            await asyncio.sleep(0.01)
+            return {"inserted": len(batch), "updated": 0, "failed": 0, "errors": []}
+
+        with patch("src.data_processing.pipeline.CSVExtractor") as mock_extractor_class:
+            with patch("src.data_processing.pipeline.StudentDataTransformer") as mock_transformer_class:
+                with patch("src.data_processing.pipeline.ValidationLoader") as mock_loader_class:
+                    mock_extractor_class.return_value.extract_chunks = fake_chunks
+                    mock_extractor_class.return_value.commit = AsyncMock()
+                    mock_transformer_class.return_value.transform = AsyncMock(side_effect=lambda chunk: chunk)
+                    mock_loader_class.return_value.load = AsyncMock(side_effect=load)
+
+                    pipeline = DataPipeline(pipeline_config)
+                    pipeline.validator.validate = AsyncMock(return_value=Mock(is_valid=True))
+                    result = await pipeline.execute()
+
+        assert result.status == "completed"
+        assert result.records_processed == 20
+        assert result.records_inserted == 20
+        assert [i for stage, i in events if stage == "load"] == list(range(20))
+
+        # Extraction overlaps loading but only runs ahead by what the bounded queues and stages hold
+        assert events.index(("extract", 19)) > events.index(("load", 0))
+        for i in range(20):
+            extracted_before = sum(1 for stage, _ in events[: events.index(("load", i))] if stage == "extract")
+            assert extracted_before <= i + 5
+
+    @pytest.mark.asyncio
+    async def test_checkpointed_run_resumes_failed_batches(self, pipeline_config, sample_student_data, tmp_path):
+        """Test a resumed run skips batches a previous attempt already loaded"""
+        pipeline_config.dry_run = False
+        pipeline_config.batch_size = 1
+        pipeline_config.checkpoint_store = f"sqlite:///{tmp_path / 'checkpoints.db'}"
+
+        fail_on = {"STU002"}
+        loaded, load = recording_load(fail_on, "server closed the connection unexpectedly")
+
+        with patch("src.data_processing.pipeline.CSVExtractor") as mock_extractor_class:
+            with patch("src.data_processing.pipeline.StudentDataTransformer") as mock_transformer_class:
+                with patch("src.data_processing.pipeline.ValidationLoader") as mock_loader_class:
+                    mock_extractor_class.return_value.extract = AsyncMock(return_value=sample_student_data)
+                    mock_extractor_class.return_value.commit = AsyncMock()
+                    mock_transformer_class.return_value.transform = AsyncMock(side_effect=lambda data: data)
+                    mock_loader_class.return_value.load = AsyncMock(side_effect=load)
+
+                    pipeline = DataPipeline(pipeline_config)
+                    pipeline.validator.validate = AsyncMock(return_value=Mock(is_valid=True))
+                    first = await pipeline.execute()
+
+                    assert first.records_failed == 1
+                    assert loaded == ["STU001", "STU003"]
+
+                    loaded.clear()
+                    fail_on.clear()
+                    with patch("src.data_processing.pipeline.DataQualityValidator") as mock_validator_class:
+                        mock_validator_class.return_value.validate = AsyncMock(return_value=Mock(is_valid=True))
+                        resumed = await resume_pipeline(pipeline.pipeline_id, pipeline_config.checkpoint_store)
+
+        assert loaded == ["STU002"]
+        assert resumed.pipeline_id == first.pipeline_id
+        assert resumed.batches_resumed == 2
+        assert resumed.records_inserted == 3
+        assert resumed.records_failed == 0
+
+    @pytest.fixture
+    def eager_celery(self):
+        """Run Celery tasks, groups and chords in-process"""
+        celery_app.conf.task_always_eager = True
+        yield celery_app
+        celery_app.conf.task_always_eager = False
+
+    def test_fan_out_and_resume_failed_partitions(self, eager_celery, tmp_path):
+        """Test fan-out aggregates partitions into one result and resume reruns only failures"""
+        source = tmp_path / "students.csv"
+        pd.DataFrame({"student_id": [f"STU{i:03d}" for i in range(20)], "name": ["Student"] * 20}).to_csv(source, index=False)
+        config = PipelineConfig(
+            source_type="csv",
+            source_path=str(source),
+            target_table="students",
+            validate_data=False,
+            partition_size_bytes=60,
+            checkpoint_store=f"sqlite:///{tmp_path / 'checkpoints.db'}",
+        )
+
+        partitions = plan_partitions(config)
+        assert len(partitions) > 2
+        assert partitions[0]["byte_range"][1] == partitions[1]["byte_range"][0]
+
+        fail_on = {"STU007"}
+        loaded, load = recording_load(fail_on, "connection reset")
+
+        with patch("src.data_processing.pipeline.StudentDataTransformer") as mock_transformer_class:
+            with patch("src.data_processing.pipeline.DatabaseLoader") as mock_loader_class:
+                mock_transformer_class.return_value.transform = AsyncMock(side_effect=lambda chunk: chunk)
+                mock_loader_class.return_value.load = AsyncMock(side_effect=load)
+
+                result = dispatch_partitions(config, partitions).get()
+
+                assert result["status"] == "failed"
+                assert result["records_processed"] == 20
+                assert len(result["partitions"]) == len(partitions)
+                failed = [p for p in result["partitions"] if p["status"] == "failed"]
+                assert len(failed) == 1
+                assert len(loaded) == 20 - failed[0]["records_failed"]
+
+                loaded.clear()
+                fail_on.clear()
+                resumed = resume_failed_partitions(result, config).get()
+
+        assert resumed["status"] == "completed"
+        assert resumed["pipeline_id"] == result["pipeline_id"]
+        assert resumed["records_processed"] == 20
+        assert resumed["records_failed"] == 0
+        assert resumed["records_inserted"] == 20
+        assert len(loaded) == failed[0]["records_failed"]
+        assert "STU007" in loaded
+
+        # Every partition checkpoints as its own run, fingerprinted by its byte range
+        store = CheckpointStore(config.checkpoint_store)
+        runs = [store.get_run(f"{result['pipeline_id']}_{p['partition_id']}") for p in partitions]
+        store.dispose()
+        assert all(run["status"] == "completed" for run in runs)
+        assert len({run["source_fingerprint"] for run in runs}) == len(partitions)
+
+    def test_plan_partitions_skips_leading_rows(self, tmp_path):
+        """Test partitions start after the skipped lines and the header"""
+        source = tmp_path / "students.csv"
+        source.write_text("Exported 2024-01-01\nstudent_id,name\nSTU001,Student\nSTU002,Student\n")
+        config = PipelineConfig(source_type="csv", source_path=str(source), target_table="students", skip_rows=1)
+
+        partitions = plan_partitions(config)
+
+        assert partitions == [{"partition_id": "part-00000", "byte_range": [36, 66]}]
+
 
 class TestExtractors:
     """Test data extractors"""
@@ -161,6 +488,208 @@ class TestExtractors:
         is_valid = await extractor.validate_source()
         assert is_valid is False
 
+    def test_database_extractor_keyset_query(self):
+        """Test incremental extraction pages by keyset beyond the watermark"""
+        extractor = DatabaseExtractor(
+            {
+                "connection_string": "postgresql://localhost/test",
+                "table_name": "students",
+                "incremental_column": "updated_at",
+                "chunk_size": 500,
+            }
+        )
+
+        query, params = extractor._keyset_query(None)
+        assert "WHERE" not in query
+        assert query.endswith("ORDER BY updated_at, id LIMIT :limit")
+
+        query, params = extractor._keyset_query(("2024-01-01T00:00:00", "42"))
+        assert "WHERE (updated_at, id) > (:last_value, :last_key)" in query
+        assert params == {"limit": 500, "last_value": "2024-01-01T00:00:00", "last_key": "42"}
+
+        with pytest.raises(ValueError):
+            DatabaseExtractor(
+                {"connection_string": "postgresql://localhost/test", "query": "SELECT 1", "incremental_column": "id"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_database_extractor_streams_chunks(self, tmp_path):
+        """Test query results are read through a server-side cursor one chunk at a time"""
+        path = tmp_path / "source.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE students (id INTEGER, name TEXT, gpa NUMERIC)")
+            conn.executemany("INSERT INTO students VALUES (?, ?, ?)", [(1, "Rahim", 3.5), (2, "Karim", None), (3, "Salma", 4)])
+        extractor = DatabaseExtractor(
+            {
+                "connection_string": f"sqlite+aiosqlite:///{path}",
+                "query": "SELECT * FROM students ORDER BY id",
+                "chunk_size": 2,
+            }
+        )
+
+        chunks = [chunk async for chunk in extractor.extract_chunks(extractor.chunk_size)]
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        data = pd.concat(chunks, ignore_index=True)
+        assert list(data.columns) == ["id", "name", "gpa"]
+        assert data["name"].tolist() == ["Rahim", "Karim", "Salma"]
+        assert data["gpa"].dtype == np.float64
+        assert extractor._engine is None
+
+    @pytest.mark.asyncio
+    async def test_database_extractor_incremental_on_async_engine(self, tmp_path):
+        """Test keyset pages and the watermark go through the async engine, so aiosqlite URLs work"""
+        path = tmp_path / "source.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE students (id INTEGER, updated_at TEXT, name TEXT)")
+            conn.executemany(
+                "INSERT INTO students VALUES (?, ?, ?)",
+                [(i, f"2024-01-0{i} 10:00:00", f"Student {i}") for i in range(1, 6)],
+            )
+        extractor = DatabaseExtractor(
+            {
+                "connection_string": f"sqlite+aiosqlite:///{path}",
+                "table_name": "students",
+                "incremental_column": "updated_at",
+                "chunk_size": 2,
+            }
+        )
+
+        chunks = [chunk async for chunk in extractor.extract_chunks(extractor.chunk_size)]
+
+        assert [chunk["id"].tolist() for chunk in chunks] == [[1, 2], [3, 4], [5]]
+        assert extractor._pending_watermark == ("2024-01-05 10:00:00", 5)
+        await extractor.commit()
+        assert extractor._engine is None
+
+    @pytest.mark.asyncio
+    async def test_database_extractor_watermark_round_trip(self, tmp_path):
+        """Test the watermark only advances on commit, and never over a concurrent run's update"""
+        path = tmp_path / "source.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE students (id INTEGER, updated_at TEXT)")
+            conn.executemany("INSERT INTO students VALUES (?, ?)", [(i, f"2024-01-0{i}") for i in range(1, 4)])
+
+        def new_extractor():
+            return DatabaseExtractor(
+                {
+                    "connection_string": f"sqlite+aiosqlite:///{path}",
+                    "table_name": "students",
+                    "incremental_column": "updated_at",
+                }
+            )
+
+        async def extracted_ids(extractor, chunk_size=10):
+            return [chunk["id"].tolist() async for chunk in extractor.extract_chunks(chunk_size)]
+
+        def stored_watermark():
+            with sqlite3.connect(path) as conn:
+                return conn.execute("SELECT watermark_value, key_value FROM etl_watermarks").fetchall()
+
+        # The caller's chunk size sets the page size; a run that fails before commit leaves no watermark
+        assert await extracted_ids(new_extractor(), chunk_size=2) == [[1, 2], [3]]
+        assert stored_watermark() == []
+
+        first = new_extractor()
+        assert await extracted_ids(first) == [[1, 2, 3]]
+        await first.commit()
+        assert stored_watermark() == [("2024-01-03", "3")]
+
+        with sqlite3.connect(path) as conn:
+            conn.executemany("INSERT INTO students VALUES (?, ?)", [(4, "2024-01-04"), (5, "2024-01-05")])
+
+        # Two runs start from the same watermark; the second to commit must not overwrite the first
+        run_a, run_b = new_extractor(), new_extractor()
+        assert await extracted_ids(run_a) == [[4, 5]]
+        assert await extracted_ids(run_b) == [[4, 5]]
+        await run_a.commit()
+        with pytest.raises(RuntimeError, match="advanced by another run"):
+            await run_b.commit()
+        assert stored_watermark() == [("2024-01-05", "5")]
+
+        assert await extracted_ids(new_extractor()) == []
+
+    def test_stored_watermarks_parse_to_column_types(self):
+        """Test text watermarks are parsed back into the column's type before binding"""
+        assert _from_watermark_text("2024-01-05T10:00:00", datetime(2024, 1, 1)) == datetime(2024, 1, 5, 10)
+        assert _from_watermark_text("2024-01-05", date(2024, 1, 1)) == date(2024, 1, 5)
+        assert _from_watermark_text("42", 7) == 42
+        assert _from_watermark_text("0042", "STU001") == "0042"
+        assert _from_watermark_text(None, 7) is None
+
+    @pytest.mark.asyncio
+    async def test_database_extractor_coerces_decimals(self):
+        """Test NUMERIC values that drivers return as Decimal come back as floats, as with pd.read_sql"""
+
+        class StreamResult:
+            def keys(self):
+                return ["id", "gpa"]
+
+            async def partitions(self, size):
+                yield [(1, Decimal("3.50")), (2, None)]
+
+        engine = MagicMock()
+        conn = engine.connect.return_value.__aenter__.return_value
+        conn.execute = AsyncMock()
+        conn.stream = AsyncMock(return_value=StreamResult())
+        extractor = DatabaseExtractor({"connection_string": "postgresql://localhost/test", "table_name": "students"})
+
+        with patch.object(extractor, "_get_engine", return_value=engine):
+            chunks = [chunk async for chunk in extractor.extract_chunks(100)]
+
+        assert chunks[0]["gpa"].dtype == np.float64
+        assert chunks[0]["gpa"].iloc[0] == 3.5
+        assert conn.stream.call_args.kwargs["execution_options"] == {"yield_per": 100}
+
+    @pytest.mark.asyncio
+    async def test_api_extractor_pagination_and_retry(self):
+        """Test API extractor follows cursors/pages and retries throttled requests"""
+        school_calls = []
+
+        async def health(request):
+            return web.json_response({"status": "ok"})
+
+        async def students(request):
+            if request.query.get("cursor") == "page2":
+                return web.json_response({"data": [{"id": 3}], "next_cursor": None})
+            return web.json_response({"data": [{"id": 1}, {"id": 2}], "next_cursor": "page2"})
+
+        async def schools(request):
+            school_calls.append(request)
+            if len(school_calls) == 1:
+                return web.json_response({"detail": "slow down"}, status=429, headers={"Retry-After": "0"})
+            page = int(request.query.get("page", 1))
+            return web.json_response({"results": [{"id": 10 + page}], "page": page, "total_pages": 2})
+
+        app = web.Application()
+        app.router.add_get("/health", health)
+        app.router.add_get("/students", students)
+        app.router.add_get("/schools", schools)
+
+        async with TestServer(app) as server:
+            extractor = APIExtractor(
+                {
+                    "base_url": f"http://{server.host}:{server.port}",
+                    "endpoints": ["/students", "/schools"],
+                    "rate_limit": 100,
+                    "max_concurrency": 2,
+                    "backoff_factor": 0,
+                }
+            )
+            data = await extractor.extract()
+
+        assert sorted(data["id"]) == [1, 2, 3, 11, 12]
+        assert len(school_calls) == 3  # 429, page 1, page 2
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_rate(self):
+        """Test the token bucket spaces requests beyond its burst capacity"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = asyncio.get_event_loop().time()
+        for _ in range(6):
+            await bucket.acquire()
+        assert asyncio.get_event_loop().time() - start >= 0.09
+
 
 class TestTransformers:
     """Test data transformers"""
@@ -219,6 +748,124 @@ class TestTransformers:
         with pytest.raises(ValueError, match="Missing required columns"):
             await transformer.transform(incomplete_data)
 
+    @pytest.fixture
+    def golden_contact_data(self):
+        """Edge cases for text, phone and email cleaning"""
+        return pd.DataFrame(
+            {
+                "text": ["  ahmed   rahman ", "FATIMA\tKHAN", None, "o'brien-smith!", "", "ahmed rahman", 42],
+                "phone": ["01712345678", "+880 1823-456789", "8801934567890", "1712345678", None, "0171234", 1712345678],
+                "email": ["a.b@test.com", "invalid-email", None, "x@y.c", "first+tag@mail.example.org", "A@B.CO", 7],
+            }
+        )
+
+    @staticmethod
+    def _legacy_phone(phone):
+        """Row-wise phone normalisation the vectorised version must match"""
+        if pd.isna(phone):
+            return None
+        phone_str = re.sub(r"\D", "", str(phone))
+        if phone_str.startswith("880"):
+            phone_str = phone_str[3:]
+        elif phone_str.startswith("0"):
+            phone_str = phone_str[1:]
+        if len(phone_str) == 10 and phone_str.startswith("1"):
+            return f"+880{phone_str}"
+        return None
+
+    @staticmethod
+    def _legacy_email(email):
+        """Row-wise email validation the vectorised version must match"""
+        if pd.isna(email):
+            return None
+        return email if re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", str(email)) else None
+
+    def test_vectorised_cleaning_matches_legacy(self, golden_contact_data):
+        """Test vectorised cleaning is identical to the previous row-wise implementation"""
+        transformer = StudentDataTransformer()
+
+        for case in ["title", "upper", "lower"]:
+            for remove_special_chars in [False, True]:
+                legacy = golden_contact_data["text"].astype(str).str.strip().str.replace(r"\s+", " ", regex=True)
+                legacy = getattr(legacy.str, case)()
+                if remove_special_chars:
+                    legacy = legacy.str.replace(r"[^\w\s]", "", regex=True)
+
+                cleaned = transformer._clean_text_column(
+                    golden_contact_data["text"], case=case, remove_special_chars=remove_special_chars
+                )
+                assert cleaned.tolist() == legacy.tolist()
+
+        phones = transformer._normalize_phone_number(golden_contact_data["phone"])
+        assert phones.tolist() == golden_contact_data["phone"].apply(self._legacy_phone).tolist()
+
+        emails = transformer._validate_email(golden_contact_data["email"])
+        assert emails.tolist() == golden_contact_data["email"].apply(self._legacy_email).tolist()
+
+    def test_compile_rules_fuses_string_operations(self):
+        """Test consecutive string rules on a column are fused and missing columns skipped"""
+        transformer = StudentDataTransformer()
+        transformer.add_transformation_rules(
+            [
+                {"column": "board", "operation": "strip"},
+                {"column": "board", "operation": "upper"},
+                {"column": "board", "operation": "map", "parameters": {"mapping": {"DHAKA": "Dhaka"}}},
+                {"column": "board", "operation": "replace", "parameters": {"pattern": "a", "repl": "A"}},
+                {"column": "roll", "operation": "strip"},
+                {"column": "missing", "operation": "lower", "required": False},
+            ]
+        )
+
+        plan = transformer.compile_rules(["board", "roll"])
+
+        assert [step.operations for step in plan.steps["board"]] == [["strip", "upper"], ["map"], ["replace"]]
+        assert [step.operations for step in plan.steps["roll"]] == [["strip"]]
+        assert plan.skipped_columns == ["missing"]
+        assert plan.passes == 4
+
+        with pytest.raises(ValueError):
+            TransformationRule(column="board", operation="unknown")
+
+    @pytest.mark.asyncio
+    async def test_apply_transformation_rules(self, raw_student_data):
+        """Test configured rules run after the built-in column transforms"""
+        raw_student_data["board"] = [" dhaka ", "RAJSHAHI", None]
+        raw_student_data["roll"] = ["  001", "002 ", "003"]
+
+        transformer = StudentDataTransformer()
+        transformer.add_transformation_rules(
+            [
+                {"column": "board", "operation": "clean", "parameters": {"case": "upper"}},
+                {"column": "board", "operation": "map", "parameters": {"mapping": {"DHAKA": "Dhaka"}, "default": "Other"}},
+                {"column": "roll", "operation": "strip"},
+                {"column": "not_present", "operation": "strip"},
+            ]
+        )
+
+        transformed_data = await transformer.transform(raw_student_data)
+
+        assert transformed_data["board"].tolist() == ["Dhaka", "Other", "Other"]
+        assert transformed_data["roll"].tolist() == ["001", "002", "003"]
+        assert transformed_data["full_name"].iloc[0] == "Ahmed Rahman"
+
+    @pytest.mark.asyncio
+    async def test_rule_columns_in_worker_processes(self, raw_student_data):
+        """Test rule columns run in worker processes give the same result as inline"""
+        rules = [
+            {"column": "division", "operation": "clean", "parameters": {"case": "upper"}},
+            {"column": "mobile", "operation": "normalize_phone"},
+            {"column": "name", "operation": "title"},
+        ]
+        results = []
+        for rule_workers in (0, 2):
+            transformer = StudentDataTransformer()
+            transformer.add_transformation_rules(rules)
+            transformer.rule_workers = rule_workers
+            results.append(await transformer.apply_transformation_rules(raw_student_data.copy()))
+
+        pd.testing.assert_frame_equal(results[0], results[1])
+        assert results[1]["division"].tolist() == ["DHAKA", "CHITTAGONG", "RAJSHAHI"]
+
     @pytest.fixture
     def raw_school_data(self):
         """Raw school data before transformation"""
@@ -301,6 +948,118 @@ class TestLoaders:
         assert len(errors) > 0
         assert any("age" in error.lower() for error in errors)
 
+    def test_copy_loader_configuration(self):
+        """Test COPY load method selection"""
+        assert DatabaseLoader("students").method == "insert"
+        assert CopyLoader("students", on_conflict="update", upsert_columns=["student_id"]).method == "copy"
+        assert isinstance(create_loader("copy", "students"), CopyLoader)
+
+        with pytest.raises(ValueError):
+            DatabaseLoader("students", method="bulk")
+
+    def test_upsert_accounting(self):
+        """Test RETURNING (xmax = 0) flags are split into inserted/updated/unchanged"""
+        # Two new rows, one updated row, one row skipped by the IS DISTINCT FROM guard
+        inserted, updated, unchanged = DatabaseLoader._count_upserted([True, False, True], 4)
+        assert (inserted, updated, unchanged) == (2, 1, 1)
+
+    @staticmethod
+    def copy_table():
+        return Table("students", MetaData(), Column("student_id", String, primary_key=True), Column("division", String))
+
+    @staticmethod
+    def copy_connection(execute):
+        """Async connection double for ``_copy_batch``, recording DDL and savepoint calls"""
+        calls = []
+        savepoint = Mock()
+        savepoint.commit = AsyncMock(side_effect=lambda: calls.append("release"))
+        savepoint.rollback = AsyncMock(side_effect=lambda: calls.append("rollback"))
+
+        connection = Mock()
+        connection.run_sync = AsyncMock(side_effect=lambda fn: calls.append(fn.__name__))
+        connection.begin_nested = AsyncMock(return_value=savepoint)
+        connection.get_raw_connection = AsyncMock()
+        connection.get_raw_connection.return_value.driver_connection.copy_to_table = AsyncMock()
+        connection.execute = AsyncMock(side_effect=execute)
+
+        session = Mock()
+        session.connection = AsyncMock(return_value=connection)
+        return session, calls
+
+    @pytest.mark.asyncio
+    async def test_copy_batch_upsert_counts(self, sample_student_data):
+        """Test a COPY upsert reports inserted, updated and unchanged rows from its RETURNING flags"""
+        loader = CopyLoader("students", on_conflict="update", upsert_columns=["student_id"])
+        model_class = Mock(__table__=self.copy_table())
+        result = Mock()
+        result.scalars.return_value.all.return_value = [True, False]
+        session, calls = self.copy_connection(AsyncMock(return_value=result))
+
+        batch = pd.concat([sample_student_data, sample_student_data.assign(student_id="STU003")])
+        counts = await loader._copy_batch(session, batch, model_class)
+
+        # One new row, one updated row and two left alone by the IS DISTINCT FROM guard
+        assert (counts["inserted"], counts["updated"], counts["unchanged"], counts["failed"]) == (1, 1, 2, 0)
+        assert calls == ["create", "release", "drop"]
+        # CREATE TEMPORARY TABLE, SAVEPOINT, COPY, INSERT ... SELECT, RELEASE and DROP
+        assert counts["round_trips"] == 6
+
+    def test_upsert_without_columns_to_compare_does_nothing_on_conflict(self):
+        """Test an upsert with only key or bookkeeping columns skips conflicts instead of an empty update"""
+        loader = DatabaseLoader("students", on_conflict="update", upsert_columns=["student_id"])
+        table = Table(
+            "students",
+            MetaData(),
+            Column("student_id", String, primary_key=True),
+            Column("division", String),
+            Column("updated_at", String),
+        )
+
+        def compiled(column_names):
+            return str(loader._build_upsert(pg_insert(table), column_names).compile(dialect=postgresql.dialect()))
+
+        changed = compiled(["student_id", "division", "updated_at"])
+        assert "DO UPDATE SET division = excluded.division, updated_at = excluded.updated_at" in changed
+        assert "IS DISTINCT FROM" in changed
+
+        for column_names in (["student_id"], ["student_id", "updated_at"]):
+            skipped = compiled(column_names)
+            assert "ON CONFLICT (student_id) DO NOTHING RETURNING (xmax = 0)" in skipped
+            assert "DO UPDATE" not in skipped
+
+        # DO NOTHING only returns inserted rows; the conflicting ones are unchanged
+        assert DatabaseLoader._count_upserted([True], 3) == (1, 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_copy_batch_writes_nullable_integers_as_integers(self):
+        """Test a NaN-bearing integer column is copied as integers and empty fields, not floats"""
+        loader = CopyLoader("students", on_conflict="error")
+        table = Table("students", MetaData(), Column("student_id", String, primary_key=True), Column("grade", Integer))
+        result = Mock(rowcount=2)
+        session, calls = self.copy_connection(AsyncMock(return_value=result))
+
+        batch = pd.DataFrame({"student_id": ["STU001", "STU002"], "grade": [7, np.nan]})
+        counts = await loader._copy_batch(session, batch, Mock(__table__=table))
+
+        copy_to_table = session.connection.return_value.get_raw_connection.return_value.driver_connection.copy_to_table
+        assert copy_to_table.call_args.kwargs["source"].getvalue() == b"STU001,7\nSTU002,\n"
+        assert counts["inserted"] == 2 and counts["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_copy_batch_failure_rolls_back_before_dropping(self, sample_student_data):
+        """Test a failed merge is rolled back to its savepoint so the staging table can still be dropped"""
+        loader = CopyLoader("students", on_conflict="update", upsert_columns=["student_id"])
+        model_class = Mock(__table__=self.copy_table())
+        session, calls = self.copy_connection(AsyncMock(side_effect=RuntimeError("duplicate key value")))
+
+        counts = await loader._copy_batch(session, sample_student_data, model_class)
+
+        assert counts["failed"] == 2 and counts["inserted"] == 0
+        assert counts["errors"] == ["duplicate key value"]
+        assert calls == ["create", "rollback", "drop"]
+        # The failed merge still made its trip; ROLLBACK replaces RELEASE
+        assert counts["round_trips"] == 6
+
 
 class TestValidators:
     """Test data quality validators"""
@@ -425,6 +1184,153 @@ class TestValidators:
         assert result["passed"] is False
         assert "invalid values" in result["messages"][0].lower()
 
+    def test_profile_matches_row_scans(self, sample_data_with_issues):
+        """Test profile-derived counts agree with direct row-level pandas scans"""
+        data = sample_data_with_issues.assign(score=[1.5, None, 2.5, 2.5, 10.0])
+        profile = DataProfile(data)
+
+        for column in data.columns:
+            assert profile[column].null_count == data[column].isnull().sum()
+            assert profile[column].duplicate_count == data[column].duplicated().sum()
+
+        for column in ["age", "score"]:
+            expected = data[column].quantile([0.25, 0.5, 0.75])
+            assert profile[column].quantiles() == pytest.approx(expected.to_dict())
+            assert profile[column].min == data[column].min()
+            assert profile[column].max == data[column].max()
+
+        assert profile["age"].count_below(0) == 1
+        assert profile["age"].count_above(100) == 1
+        assert profile["gender"].count_not_in(["Male", "Female", "Other"]) == 1
+
+        pattern = r"^[\w.]+@[\w.]+\.\w+$"
+        expected_mismatches = (~data["email"].astype(str).str.match(pattern, na=True)).sum()
+        assert profile["email"].count_not_matching(pattern) == expected_mismatches
+
+        assert set(profile.numeric_columns) == {"id", "age", "score"}
+
+    @pytest.mark.asyncio
+    async def test_validation_details_include_profile(self, sample_data_with_issues):
+        """Test validate exposes the shared column profile"""
+        validator = DataQualityValidator()
+        result = await validator.validate(sample_data_with_issues)
+
+        profile = result.validation_details["profile"]
+        assert profile["name"]["null_count"] == 1
+        assert profile["gender"]["distinct_count"] == 4
+        assert profile["age"]["min"] == -5
+        assert result.validation_details["statistics"]["outliers"]["age"]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_custom_rules_report_timings(self, sample_data_with_issues):
+        """Test custom rules report per-rule timings and messages in registration order"""
+        validator = DataQualityValidator({})
+        validator.add_validation_rule(
+            ValidationRule(rule_name="id_uniqueness", rule_type="uniqueness", column="id", severity="error")
+        )
+        validator.add_validation_rule(
+            ValidationRule(
+                rule_name="gender_validity",
+                rule_type="validity",
+                column="gender",
+                parameters={"valid_values": ["Male", "Female", "Other"]},
+            )
+        )
+        validator.add_validation_rule(
+            ValidationRule(rule_name="age_range", rule_type="validity", column="age", parameters={"min_value": "x"})
+        )
+
+        errors, warnings, timings = await validator._apply_custom_rules(sample_data_with_issues)
+
+        assert list(timings) == ["id_uniqueness", "gender_validity", "age_range"]
+        assert all(timing["seconds"] >= 0 for timing in timings.values())
+        assert timings["gender_validity"]["rule_type"] == "validity"
+        assert timings["age_range"]["passed"] is False
+        assert "duplicate" in errors[0]
+        assert "invalid values" in errors[1]
+        assert errors[2].startswith("Rule 'age_range' execution failed")
+
+    @pytest.mark.asyncio
+    async def test_rule_timings_add_up_for_shared_names(self, sample_data_with_issues):
+        """Test rules registered under the same name are timed together rather than overwriting each other"""
+        validator = DataQualityValidator({})
+        for column in ["name", "age"]:
+            validator.add_validation_rule(
+                ValidationRule(rule_name="completeness", rule_type="completeness", column=column, severity="warning")
+            )
+
+        _, _, timings = await validator._apply_custom_rules(sample_data_with_issues)
+
+        assert list(timings) == ["completeness"]
+        assert timings["completeness"]["calls"] == 2
+        assert timings["completeness"]["passed"] is False
+
+    def test_stratified_sample_for_expectations(self):
+        """Test large batches are sampled proportionally per stratum before running GE"""
+        validator = DataQualityValidator({"ge_sample_size": 100, "ge_stratify_by": ["division"]})
+        data = pd.DataFrame({"division": ["Dhaka"] * 900 + ["Sylhet"] * 100, "score": range(1000)})
+
+        sample = validator._sample_for_expectations(data)
+
+        assert len(sample) == 100
+        assert sample["division"].value_counts().to_dict() == {"Dhaka": 90, "Sylhet": 10}
+        assert len(validator._sample_for_expectations(data.head(50))) == 50
+
+    @pytest.mark.asyncio
+    async def test_great_expectations_checkpoint_cached(self, sample_data_with_issues):
+        """Test checkpoints are built once per table and schema and results kept in memory"""
+        validator = DataQualityValidator({"ge_result_store": "lightweight"})
+        validator.ge_context = Mock()
+
+        with patch("src.data_processing.validators.SimpleCheckpoint") as checkpoint_cls, patch(
+            "src.data_processing.validators.RuntimeBatchRequest"
+        ):
+            run_result = checkpoint_cls.return_value.run.return_value
+            run_result.list_validation_results.return_value = [Mock(success=True, statistics={}, results=[])]
+
+            await validator._run_great_expectations(sample_data_with_issues, "students")
+            await validator._run_great_expectations(sample_data_with_issues.head(2), "students")
+            await validator._run_great_expectations(sample_data_with_issues.assign(extra=1), "students")
+
+        assert checkpoint_cls.call_count == 2
+        assert checkpoint_cls.call_args.kwargs["action_list"] == []
+        assert checkpoint_cls.call_args.kwargs["expectation_suite_name"].startswith("students_")
+        assert len(validator.ge_results) == 3
+
+    def test_suites_are_built_per_schema_from_the_table_suite(self, sample_data_with_issues):
+        """Test each schema gets its own suite, seeded from the old per-table suite only when its columns match"""
+        columns = sample_data_with_issues.columns.tolist()
+        table_suite = Mock(
+            expectations=[
+                Mock(expectation_type="expect_table_columns_to_match_ordered_list", kwargs={"column_list": columns}),
+                Mock(expectation_type="expect_column_to_exist", kwargs={"column": "id"}),
+            ]
+        )
+
+        def get_expectation_suite(name):
+            if name == "students_suite":
+                return table_suite
+            raise KeyError(name)
+
+        validator = DataQualityValidator({})
+        validator.ge_context = Mock()
+        validator.ge_context.get_expectation_suite.side_effect = get_expectation_suite
+        profile = DataProfile(sample_data_with_issues)
+
+        with patch("src.data_processing.validators.SimpleCheckpoint"), patch.object(
+            validator, "_add_default_expectations"
+        ) as add_defaults:
+            _, same_schema = validator._get_checkpoint("students", sample_data_with_issues, profile)
+            changed = sample_data_with_issues.assign(extra=1)
+            _, new_schema = validator._get_checkpoint("students", changed, DataProfile(changed))
+
+        assert same_schema == f"students_{schema_hash(sample_data_with_issues)[:12]}_suite"
+        assert new_schema == f"students_{schema_hash(changed)[:12]}_suite"
+        seeded = validator.ge_context.create_expectation_suite.return_value
+        seeded.add_expectation_configurations.assert_called_once_with(table_suite.expectations)
+        assert add_defaults.call_count == 1
+        assert validator.ge_context.save_expectation_suite.call_count == 2
+
     def test_predefined_validation_rules(self):
         """Test predefined validation rule sets"""
         from src.data_processing.validators import get_school_validation_rules, get_student_validation_rules
@@ -440,6 +1346,171 @@ class TestValidators:
         assert any(rule.column == "school_id" for rule in school_rules)
 
 
+class TestSketches:
+    """Test mergeable approximate sketches"""
+
+    def test_hyperloglog_merge_and_error(self):
+        """Test HyperLogLog estimates stay within a few standard errors after merging"""
+        left, right = HyperLogLog(precision=12), HyperLogLog(precision=12)
+        left.update(pd.Series(np.arange(0, 60_000)))
+        right.update(pd.Series(np.arange(40_000, 100_000)))
+        left.merge(right)
+
+        assert abs(left.count() - 100_000) / 100_000 < 4 * left.relative_error
+
+    def test_kll_quantiles_within_rank_error(self):
+        """Test KLL quantiles of merged chunks stay within the reported rank error"""
+        values = np.random.default_rng(7).permutation(100_000).astype(float)
+        sketch = KLLSketch(k=200, seed=1)
+        for chunk in np.array_split(values, 4):
+            part = KLLSketch(k=200, seed=1)
+            part.update(chunk)
+            sketch.merge(part)
+
+        assert sketch.count == len(values)
+        for q, estimate in sketch.quantiles([0.1, 0.5, 0.9]).items():
+            assert abs(estimate / len(values) - q) <= 2 * sketch.rank_error
+
+    def test_bloom_filter_membership(self):
+        """Test Bloom filters have no false negatives and merge by OR"""
+        first, second = BloomFilter(capacity=1000), BloomFilter(capacity=1000)
+        first.add(hash_values(pd.Series(range(500))))
+        second.add(hash_values(pd.Series(range(500, 1000))))
+        first.merge(second)
+
+        assert first.contains(hash_values(pd.Series(range(1000)))).all()
+        assert first.contains(hash_values(pd.Series(range(10_000, 11_000)))).mean() < 0.01
+
+    def test_duplicates_across_chunks(self):
+        """Test duplicate keys are found within and across chunks"""
+        sketch = ValidationSketch(bloom_capacity=1000)
+        assert sketch.count_duplicates(pd.DataFrame({"id": [1, 2, 2]}), ["id"]) == 1
+        # An integer key seen before keeps its hash once nulls make the column float
+        assert sketch.count_duplicates(pd.DataFrame({"id": [2.0, 3.0, None]}), ["id"]) == 1
+        assert sketch.duplicates == {("id",): 2}
+
+    @pytest.mark.asyncio
+    async def test_approximate_validation_mode(self):
+        """Test approximate validation reports sketch estimates with accuracy bounds"""
+        validator = DataQualityValidator({"approximate": True, "bloom_capacity": 10_000})
+        validator.add_validation_rule(
+            ValidationRule(rule_name="id_uniqueness", rule_type="uniqueness", column="id", severity="error")
+        )
+
+        first = await validator.validate(pd.DataFrame({"id": range(0, 100), "score": np.linspace(0, 1, 100)}))
+        second = await validator.validate(pd.DataFrame({"id": range(90, 190), "score": np.linspace(0, 1, 100)}))
+
+        assert "duplicate" not in " ".join(first.errors)
+        assert second.is_valid is False
+        assert "10 duplicate" in " ".join(second.errors)
+
+        sketches = second.validation_details["sketches"]
+        assert sketches["rows"] == 200
+        assert abs(sketches["distinct_estimates"]["id"] - 190) <= 10
+        assert set(sketches["accuracy"]) >= {"distinct_relative_error", "quantile_rank_error", "duplicate_false_positive_rate"}
+
+
+class TestStaging:
+    """Test Parquet staging between pipeline stages"""
+
+    def test_write_read_with_projection(self, tmp_path):
+        """Test staged datasets round-trip and support column projection"""
+        staging = ParquetStagingArea(str(tmp_path), "run_1")
+        data = pd.DataFrame({"student_id": ["STU001", "STU002", "STU003"], "division": ["Dhaka", "Sylhet", "Dhaka"]})
+
+        artifact = staging.write("transformed", data, partition_cols=["division"])
+        assert artifact.row_count == 3
+        assert Path(artifact.path).is_dir()
+
+        projected = staging.read("transformed", columns=["student_id"])
+        assert list(projected.columns) == ["student_id"]
+        assert sorted(projected["student_id"]) == ["STU001", "STU002", "STU003"]
+
+    def test_null_partitions_read_back_as_null(self, tmp_path):
+        """Test rows without a partition value are staged under a sentinel and read back as null, in column order"""
+        staging = ParquetStagingArea(str(tmp_path), "run_3")
+        data = pd.DataFrame({"division": ["Dhaka", None, " "], "student_id": ["STU001", "STU002", "STU003"]})
+
+        artifact = staging.write("transformed", data, partition_cols=["division"])
+        assert sorted(path.name for path in Path(artifact.path).iterdir()) == [
+            "division=Dhaka",
+            f"division={NULL_PARTITION}",
+        ]
+
+        restored = staging.read("transformed").sort_values("student_id").reset_index(drop=True)
+        assert list(restored.columns) == ["division", "student_id"]
+        assert restored["division"].tolist() == ["Dhaka", None, None]
+
+    def test_append_and_iter_batches(self, tmp_path):
+        """Test appended parts are read back in bounded batches"""
+        staging = ParquetStagingArea(str(tmp_path), "run_2")
+        staging.append("extracted", pd.DataFrame({"id": range(5)}))
+        artifact = staging.append("extracted", pd.DataFrame({"id": range(5, 8)}))
+        assert artifact.row_count == 8
+
+        batches = list(staging.iter_batches("extracted", batch_size=3))
+        assert all(len(batch) <= 3 for batch in batches)
+        assert sum(len(batch) for batch in batches) == 8
+
+        staging.cleanup()
+        assert not staging.root.exists()
+
+
+class TestSchemas:
+    """Test typed ingestion schemas"""
+
+    def test_conform_keeps_unknown_values_as_categories(self):
+        """Test out-of-set values stay visible as extra categories"""
+        data = pd.DataFrame({"division": ["Dhaka", "Atlantis", None], "full_name": ["A", "B", None]})
+        conformed = get_schema("raw_students").conform(data)
+
+        assert isinstance(conformed["division"].dtype, pd.CategoricalDtype)
+        assert list(conformed["division"].cat.categories)[-1] == "Atlantis"
+        assert conformed["division"].isna().sum() == 1
+        assert conformed["full_name"].dtype == pd.StringDtype("pyarrow")
+
+    def test_concat_typed_keeps_categoricals(self):
+        """Test chunks with different inferred categories concatenate as categorical"""
+        chunks = [pd.DataFrame({"district": ["Dhaka"]}), pd.DataFrame({"district": ["Sylhet"]})]
+        typed = concat_typed([SCHEMA_REGISTRY["students"].apply_read_dtypes(chunk) for chunk in chunks])
+
+        assert isinstance(typed["district"].dtype, pd.CategoricalDtype)
+        assert list(typed["district"]) == ["Dhaka", "Sylhet"]
+
+    @pytest.mark.asyncio
+    async def test_typed_transform_matches_object_transform(self):
+        """Test typed reads clean to the same values as untyped ones"""
+        raw = pd.DataFrame(
+            {
+                "student_id": ["STU001", "STU002", "STU003"],
+                "name": ["  rahim  ", "KARIM", "Fatima"],
+                "sex": ["M", "f", "x"],
+                "dob": ["2010-01-15", "2011-05-20", "2009-12-01"],
+                "division": ["dhaka", "Sylhet", "Dhaka"],
+            }
+        )
+        schema = SCHEMA_REGISTRY["students"]
+        untyped = await StudentDataTransformer().transform(raw.copy())
+        transformer = StudentDataTransformer()
+        transformer.schema = schema
+        typed = await transformer.transform(schema.apply_read_dtypes(raw))
+
+        assert isinstance(typed["gender"].dtype, pd.CategoricalDtype)
+        for column in ["full_name", "gender", "division"]:
+            assert typed[column].astype(object).tolist() == untyped[column].tolist()
+
+    @pytest.mark.asyncio
+    async def test_csv_extractor_reads_schema_dtypes(self, tmp_path):
+        """Test CSV extraction applies the schema's read dtypes"""
+        csv_path = tmp_path / "students.csv"
+        pd.DataFrame({"student_id": ["STU001", "STU002"], "division": ["Dhaka", "Dhaka"]}).to_csv(csv_path, index=False)
+
+        data = await CSVExtractor(str(csv_path), schema=SCHEMA_REGISTRY["students"], chunk_size=1).extract()
+
+        assert isinstance(data["division"].dtype, pd.CategoricalDtype)
+        assert data["student_id"].dtype == pd.StringDtype("pyarrow")
+
+
 class TestIntegration:
     """Integration tests for the complete ETL pipeline"""
 
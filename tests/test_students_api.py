@@ -0,0 +1,190 @@
+"""Endpoint tests for the students API on an async SQLite database."""
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.api.endpoints import students
+
+# The app mounts the students router (prefix /api/students) under settings.API_V1_STR
+STUDENTS_URL = "/api/v1/api/students"
+
+
+def student_payload(student_id: str, **fields) -> dict:
+    """Minimal valid student body, with ``fields`` overriding or adding values"""
+    return {
+        "student_id": student_id,
+        "first_name": "Rahim",
+        "last_name": "Uddin",
+        "date_of_birth": "2010-03-14",
+        "gender": "male",
+        **fields,
+    }
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    """Session factory over a fresh SQLite file holding only the students table"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'students.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(students.StudentDB.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def students_client(session_factory):
+    """Client for an app serving only the students router, with authentication stubbed out"""
+
+    async def override_get_async_db():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(students.router, prefix="/api/v1")
+    app.dependency_overrides[students.get_async_db] = override_get_async_db
+    for dependency in (students.get_current_active_user, students.teacher_or_admin_required):
+        app.dependency_overrides[dependency] = lambda: None
+
+    students._name_index = None
+    students.student_count_cache.clear()
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+class TestStudentCrud:
+    """Test creating, reading and listing students through async sessions"""
+
+    async def test_create_and_read_student(self, students_client):
+        """Test a created student can be fetched by ID and is not created twice."""
+        response = await students_client.post(f"{STUDENTS_URL}/", json=student_payload("STU001", district="Dhaka"))
+        assert response.status_code == 201
+        assert response.json()["student_id"] == "STU001"
+
+        response = await students_client.get(f"{STUDENTS_URL}/STU001")
+        assert response.status_code == 200
+        assert response.json()["district"] == "Dhaka"
+
+        response = await students_client.post(f"{STUDENTS_URL}/", json=student_payload("STU001"))
+        assert response.status_code == 400
+        assert (await students_client.get(f"{STUDENTS_URL}/STU404")).status_code == 404
+
+    async def test_only_set_emails_must_be_unique(self, students_client):
+        """Test students without an email never clash, while a reused email is rejected."""
+        for student_id in ("STU001", "STU002"):
+            response = await students_client.post(f"{STUDENTS_URL}/", json=student_payload(student_id))
+            assert response.status_code == 201
+
+        await students_client.post(f"{STUDENTS_URL}/", json=student_payload("STU003", email="rahim@example.com"))
+        response = await students_client.post(f"{STUDENTS_URL}/", json=student_payload("STU004", email="rahim@example.com"))
+        assert response.status_code == 400
+        assert "already registered" in response.json()["detail"]
+
+    async def test_list_students_by_offset_and_cursor(self, students_client):
+        """Test both pagination modes walk the same students."""
+        for i in range(3):
+            await students_client.post(
+                f"{STUDENTS_URL}/", json=student_payload(f"STU00{i}", division="Khulna" if i else "Dhaka")
+            )
+
+        page = (await students_client.get(f"{STUDENTS_URL}/?limit=2")).json()
+        assert page["total"] == 3
+        assert [item["student_id"] for item in page["items"]] == ["STU000", "STU001"]
+
+        page = (await students_client.get(f"{STUDENTS_URL}/?pagination=cursor&limit=2&division=khulna")).json()
+        assert page["total"] == 2 and page["total_is_estimate"]
+        assert [item["student_id"] for item in page["items"]] == ["STU001", "STU002"]
+        assert page["next_cursor"] is None
+
+        page = (await students_client.get(f"{STUDENTS_URL}/?pagination=cursor&limit=2")).json()
+        last = (await students_client.get(f"{STUDENTS_URL}/?limit=2&cursor={page['next_cursor']}")).json()
+        assert [item["student_id"] for item in last["items"]] == ["STU002"]
+        assert last["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+class TestBatchUpsert:
+    """Test POST /api/students/batch"""
+
+    url = f"{STUDENTS_URL}/batch"
+
+    async def test_creates_then_updates_only_the_fields_sent(self, students_client, session_factory):
+        """Test a second batch updates existing students without clearing fields it omits."""
+        first = [student_payload("STU001", phone="+8801712345678"), student_payload("STU002")]
+        response = await students_client.post(self.url, json=first)
+        assert response.status_code == 200
+        assert response.json()["created"] == 2
+        assert [item["status"] for item in response.json()["items"]] == ["created", "created"]
+
+        second = [student_payload("STU001", first_name="Rahima"), student_payload("STU003")]
+        response = await students_client.post(self.url, json={"students": second})
+        body = response.json()
+        assert (body["created"], body["updated"], body["failed"]) == (1, 1, 0)
+        assert [item["status"] for item in body["items"]] == ["updated", "created"]
+
+        async with session_factory() as session:
+            student = (
+                await session.execute(select(students.StudentDB).where(students.StudentDB.student_id == "STU001"))
+            ).scalar_one()
+        assert student.first_name == "Rahima"
+        assert student.phone == "+8801712345678"
+
+    async def test_skip_leaves_existing_students_alone(self, students_client):
+        """Test on_conflict=skip reports existing IDs as skipped and still creates new ones."""
+        await students_client.post(self.url, json=[student_payload("STU001")])
+
+        response = await students_client.post(
+            f"{self.url}?on_conflict=skip", json=[student_payload("STU001", first_name="Other"), student_payload("STU002")]
+        )
+        body = response.json()
+        assert [item["status"] for item in body["items"]] == ["skipped", "created"]
+        assert (body["created"], body["updated"], body["skipped"]) == (1, 0, 1)
+
+    async def test_conflicts_duplicates_and_invalid_items_are_reported(self, students_client):
+        """Test per-item failures do not stop the valid items from being written."""
+        await students_client.post(self.url, json=[student_payload("STU001", email="rahim@example.com")])
+
+        response = await students_client.post(
+            self.url,
+            json=[
+                student_payload("STU002", email="rahim@example.com"),
+                student_payload("STU003"),
+                student_payload("STU003"),
+                {"student_id": "STU004"},
+            ],
+        )
+        body = response.json()
+        assert [item["status"] for item in body["items"]] == ["conflict", "created", "duplicate", "invalid"]
+        assert (body["created"], body["failed"]) == (1, 3)
+
+    async def test_oversized_body_is_rejected(self, students_client, monkeypatch):
+        """Test a body over the byte cap is refused with 413 before it is parsed."""
+        monkeypatch.setattr(students, "MAX_BATCH_BYTES", 256)
+        response = await students_client.post(self.url, json=[student_payload(f"STU{i:03d}") for i in range(10)])
+        assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+class TestExport:
+    """Test GET /api/students/export"""
+
+    async def test_export_streams_from_its_own_session(self, students_client, session_factory, monkeypatch):
+        """Test the export opens a session from the factory configured when it runs."""
+        await students_client.post(f"{STUDENTS_URL}/batch", json=[student_payload("STU001"), student_payload("STU002")])
+        monkeypatch.setattr(students.base, "AsyncSessionLocal", session_factory)
+
+        response = await students_client.get(f"{STUDENTS_URL}/export?format=csv")
+
+        assert response.status_code == 200
+        lines = response.text.strip().splitlines()
+        assert lines[0].split(",")[:2] == ["id", "student_id"]
+        assert [line.split(",")[1] for line in lines[1:]] == ["STU001", "STU002"]
+
+
+def test_export_is_limited_to_teachers_and_admins():
+    """Test the export route requires the same role as writes, not just a login."""
+    route = next(route for route in students.router.routes if route.path.endswith("/export"))
+    assert [dependency.call for dependency in route.dependant.dependencies] == [students.teacher_or_admin_required]
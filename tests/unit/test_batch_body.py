@@ -0,0 +1,55 @@
+"""Unit tests for reading batch request bodies."""
+
+import asyncio
+
+import pytest
+from src.api.batch import BatchTooLargeError, read_batch_items
+
+
+async def stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def read(*chunks, content_type="application/json", max_items=10, max_bytes=None):
+    return asyncio.run(read_batch_items(stream(*chunks), content_type, max_items, key="students", max_bytes=max_bytes))
+
+
+def test_json_array_and_wrapped_object():
+    """Test that both a bare array and an object holding it are accepted."""
+    assert read(b'[{"student_id": "S1"}, ', b'{"student_id": "S2"}]') == [{"student_id": "S1"}, {"student_id": "S2"}]
+    assert read(b'{"students": [{"student_id": "S1"}]}') == [{"student_id": "S1"}]
+
+
+def test_ndjson_lines_split_across_chunks():
+    """Test that NDJSON records split over chunk boundaries are reassembled."""
+    chunks = [b'{"student_id": "S1"}\n{"stud', b'ent_id": "S2"}\n\n{"student_id": "S3"}']
+    items = read(*chunks, content_type="application/x-ndjson")
+    assert [item["student_id"] for item in items] == ["S1", "S2", "S3"]
+
+
+def test_oversized_and_malformed_bodies_are_rejected():
+    """Test that too many items and invalid JSON raise."""
+    with pytest.raises(BatchTooLargeError):
+        read(b"{}\n" * 3, content_type="application/x-ndjson; charset=utf-8", max_items=2)
+    with pytest.raises(BatchTooLargeError):
+        read(b"[1, 2, 3]", max_items=2)
+    with pytest.raises(ValueError, match="Line 2"):
+        read(b'{"student_id": "S1"}\nnot json\n', content_type="application/x-ndjson")
+    with pytest.raises(ValueError):
+        read(b'{"rows": []}')
+
+
+def test_body_over_byte_cap_is_rejected_before_parsing():
+    """Test that the byte cap stops reading a JSON body that would fit the item cap."""
+    chunks = [b'[{"student_id": "S1", "address": "', b"x" * 100, b'"}]']
+    with pytest.raises(BatchTooLargeError, match="bytes"):
+        read(*chunks, max_bytes=64)
+    with pytest.raises(BatchTooLargeError, match="bytes"):
+        read(
+            b'{"student_id": "S1"}\n',
+            b'{"student_id": "' + b"x" * 100 + b'"}\n',
+            content_type="application/x-ndjson",
+            max_bytes=64,
+        )
+    assert read(*chunks, max_bytes=1024) == [{"student_id": "S1", "address": "x" * 100}]
@@ -3,8 +3,7 @@
 
 import pandas as pd
 import pytest
-
-from src.data_processing.data_processor import DataProcessor
+from src.data_processing.data_processor import DataProcessor, _read_csv_file
 
 
 @pytest.fixture
@@ -109,5 +108,41 @@ def test_calculate_performance_metrics_edge_cases(data_processor):
     assert metrics_data.loc[1, "performance_level"] == "Needs Improvement"
 
 
+def test_load_student_data_parallel(data_processor, sample_student_data, tmp_path):
+    """Test parallel multi-file loading collects per-file errors."""
+    source_dir = tmp_path / "banbeis"
+    source_dir.mkdir()
+    sample_student_data.iloc[:2].to_csv(source_dir / "upazila_a.csv", index=False)
+    sample_student_data.iloc[2:].to_csv(source_dir / "upazila_b.csv", index=False)
+    (source_dir / "upazila_c.csv").write_text("")  # Unparseable file
+
+    data_processor.raw_data_path = tmp_path
+    loaded_data = data_processor.load_student_data("banbeis", max_workers=2)
+
+    assert len(loaded_data) == 3
+    assert list(loaded_data["student_id"]) == ["S001", "S002", "S003"]
+    assert list(data_processor.load_errors) == [str(source_dir / "upazila_c.csv")]
+
+
+def test_csv_engines_infer_the_same_dtypes(tmp_path):
+    """Test the pyarrow reader leaves dates and timestamps as text, like the C engine."""
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "students.csv"
+    csv_path.write_text(
+        "student_id,date_of_birth,enrolled_at,gpa,days_present,name\n"
+        "S001,2000-01-01,2020-01-01 10:00:00,3.5,85,Student 1\n"
+        "S002,,2020-01-02 10:00:00,,,\n"
+    )
+
+    _, c_data, _ = _read_csv_file(str(csv_path), engine="c")
+    _, arrow_data, error = _read_csv_file(str(csv_path), engine="pyarrow")
+
+    assert error is None
+    assert dict(arrow_data.dtypes) == dict(c_data.dtypes)
+    assert arrow_data["date_of_birth"].iloc[0] == "2000-01-01"
+    assert arrow_data["enrolled_at"].iloc[1] == "2020-01-02 10:00:00"
+    assert arrow_data["name"].isna().iloc[1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
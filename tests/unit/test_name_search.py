@@ -0,0 +1,103 @@
+"""Unit tests for the in-memory trigram name index and the pg_trgm search query."""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from src.api.search import PG_NAME_EXPRESSION, NGramIndex, normalize_name, pg_name_search, trigrams
+
+NAMES = {
+    1: ["Rahim", "Uddin", "রহিম", "উদ্দিন"],
+    2: ["Karim", "Rahman", None, None],
+    3: ["Fatima", "Akter", "ফাতিমা", "আক্তার"],
+    4: ["Abdur", "Rahim", None, None],
+}
+
+
+def build_index():
+    index = NGramIndex()
+    for key, names in NAMES.items():
+        index.add(key, names)
+    return index
+
+
+def test_trigrams_are_padded_like_pg_trgm():
+    """Test that words are padded with two leading and one trailing space."""
+    assert trigrams("Ab") == {"  a", " ab", "ab "}
+    assert trigrams("Ab", prefix=True) == {"  a", " ab"}
+
+
+def test_normalize_name_folds_case_and_whitespace():
+    """Test that spelling variants normalise to the same text."""
+    assert normalize_name("  RAHIM   uddin ") == "rahim uddin"
+
+
+def test_prefix_matches_rank_first():
+    """Test that partly typed names return prefix matches ahead of fuzzy ones."""
+    hits = build_index().search("rahim")
+    assert [hit[0] for hit in hits[:2]] == [1, 4]
+    assert all(prefix for _, _, prefix in hits[:2])
+    assert hits[2][0] == 2 and not hits[2][2]
+
+
+def test_typos_and_bangla_names_match():
+    """Test that misspelt English names and Bangla prefixes are found."""
+    index = build_index()
+    assert 3 in [hit[0] for hit in index.search("fatema akter")]
+    assert [hit[0] for hit in index.search("ফাতি")] == [3]
+
+
+def test_remove_and_reindex():
+    """Test that removed or renamed records stop matching their old names."""
+    index = build_index()
+    index.remove(1)
+    index.add(4, ["Abdul", "Karim"])
+    assert [hit[0] for hit in index.search("rahim")] == [2]
+    assert len(index) == 3
+
+
+def test_pg_query_checks_every_query_word():
+    """Test that the SQL gets one escaped prefix per query word, like the in-memory index."""
+    statement, params = pg_name_search("  Rah  UD_% ", limit=5)
+
+    assert params["query"] == "rah ud_%"
+    assert (params["prefix_0"], params["prefix_1"]) == ("rah%", "ud\\_%")
+    assert params["contains_1"] == "%ud\\_%"
+    assert ":prefix_1" in statement.text and ":prefix_2" not in statement.text
+    assert PG_NAME_EXPRESSION in statement.text
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL", "").startswith("postgresql"), reason="needs a PostgreSQL TEST_DATABASE_URL"
+)
+@pytest.mark.parametrize("query", ["rahim", "rah ud", "ফাতি", "fatema akter", "uddin rah"])
+def test_pg_query_matches_in_memory_index(query):
+    """Test that PostgreSQL returns the students and prefix flags the fallback index does."""
+    engine = create_engine(os.environ["TEST_DATABASE_URL"].replace("+asyncpg", ""))
+    with engine.connect() as conn:
+        if conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).scalar() is None:
+            pytest.skip("pg_trgm is not installed")
+
+        # A temporary table shadows any real students table for this connection only
+        conn.execute(
+            text(
+                "CREATE TEMPORARY TABLE students (id integer PRIMARY KEY, first_name text, last_name text, "
+                "first_name_bn text, last_name_bn text)"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO students VALUES (:id, :first_name, :last_name, :first_name_bn, :last_name_bn)"),
+            [
+                dict(zip(["id", "first_name", "last_name", "first_name_bn", "last_name_bn"], [key, *names]))
+                for key, names in NAMES.items()
+            ],
+        )
+        conn.execute(text("SELECT set_config('pg_trgm.word_similarity_threshold', '0.6', false)"))
+        statement, params = pg_name_search(query, limit=10)
+        rows = conn.execute(statement, params).all()
+    engine.dispose()
+
+    expected = build_index().search(query, limit=10, threshold=0.6)
+    assert {(row.id, row.prefix_match) for row in rows if row.prefix_match} == {
+        (key, prefix) for key, _, prefix in expected if prefix
+    }
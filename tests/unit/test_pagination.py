@@ -0,0 +1,43 @@
+"""Unit tests for keyset pagination helpers."""
+
+import asyncio
+
+import pytest
+from src.api.pagination import CountCache, InvalidCursorError, decode_cursor, encode_cursor, estimated_row_count
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the position it was issued for."""
+    cursor = encode_cursor("last_name", "Rahman", 42)
+    assert decode_cursor(cursor, "last_name") == ("Rahman", 42)
+
+
+def test_cursor_rejects_other_sort_and_garbage():
+    """Test that cursors are tied to their sort key and tampering is rejected."""
+    cursor = encode_cursor("id", 10, 10)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "last_name")
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", "id")
+
+
+def test_count_cache_reuses_counts_per_filter_set():
+    """Test that counts are computed once per filter set until they expire."""
+    calls = []
+    cache = CountCache(ttl=60.0)
+
+    async def count():
+        calls.append(1)
+        return 7
+
+    async def totals():
+        return [await cache.get_or_count(key, count) for key in [("Dhaka",), ("Dhaka",), ("Sylhet",)]]
+
+    assert asyncio.run(totals()) == [7, 7, 7]
+    assert len(calls) == 2
+
+
+def test_estimated_row_count_ignores_unanalyzed_tables():
+    """Test that a never-analyzed table (reltuples -1) gives no estimate."""
+    assert estimated_row_count(-1.0) is None
+    assert estimated_row_count(1234.0) == 1234
@@ -0,0 +1,65 @@
+"""Unit tests for the synthetic data generators."""
+
+import pandas as pd
+import pytest
+
+from utils.data_generators.synthetic_students import (
+    DIVISION_WEIGHTS,
+    generate_dataset,
+    generate_schools,
+    generate_students,
+    generate_synthetic_students,
+)
+
+
+def test_generate_dataset_is_reproducible():
+    """Test that the same seed produces identical frames."""
+    first = generate_dataset(2000, seed=7)
+    second = generate_dataset(2000, seed=7)
+    for name, frame in first.items():
+        pd.testing.assert_frame_equal(frame, second[name])
+
+
+def test_generate_dataset_is_consistent():
+    """Test that students attend existing schools in their own division."""
+    dataset = generate_dataset(5000, seed=1)
+    students, schools = dataset["students"], dataset["schools"]
+
+    assert len(students) == 5000
+    assert students["student_id"].is_unique
+    assert len(dataset["enrollments"]) == 5000
+    assert dataset["assessments"]["student_id"].isin(students["student_id"]).all()
+
+    merged = students.merge(schools[["school_id", "division"]], on="school_id", suffixes=("", "_school"))
+    assert len(merged) == len(students)
+    assert (merged["division"] == merged["division_school"]).all()
+
+
+def test_generate_schools_covers_every_division():
+    """Test that even the smallest school frame has a school in each division."""
+    schools = generate_schools(len(DIVISION_WEIGHTS), seed=5)
+    assert set(schools["division"]) == set(DIVISION_WEIGHTS)
+
+
+def test_generate_students_rejects_divisions_without_schools():
+    """Test that students are not silently placed in another division's school."""
+    schools = generate_schools(20, seed=5)
+    with pytest.raises(ValueError, match="No schools in divisions"):
+        generate_students(1000, schools=schools[schools["division"] != "Sylhet"], seed=5)
+
+
+def test_generate_dataset_skews_divisions():
+    """Test that divisions follow the configured population skew."""
+    students = generate_dataset(20000, seed=3)["students"]
+    shares = students["division"].value_counts(normalize=True)
+
+    assert set(shares.index) == set(DIVISION_WEIGHTS)
+    assert shares.idxmax() == "Dhaka"
+    assert abs(shares["Dhaka"] - DIVISION_WEIGHTS["Dhaka"]) < 0.02
+
+
+def test_generate_synthetic_students_columns():
+    """Test the small generator keeps its original columns."""
+    df = generate_synthetic_students(10)
+    assert list(df.columns) == ["student_id", "name", "division", "gpa"]
+    assert df["gpa"].between(2.0, 5.0).all()
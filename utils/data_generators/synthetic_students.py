@@ -1,23 +1,263 @@
-"""Synthetic student data generator for testing and modeling without PII."""
+"""Synthetic student data generator for testing, modeling and benchmarks without PII.
 
-import random
+Everything is generated with vectorised NumPy draws, so frames of millions of
+rows take seconds. Records are spread across the eight divisions with
+population-like skew and carry the same formatting noise (mixed case, stray
+whitespace, assorted phone and gender codes, some missing values) that the
+ETL transformers clean up in real board exports.
+"""
 
+from typing import Dict, Optional
+
+import numpy as np
 import pandas as pd
 
+# Share of students per division, roughly following population
+DIVISION_WEIGHTS = {
+    "Dhaka": 0.26,
+    "Chittagong": 0.20,
+    "Rajshahi": 0.12,
+    "Khulna": 0.11,
+    "Rangpur": 0.11,
+    "Mymensingh": 0.08,
+    "Sylhet": 0.07,
+    "Barisal": 0.05,
+}
+
+# A few districts per division, most populous first
+DISTRICTS = {
+    "Dhaka": ["Dhaka", "Gazipur", "Narayanganj", "Tangail", "Faridpur"],
+    "Chittagong": ["Chittagong", "Comilla", "Cox's Bazar", "Noakhali", "Feni"],
+    "Rajshahi": ["Rajshahi", "Bogura", "Pabna", "Naogaon"],
+    "Khulna": ["Khulna", "Jessore", "Kushtia", "Satkhira"],
+    "Rangpur": ["Rangpur", "Dinajpur", "Kurigram", "Gaibandha"],
+    "Mymensingh": ["Mymensingh", "Jamalpur", "Netrokona", "Sherpur"],
+    "Sylhet": ["Sylhet", "Moulvibazar", "Habiganj", "Sunamganj"],
+    "Barisal": ["Barisal", "Patuakhali", "Bhola"],
+}
+
+UPAZILA_SUFFIXES = ["Sadar", "North", "South"]
+
+FIRST_NAMES = (
+    "Ayesha Rahim Sumon Mitu Jamal Rina Fatima Karim Nusrat Tanvir Sadia Imran Farhana Rakib Sharmin Arif Taslima Habib"
+).split()
+LAST_NAMES = "Islam Hossain Khan Akter Mia Begum Rahman Ahmed Chowdhury Uddin Sarkar Das".split()
+
+GENDER_CODES = ["M", "F", "Male", "Female", "male", "female", "1", "2"]
+SCHOOL_TYPES = ["GOVT", "PVT", "NGO", "MADRASA", "TECHNICAL"]
+EDUCATION_LEVELS = ["PRIMARY", "SECONDARY", "HIGHER_SECONDARY", "TECHNICAL", "MADRASA"]
+GRADE_LEVELS = [str(grade) for grade in range(1, 13)]
+SUBJECTS = ["Bangla", "English", "Mathematics", "Science", "Social Science", "Religion"]
+EXAMS = ["Half Yearly", "Annual", "Model Test"]
+EMAIL_DOMAINS = ["example.com", "mail.example.org", "school.edu.bd", "invalid"]
+
+# Fraction of contact values left empty
+MISSING_RATE = 0.05
+
+
+def _geography(rng: np.random.Generator, n: int, every_division: bool = False) -> pd.DataFrame:
+    """Division, district and upazila per row, skewed across and within divisions
+
+    With ``every_division`` the first rows take one division each, so any
+    frame of at least eight rows covers the whole country.
+    """
+    divisions = np.array(list(DIVISION_WEIGHTS))
+    weights = np.array(list(DIVISION_WEIGHTS.values()))
+    division_codes = rng.choice(len(divisions), size=n, p=weights / weights.sum())
+    if every_division:
+        division_codes[: len(divisions)] = np.arange(min(n, len(divisions)))
+
+    # Zipf-like skew towards each division's first (largest) district
+    district_codes = np.empty(n, dtype=np.int64)
+    district_names = []
+    for code, division in enumerate(divisions):
+        mask = division_codes == code
+        districts = DISTRICTS[division]
+        district_weights = 1.0 / np.arange(1, len(districts) + 1)
+        district_codes[mask] = len(district_names) + rng.choice(
+            len(districts), size=int(mask.sum()), p=district_weights / district_weights.sum()
+        )
+        district_names.extend(districts)
+
+    district_names = np.array(district_names, dtype=object)
+    suffixes = np.array(UPAZILA_SUFFIXES, dtype=object)
+    return pd.DataFrame(
+        {
+            "division": divisions[division_codes].astype(object),
+            "district": district_names[district_codes],
+            "upazila": district_names[district_codes] + " " + suffixes[rng.integers(0, len(suffixes), n)],
+        }
+    )
+
+
+def _serial_numbers(n: int, width: int) -> np.ndarray:
+    """Zero-padded serials 1..n as strings, the numeric part of generated identifiers"""
+    return pd.Series(np.arange(1, n + 1)).astype(str).str.zfill(width).to_numpy(dtype=object)
+
+
+def _names(rng: np.random.Generator, n: int, noisy: bool = True) -> np.ndarray:
+    """Full names, by default with inconsistent case and whitespace"""
+    pool = np.array([f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES], dtype=object)
+    codes = rng.integers(0, len(pool), n)
+    if not noisy:
+        return pool[codes]
+
+    variants = np.concatenate([pool, np.array([name.upper() for name in pool], dtype=object), "  " + pool + " "])
+    # Mostly clean names, a quarter upper-cased or padded
+    return variants[codes + len(pool) * (rng.random(n) < 0.25) * rng.integers(1, 3, n)]
+
+
+def _phones(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Bangladeshi mobile numbers in assorted formats, some missing"""
+    prefixes = np.array(["0", "+880", "880", "+880 ", "0"], dtype=object)
+    operators = np.array(["13", "14", "15", "16", "17", "18", "19"], dtype=object)
+    subscribers = pd.Series(rng.integers(0, 100_000_000, n)).astype(str).str.zfill(8).to_numpy(dtype=object)
+    phones = prefixes[rng.integers(0, len(prefixes), n)] + operators[rng.integers(0, len(operators), n)] + subscribers
+    phones[rng.random(n) < MISSING_RATE] = None
+    return phones
+
+
+def _emails(rng: np.random.Generator, local_parts: np.ndarray) -> np.ndarray:
+    """Addresses on a mix of domains, one of them invalid, some missing"""
+    domains = np.array(EMAIL_DOMAINS, dtype=object)
+    emails = local_parts + "@" + domains[rng.integers(0, len(domains), len(local_parts))]
+    emails[rng.random(len(local_parts)) < MISSING_RATE] = None
+    return emails
+
+
+def _dates(rng: np.random.Generator, n: int, start: str, end: str) -> np.ndarray:
+    """ISO date strings drawn uniformly between ``start`` and ``end``"""
+    low, high = np.datetime64(start, "D").astype(np.int64), np.datetime64(end, "D").astype(np.int64)
+    return rng.integers(low, high, n).astype("datetime64[D]").astype(str).astype(object)
+
+
+def generate_schools(num_schools: int, seed: int = 42) -> pd.DataFrame:
+    """Raw school records as a board export would provide them, at least one per division"""
+    rng = np.random.default_rng(seed)
+    serials = _serial_numbers(num_schools, 6)
+    geography = _geography(rng, num_schools, every_division=True)
+    types = np.array(SCHOOL_TYPES, dtype=object)
+    levels = np.array(EDUCATION_LEVELS, dtype=object)
+
+    return pd.DataFrame(
+        {
+            "school_id": "SCH" + serials,
+            "name": geography["upazila"].to_numpy() + " " + levels[rng.integers(0, len(levels), num_schools)] + " School",
+            "type": types[rng.choice(len(types), size=num_schools, p=[0.45, 0.3, 0.1, 0.1, 0.05])],
+            "level": levels[rng.integers(0, len(levels), num_schools)],
+            **geography,
+            "phone": _phones(rng, num_schools),
+            "email": _emails(rng, "school" + serials),
+            "head_teacher": _names(rng, num_schools),
+        }
+    )
+
+
+def generate_students(num_students: int, schools: Optional[pd.DataFrame] = None, seed: int = 42) -> pd.DataFrame:
+    """Raw student records, each attending a school in their own division
+
+    Raises:
+        ValueError: If ``schools`` leaves a student's division without a school
+    """
+    rng = np.random.default_rng(seed + 1)
+    schools = generate_schools(max(10, num_students // 500), seed) if schools is None else schools
+    serials = _serial_numbers(num_students, 9)
+    geography = _geography(rng, num_students)
+    genders = np.array(GENDER_CODES, dtype=object)
+    grades = np.array(GRADE_LEVELS, dtype=object)
+
+    # Pick a school from the student's division, favouring its first schools so school sizes vary
+    school_divisions = pd.Categorical(schools["division"], categories=list(DIVISION_WEIGHTS)).codes
+    schools_by_division = np.argsort(school_divisions, kind="stable")
+    school_counts = np.bincount(school_divisions, minlength=len(DIVISION_WEIGHTS))
+    school_offsets = np.concatenate([[0], np.cumsum(school_counts)[:-1]])
+    student_divisions = pd.Categorical(geography["division"], categories=list(DIVISION_WEIGHTS)).codes
+    counts = school_counts[student_divisions]
+    if (counts == 0).any():
+        missing = sorted(set(np.array(list(DIVISION_WEIGHTS))[student_divisions[counts == 0]]))
+        raise ValueError(f"No schools in divisions {missing}")
+    within = np.floor(rng.random(num_students) ** 2 * counts).astype(np.int64)
+    school_index = schools_by_division[school_offsets[student_divisions] + within]
+
+    return pd.DataFrame(
+        {
+            "student_id": "STU" + serials,
+            "name": _names(rng, num_students),
+            "gender": genders[rng.integers(0, len(genders), num_students)],
+            "dob": _dates(rng, num_students, "2004-01-01", "2019-12-31"),
+            **geography,
+            "phone": _phones(rng, num_students),
+            "email": _emails(rng, "student" + serials),
+            "father_name": _names(rng, num_students),
+            "mother_name": _names(rng, num_students),
+            "school_id": schools["school_id"].to_numpy()[school_index],
+            "grade_level": grades[rng.integers(0, len(grades), num_students)],
+        }
+    )
+
+
+def generate_enrollments(students: pd.DataFrame, academic_year: str = "2024", seed: int = 42) -> pd.DataFrame:
+    """One enrollment per student at their school for ``academic_year``"""
+    rng = np.random.default_rng(seed + 2)
+    n = len(students)
+    return pd.DataFrame(
+        {
+            "student_id": students["student_id"].to_numpy(),
+            "school_id": students["school_id"].to_numpy(),
+            "academic_year": academic_year,
+            "grade_level": students["grade_level"].to_numpy(),
+            "enrollment_date": _dates(rng, n, f"{academic_year}-01-01", f"{academic_year}-02-28"),
+        }
+    )
+
+
+def generate_assessments(students: pd.DataFrame, num_results: Optional[int] = None, seed: int = 42) -> pd.DataFrame:
+    """Assessment results for randomly chosen students, subjects and exams"""
+    rng = np.random.default_rng(seed + 3)
+    n = len(students) if num_results is None else num_results
+    subjects = np.array(SUBJECTS, dtype=object)
+    exams = np.array(EXAMS, dtype=object)
+    scores = np.clip(rng.normal(62, 15, n), 0, 100).round(1)
+    # Bangladeshi grading: 80+ is GPA 5.0 down to 33+ for 1.0
+    cutoffs = np.array([33, 40, 50, 60, 70, 80])
+    grade_points = np.array([0.0, 1.0, 2.0, 3.0, 3.5, 4.0, 5.0])
+    gpa = grade_points[np.searchsorted(cutoffs, scores, side="right")]
+
+    return pd.DataFrame(
+        {
+            "student_id": students["student_id"].to_numpy()[rng.integers(0, len(students), n)],
+            "subject": subjects[rng.integers(0, len(subjects), n)],
+            "exam": exams[rng.integers(0, len(exams), n)],
+            "score": scores,
+            "gpa": gpa,
+        }
+    )
+
+
+def generate_dataset(num_students: int, seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """Schools, students, enrollments and assessment results of one consistent synthetic dataset"""
+    schools = generate_schools(max(10, num_students // 500), seed)
+    students = generate_students(num_students, schools, seed)
+    return {
+        "schools": schools,
+        "students": students,
+        "enrollments": generate_enrollments(students, seed=seed),
+        "assessments": generate_assessments(students, seed=seed),
+    }
+
 
-def generate_synthetic_students(num_students=100):
+def generate_synthetic_students(num_students=100, seed=None):
     """Generate a DataFrame of synthetic student records."""
-    first_names = ["Ayesha", "Rahim", "Sumon", "Mitu", "Jamal", "Rina"]
-    last_names = ["Islam", "Hossain", "Khan", "Akter", "Mia", "Begum"]
-    divisions = ["Dhaka", "Chittagong", "Khulna", "Rajshahi", "Barisal", "Sylhet"]
-    data = []
-    for _ in range(num_students):
-        name = f"{random.choice(first_names)} {random.choice(last_names)}"  # nosec
-        student_id = f"S{random.randint(10000, 99999)}"  # nosec
-        division = random.choice(divisions)  # nosec
-        gpa = round(random.uniform(2.0, 5.0), 2)  # nosec
-        data.append({"student_id": student_id, "name": name, "division": division, "gpa": gpa})
-    return pd.DataFrame(data)
+    rng = np.random.default_rng(seed)
+    geography = _geography(rng, num_students)
+    return pd.DataFrame(
+        {
+            "student_id": "S" + pd.Series(rng.integers(10000, 100000, num_students)).astype(str),
+            "name": _names(rng, num_students, noisy=False),
+            "division": geography["division"],
+            "gpa": rng.uniform(2.0, 5.0, num_students).round(2),
+        }
+    )
 
 
 if __name__ == "__main__":